@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from secrets import token_hex
+
+import anyio
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+from starlette.types import Send
+
+from app.core.config import get_document_delivery_config
+from app.services.document_service import get_document_fingerprint
+
+try:
+  import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+  brotli = None
+
+_MIN_COMPRESS_BYTES = 512
+_BODY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class DocumentFileResponse(FileResponse):
+  """FileResponse whose multi-range bodies follow RFC 9110 `multipart/byteranges`.
+
+  Starlette advertises the boundary in `Content-Range` and separates parts with bare LFs,
+  which PDF.js and most HTTP clients reject; ranges are also coalesced after sorting so
+  overlapping requests in arbitrary order collapse into the fewest parts. Both hooks are
+  private Starlette API, so requirements.txt pins the exact starlette release they target.
+  """
+
+  @staticmethod
+  def _parse_range_header(http_range: str, file_size: int) -> list[tuple[int, int]]:
+    ranges = sorted(FileResponse._parse_range_header(http_range, file_size))
+    merged: list[tuple[int, int]] = []
+    for start, end in ranges:
+      if merged and start <= merged[-1][1]:
+        merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+      else:
+        merged.append((start, end))
+    return merged
+
+  async def _handle_multiple_ranges(
+    self,
+    send: Send,
+    ranges: list[tuple[int, int]],
+    file_size: int,
+    send_header_only: bool,
+  ) -> None:
+    boundary = token_hex(13)
+    part_content_type = self.headers["content-type"]
+    part_headers = [
+      (
+        f"--{boundary}\r\nContent-Type: {part_content_type}\r\n"
+        f"Content-Range: bytes {start}-{end - 1}/{file_size}\r\n\r\n"
+      ).encode("latin-1")
+      for start, end in ranges
+    ]
+    closing = f"--{boundary}--\r\n".encode("latin-1")
+    content_length = sum(len(header) + (end - start) + 2 for header, (start, end) in zip(part_headers, ranges))
+    content_length += len(closing)
+
+    if "content-range" in self.headers:
+      del self.headers["content-range"]
+    self.headers["content-type"] = f"multipart/byteranges; boundary={boundary}"
+    self.headers["content-length"] = str(content_length)
+    await send({"type": "http.response.start", "status": 206, "headers": self.raw_headers})
+    if send_header_only:
+      await send({"type": "http.response.body", "body": b"", "more_body": False})
+      return
+
+    async with await anyio.open_file(self.path, mode="rb") as file:
+      for header, (start, end) in zip(part_headers, ranges):
+        await send({"type": "http.response.body", "body": header, "more_body": True})
+        await file.seek(start)
+        while start < end:
+          chunk = await file.read(min(self.chunk_size, end - start))
+          if not chunk:
+            break
+          start += len(chunk)
+          await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"\r\n", "more_body": True})
+      await send({"type": "http.response.body", "body": closing, "more_body": False})
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+  if if_none_match.strip() == "*":
+    return True
+
+  # If-None-Match uses weak comparison, so a W/ prefix on either side still matches.
+  opaque_tag = etag.removeprefix("W/")
+  return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, mtime: float) -> bool:
+  try:
+    since = parsedate_to_datetime(if_modified_since)
+  except (TypeError, ValueError):
+    return False
+  if since is None:
+    return False
+
+  return int(mtime) <= int(since.timestamp())
+
+
+def _accepted_encodings(accept_encoding: str | None) -> set[str]:
+  accepted: set[str] = set()
+  for item in (accept_encoding or "").split(","):
+    coding, _, params = item.strip().partition(";")
+    try:
+      quality = float(params.strip().removeprefix("q=")) if params.strip() else 1.0
+    except ValueError:
+      quality = 1.0
+    if coding and quality > 0:
+      accepted.add(coding.strip().lower())
+  return accepted
+
+
+@dataclass(slots=True)
+class _CachedBody:
+  content: bytes
+  encoded: dict[str, bytes] = field(default_factory=dict)
+
+  @property
+  def size(self) -> int:
+    return len(self.content) + sum(len(data) for data in self.encoded.values())
+
+
+_BODY_CACHE: OrderedDict[str, _CachedBody] = OrderedDict()
+_BODY_CACHE_BYTES = 0
+_BODY_CACHE_LOCK = threading.Lock()
+
+
+def _store_body(etag: str, body: _CachedBody) -> None:
+  global _BODY_CACHE_BYTES
+  with _BODY_CACHE_LOCK:
+    previous = _BODY_CACHE.pop(etag, None)
+    if previous is not None:
+      _BODY_CACHE_BYTES -= previous.size
+    _BODY_CACHE[etag] = body
+    _BODY_CACHE_BYTES += body.size
+    while _BODY_CACHE_BYTES > _BODY_CACHE_MAX_BYTES and len(_BODY_CACHE) > 1:
+      _, evicted = _BODY_CACHE.popitem(last=False)
+      _BODY_CACHE_BYTES -= evicted.size
+
+
+def _encode(content: bytes, encoding: str) -> bytes:
+  if encoding == "br":
+    return brotli.compress(content, quality=5)
+  return gzip.compress(content, compresslevel=6)
+
+
+def _encoded_body(
+  etag: str,
+  content: bytes | Callable[[], bytes],
+  encoding: str | None,
+) -> tuple[bytes, str | None]:
+  """Body for `etag` and the coding applied, keeping identity and encoded bytes for later requests.
+
+  Bodies under the compression floor are returned as identity.
+  """
+  with _BODY_CACHE_LOCK:
+    body = _BODY_CACHE.get(etag)
+    if body is not None:
+      _BODY_CACHE.move_to_end(etag)
+  stored = body is not None
+  if body is None:
+    body = _CachedBody(content() if callable(content) else content)
+  if encoding is None or len(body.content) < _MIN_COMPRESS_BYTES:
+    encoding, data = None, body.content
+  elif (data := body.encoded.get(encoding)) is None:
+    data = _encode(body.content, encoding)
+    body, stored = _CachedBody(body.content, {**body.encoded, encoding: data}), False
+  if not stored:
+    _store_body(etag, body)
+  return data, encoding
+
+
+def cached_content_response(
+  request: Request,
+  content: bytes | Callable[[], bytes],
+  *,
+  media_type: str,
+  etag: str,
+  compress: bool = False,
+) -> Response:
+  """Serve derived bytes (page renders, text layers) behind an ETag, answering 304 on a match.
+
+  `content` may be a callable, which is only run when the client's copy is stale. With
+  `compress`, the body is encoded with brotli (when installed) or gzip per `Accept-Encoding`,
+  and the ETag carries the coding so each representation validates separately; the identity
+  and encoded bytes are kept in a small in-memory LRU keyed by the ETag.
+  """
+  headers = {
+    "etag": etag,
+    "cache-control": get_document_delivery_config().cache_control,
+  }
+  encoding = None
+  if compress:
+    headers["vary"] = "Accept-Encoding"
+    accepted = _accepted_encodings(request.headers.get("accept-encoding"))
+    if brotli is not None and "br" in accepted:
+      encoding = "br"
+    elif "gzip" in accepted:
+      encoding = "gzip"
+
+  # Bodies under the compression floor are served as identity, so either tag can be current.
+  if_none_match = request.headers.get("if-none-match")
+  if if_none_match is not None:
+    if encoding is not None and _etag_matches(if_none_match, f'{etag[:-1]}-{encoding}"'):
+      return Response(
+        status_code=304,
+        headers={**headers, "etag": f'{etag[:-1]}-{encoding}"', "content-encoding": encoding},
+      )
+    if _etag_matches(if_none_match, etag):
+      return Response(status_code=304, headers=headers)
+
+  if compress:
+    body, encoding = _encoded_body(etag, content, encoding)
+    if encoding is not None:
+      headers["content-encoding"] = encoding
+      headers["etag"] = f'{etag[:-1]}-{encoding}"'
+    return Response(content=body, media_type=media_type, headers=headers)
+
+  return Response(content=content() if callable(content) else content, media_type=media_type, headers=headers)
+
+
+def document_file_response(
+  request: Request,
+  file_path: Path,
+  *,
+  filename: str | None = None,
+  media_type: str = "application/pdf",
+) -> Response:
+  """Serve a reference file with a strong validator, conditional GET and byte-range support."""
+  delivery_config = get_document_delivery_config()
+  stat_result = os.stat(file_path)
+
+  if delivery_config.etag_mode == "hash":
+    etag = f'"{get_document_fingerprint(file_path).sha256}"'
+  else:
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+  last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+  validator_headers = {
+    "etag": etag,
+    "last-modified": last_modified,
+    "cache-control": delivery_config.cache_control,
+  }
+
+  if_none_match = request.headers.get("if-none-match")
+  if_modified_since = request.headers.get("if-modified-since")
+  if if_none_match is not None:
+    not_modified = _etag_matches(if_none_match, etag)
+  else:
+    not_modified = if_modified_since is not None and _not_modified_since(if_modified_since, stat_result.st_mtime)
+
+  if not_modified:
+    return Response(status_code=304, headers=validator_headers)
+
+  return DocumentFileResponse(
+    path=file_path,
+    filename=filename or file_path.name,
+    media_type=media_type,
+    headers=validator_headers,
+    stat_result=stat_result,
+  )
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import anyio.to_thread
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import MetricFamily
+from app.services.metrics_service import render_metrics
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", summary="Prometheus metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+  # The request thread pool limiter can only be inspected from the event loop.
+  statistics = anyio.to_thread.current_default_thread_limiter().statistics()
+  threadpool = [
+    MetricFamily("request_threadpool_busy", "Sync request handlers currently running.", "gauge").add(
+      statistics.borrowed_tokens
+    ),
+    MetricFamily("request_threadpool_size", "Sync request handler thread limit.", "gauge").add(
+      statistics.total_tokens
+    ),
+    MetricFamily("request_threadpool_queue_depth", "Sync request handlers waiting for a thread.", "gauge").add(
+      statistics.tasks_waiting
+    ),
+  ]
+  return PlainTextResponse(render_metrics(threadpool), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+from fastapi import APIRouter, Request
+
+from app.api.response import ok_response
+from app.schemas.admin import LocatorIndexCacheData, LocatorIndexInvalidateData, LocatorIndexInvalidateRequest
+from app.services.document_service import invalidate_locator_indexes
+from app.services.pdf_locator_service import get_index_cache_stats
+from app.services.project_service import get_config_cache_metrics, reload_workspace_config
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+@router.post("/config/reload", summary="重新載入 project registry 與配置")
+def reload_config(request: Request) -> dict[str, object]:
+  result = reload_workspace_config()
+  return ok_response(request, result.model_dump(), message="config reloaded")
+
+
+@router.get("/config/metrics", summary="取得配置快取統計")
+def get_config_metrics(request: Request) -> dict[str, object]:
+  return ok_response(request, get_config_cache_metrics().model_dump())
+
+
+@router.get("/locator-index", summary="取得定位索引快取統計")
+def get_locator_index_cache(request: Request) -> dict[str, object]:
+  return ok_response(request, LocatorIndexCacheData(**asdict(get_index_cache_stats())).model_dump())
+
+
+@router.post("/locator-index/invalidate", summary="清除定位索引快取")
+def invalidate_locator_index(request: Request, payload: LocatorIndexInvalidateRequest) -> dict[str, object]:
+  invalidated = invalidate_locator_indexes(payload.project_id, payload.document_id)
+  data = LocatorIndexInvalidateData(
+    invalidated=invalidated,
+    cache=LocatorIndexCacheData(**asdict(get_index_cache_stats())),
+  )
+  return ok_response(request, data.model_dump(), message="locator index invalidated")
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
 from app.api.response import ok_response
-from app.schemas.evidence import EvidenceResolveRequest
+from app.core.config import get_stage_timing_enabled
+from app.core.timing import collect_stage_timings
+from app.schemas.evidence import EvidenceResolveDebug, EvidenceResolveRequest
 from app.services.evidence_service import resolve_evidence
 
 router = APIRouter(prefix="/evidence", tags=["evidence"])
 
 
 @router.post("/resolve", summary="Evidence 定位")
-def resolve(request: Request, payload: EvidenceResolveRequest) -> dict[str, object]:
-  result = resolve_evidence(payload)
+def resolve(request: Request, response: Response, payload: EvidenceResolveRequest) -> dict[str, object]:
+  with collect_stage_timings("evidence_resolve", enabled=payload.debug or get_stage_timing_enabled()) as timings:
+    result = resolve_evidence(payload)
+
+  if timings is not None:
+    response.headers["Server-Timing"] = timings.server_timing()
+    if payload.debug:
+      result.debug = EvidenceResolveDebug(stages_ms=timings.rounded(), total_ms=round(timings.total_ms, 3))
   return ok_response(request, result.model_dump())
@@ -1,36 +1,21 @@
 from __future__ import annotations
 
+import time
 from io import BytesIO
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
 from app.schemas.exports import ExportRequest
-from app.schemas.reports import ManualReviewHistoryEntry
-from app.services.export_service import build_export_file
-from app.services.report_service import get_all_cards, get_manual_review_history
+from app.services.export_service import STREAMING_EXPORT_FORMATS, build_export_file, measure_export, stream_export_file
+from app.services.report_service import get_all_cards, get_manual_review_histories, get_report_project_id
 
 router = APIRouter(prefix="/exports", tags=["exports"])
-_EXPORT_HISTORY_PAGE_SIZE = 200
-
-
-def _collect_manual_review_history(report_id: str, item_ids: list[str]) -> dict[str, list[ManualReviewHistoryEntry]]:
-  history_by_item: dict[str, list[ManualReviewHistoryEntry]] = {}
-  for item_id in item_ids:
-    entries: list[ManualReviewHistoryEntry] = []
-    page = 1
-    while True:
-      page_data = get_manual_review_history(report_id, item_id, page=page, page_size=_EXPORT_HISTORY_PAGE_SIZE)
-      entries.extend(page_data.entries)
-      if len(entries) >= page_data.total:
-        break
-      page += 1
-    history_by_item[item_id] = entries
-  return history_by_item
 
 
 @router.post("/report", summary="生成輸出報告")
 def export_report(payload: ExportRequest) -> StreamingResponse:
+  started = time.perf_counter()
   cards = get_all_cards(payload.report_id)
   existing_item_ids = {card.item_id for card in cards}
   selected_item_ids: list[str] = []
@@ -41,11 +26,24 @@ def export_report(payload: ExportRequest) -> StreamingResponse:
     seen.add(card_id)
     selected_item_ids.append(card_id)
 
-  manual_review_history = _collect_manual_review_history(payload.report_id, selected_item_ids)
-  file_name, media_type, content = build_export_file(payload, cards, manual_review_history)
+  manual_review_history = get_manual_review_histories(payload.report_id, selected_item_ids)
+  if payload.format in STREAMING_EXPORT_FORMATS:
+    file_name, media_type, chunks = stream_export_file(payload, cards, manual_review_history)
+  else:
+    file_name, media_type, content = build_export_file(
+      payload,
+      cards,
+      manual_review_history,
+      project_id=get_report_project_id(payload.report_id),
+    )
+    chunks = BytesIO(content)
 
   headers = {
     "Content-Disposition": f'attachment; filename="{file_name}"',
   }
 
-  return StreamingResponse(BytesIO(content), media_type=media_type, headers=headers)
+  return StreamingResponse(
+    measure_export(payload.format, chunks, started=started),
+    media_type=media_type,
+    headers=headers,
+  )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response, status
 
 from app.api.response import ok_response
 from app.core.config import SERVICE_NAME, SERVICE_VERSION
+from app.services.warmup_service import get_warmup_status
 
 router = APIRouter(tags=["health"])
 
@@ -18,3 +19,11 @@ def health(request: Request) -> dict[str, object]:
     },
     message="healthy",
   )
+
+
+@router.get("/ready", summary="Readiness Check")
+def ready(request: Request, response: Response) -> dict[str, object]:
+  warmup = get_warmup_status()
+  if not warmup.ready:
+    response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+  return ok_response(request, warmup.model_dump(), message="ready" if warmup.ready else "warming up")
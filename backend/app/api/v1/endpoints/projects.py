@@ -1,22 +1,104 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query, Request, Response
 
+from app.api.file_response import cached_content_response, document_file_response
 from app.api.response import ok_response
+from app.services.document_derivative_service import get_optimized_document_path
 from app.services.document_service import resolve_project_document_path
-from app.services.project_service import get_workspace_config
+from app.services.page_render_service import get_page_image, get_page_tile, page_image_cache_key, page_tile_cache_key
+from app.services.page_text_service import get_page_text_layer, page_text_cache_key
+from app.services.project_service import (
+  get_workspace_config,
+  get_workspace_project,
+  get_workspace_summary,
+  refresh_project_documents,
+)
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
+@router.get("", summary="取得 workspace project 清單")
+def list_projects(request: Request) -> dict[str, object]:
+  summary = get_workspace_summary()
+  return ok_response(request, summary.model_dump())
+
+
 @router.get("/config", summary="取得 workspace project 配置")
 def get_projects_config(request: Request) -> dict[str, object]:
   config = get_workspace_config()
   return ok_response(request, config.model_dump())
 
 
+@router.get("/{project_id}/config", summary="取得單一 project 配置")
+def get_project_config(request: Request, project_id: str) -> dict[str, object]:
+  project = get_workspace_project(project_id)
+  return ok_response(request, project.model_dump())
+
+
+@router.post("/{project_id}/documents/refresh", summary="重新掃描 project PDF 文件")
+def refresh_documents(
+  request: Request,
+  project_id: str,
+  force: bool = Query(default=False),
+) -> dict[str, object]:
+  result = refresh_project_documents(project_id, force=force)
+  return ok_response(request, result.model_dump(), message="documents refreshed")
+
+
 @router.get("/{project_id}/documents/{document_id}/file", summary="取得 project PDF 文件")
-def get_project_document(project_id: str, document_id: str) -> FileResponse:
+def get_project_document(request: Request, project_id: str, document_id: str) -> Response:
+  file_path = resolve_project_document_path(project_id, document_id)
+  served_path = get_optimized_document_path(file_path) or file_path
+  return document_file_response(request, served_path, filename=file_path.name)
+
+
+@router.get("/{project_id}/documents/{document_id}/pages/{page}.png", summary="取得 project PDF 頁面圖像")
+def get_project_document_page_image(
+  request: Request,
+  project_id: str,
+  document_id: str,
+  page: int,
+  scale: float | None = Query(default=None, gt=0),
+) -> Response:
+  file_path = resolve_project_document_path(project_id, document_id)
+  return cached_content_response(
+    request,
+    lambda: get_page_image(file_path, page, scale=scale).png,
+    media_type="image/png",
+    etag=f'"{page_image_cache_key(file_path, page, scale=scale)}"',
+  )
+
+
+@router.get(
+  "/{project_id}/documents/{document_id}/pages/{page}/tiles/{tile_x}/{tile_y}.png",
+  summary="取得 project PDF 頁面圖塊",
+)
+def get_project_document_page_tile(
+  request: Request,
+  project_id: str,
+  document_id: str,
+  page: int,
+  tile_x: int,
+  tile_y: int,
+  scale: float | None = Query(default=None, gt=0),
+) -> Response:
+  file_path = resolve_project_document_path(project_id, document_id)
+  return cached_content_response(
+    request,
+    lambda: get_page_tile(file_path, page, tile_x, tile_y, scale=scale).png,
+    media_type="image/png",
+    etag=f'"{page_tile_cache_key(file_path, page, tile_x, tile_y, scale=scale)}"',
+  )
+
+
+@router.get("/{project_id}/documents/{document_id}/pages/{page}/text", summary="取得 project PDF 頁面文字與座標")
+def get_project_document_page_text(request: Request, project_id: str, document_id: str, page: int) -> Response:
   file_path = resolve_project_document_path(project_id, document_id)
-  return FileResponse(path=file_path, filename=file_path.name, media_type="application/pdf")
+  return cached_content_response(
+    request,
+    lambda: get_page_text_layer(file_path, page).payload,
+    media_type="application/json",
+    etag=f'"{page_text_cache_key(file_path, page)}"',
+    compress=True,
+  )
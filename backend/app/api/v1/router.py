@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import evidence, exports, health, projects, reports, templates
+from app.api.v1.endpoints import admin, evidence, exports, health, projects, reports, templates
 
 router = APIRouter()
 router.include_router(health.router)
@@ -11,3 +11,4 @@ router.include_router(reports.router)
 router.include_router(evidence.router)
 router.include_router(exports.router)
 router.include_router(projects.router)
+router.include_router(admin.router)
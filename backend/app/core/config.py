@@ -12,6 +12,8 @@ REFERENCE_DIR = PROJECT_ROOT / "reference"
 NEC_TEMPLATE_PATH = BACKEND_ROOT / "data" / "templates" / "nec-template.json"
 SEED_REPORT_PATH = BACKEND_ROOT / "data" / "reports" / "seed-report-cards.json"
 PROJECT_REGISTRY_PATH = BACKEND_ROOT / "data" / "projects" / "registry.json"
+CACHE_DIR = BACKEND_ROOT / ".cache"
+DOCUMENT_CATALOG_DIR = Path(os.getenv("DOCUMENT_CATALOG_DIR", "").strip() or CACHE_DIR / "document-catalog")
 
 SERVICE_NAME = "epd-tender-api"
 SERVICE_VERSION = "1.0.0"
@@ -43,11 +45,99 @@ class EvidenceResolveConfig:
   quote_max_length: int = 380
   page_min: int = 1
   page_max: int = 200
+  staged_early_exit: bool = True
 
 
 _DEFAULT_EVIDENCE_CONFIG = EvidenceResolveConfig()
 
 
+@dataclass(frozen=True, slots=True)
+class ExportConfig:
+  pdf_parallel_min_cards: int = 200
+  pdf_chunk_size: int = 100
+  pdf_workers: int = 4
+  docx_writer: Literal["template", "python-docx"] = "template"
+  snippet_dpi: int = 110
+  snippet_padding: float = 12.0
+  snippet_max_per_card: int = 3
+  snippet_cache_max_bytes: int = 128 * 1024 * 1024
+
+
+_DEFAULT_EXPORT_CONFIG = ExportConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentDeliveryConfig:
+  etag_mode: Literal["hash", "mtime"] = "hash"
+  cache_control: str = "private, max-age=300, must-revalidate"
+  derivatives_enabled: bool = False
+  derivative_dir: Path = CACHE_DIR / "pdf-derivatives"
+  derivative_min_bytes: int = 1024 * 1024
+  derivative_workers: int = 1
+
+
+_DEFAULT_DOCUMENT_DELIVERY_CONFIG = DocumentDeliveryConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class PageRenderConfig:
+  cache_dir: Path = CACHE_DIR / "page-images"
+  cache_max_bytes: int = 256 * 1024 * 1024
+  default_scale: float = 1.0
+  max_scale: float = 4.0
+  tile_size: int = 512
+  prewarm_radius: int = 1
+  prewarm_workers: int = 2
+
+
+_DEFAULT_PAGE_RENDER_CONFIG = PageRenderConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class WarmupConfig:
+  enabled: bool = False
+  workers: int = 4
+  projects: tuple[str, ...] = ()
+  all_projects: bool = False
+  locator_indexes: bool = True
+  max_documents: int = 0
+
+
+_DEFAULT_WARMUP_CONFIG = WarmupConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class LocatorIndexCacheConfig:
+  max_bytes: int = 512 * 1024 * 1024
+  spill_enabled: bool = True
+  spill_dir: Path = CACHE_DIR / "locator-index"
+  spill_max_bytes: int = 2 * 1024 * 1024 * 1024
+
+
+_DEFAULT_LOCATOR_INDEX_CACHE_CONFIG = LocatorIndexCacheConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class LocatorIndexBuildConfig:
+  workers: int = 4
+  parallel_min_pages: int = 200
+
+
+_DEFAULT_LOCATOR_INDEX_BUILD_CONFIG = LocatorIndexBuildConfig()
+
+
+@dataclass(frozen=True, slots=True)
+class SlowRequestConfig:
+  threshold_ms: float = 1000.0
+  profile_rate: float = 0.0
+  profile_interval_ms: float = 5.0
+  profile_dir: Path = CACHE_DIR / "profiles"
+  profile_max_files: int = 50
+
+
+_DEFAULT_SLOW_REQUEST_CONFIG = SlowRequestConfig()
+
+
 def _env_float(name: str, default: float) -> float:
   raw = os.getenv(name)
   if raw is None:
@@ -59,6 +149,14 @@ def _env_float(name: str, default: float) -> float:
     return default
 
 
+def _env_bool(name: str, default: bool) -> bool:
+  raw = os.getenv(name)
+  if raw is None:
+    return default
+
+  return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _env_int(name: str, default: int) -> int:
   raw = os.getenv(name)
   if raw is None:
@@ -151,4 +249,179 @@ def get_evidence_resolve_config() -> EvidenceResolveConfig:
     quote_max_length=quote_max_length,
     page_min=page_min,
     page_max=page_max,
+    staged_early_exit=_env_bool("EVIDENCE_STAGED_EARLY_EXIT", _DEFAULT_EVIDENCE_CONFIG.staged_early_exit),
+  )
+
+
+@lru_cache(maxsize=1)
+def get_export_config() -> ExportConfig:
+  pdf_parallel_min_cards = max(
+    1,
+    _env_int("EXPORT_PDF_PARALLEL_MIN_CARDS", _DEFAULT_EXPORT_CONFIG.pdf_parallel_min_cards),
+  )
+  pdf_chunk_size = max(1, _env_int("EXPORT_PDF_CHUNK_SIZE", _DEFAULT_EXPORT_CONFIG.pdf_chunk_size))
+  pdf_workers = max(
+    0,
+    min(os.cpu_count() or 1, _env_int("EXPORT_PDF_WORKERS", _DEFAULT_EXPORT_CONFIG.pdf_workers)),
+  )
+
+  docx_writer_raw = os.getenv("EXPORT_DOCX_WRITER", _DEFAULT_EXPORT_CONFIG.docx_writer).strip().lower()
+  docx_writer: Literal["template", "python-docx"] = (
+    "python-docx" if docx_writer_raw == "python-docx" else _DEFAULT_EXPORT_CONFIG.docx_writer
+  )
+
+  snippet_dpi = max(36, min(300, _env_int("EXPORT_SNIPPET_DPI", _DEFAULT_EXPORT_CONFIG.snippet_dpi)))
+  snippet_padding = max(0.0, _env_float("EXPORT_SNIPPET_PADDING", _DEFAULT_EXPORT_CONFIG.snippet_padding))
+  snippet_max_per_card = max(1, _env_int("EXPORT_SNIPPET_MAX_PER_CARD", _DEFAULT_EXPORT_CONFIG.snippet_max_per_card))
+  snippet_cache_max_bytes = max(
+    1024 * 1024,
+    _env_int("EXPORT_SNIPPET_CACHE_MAX_BYTES", _DEFAULT_EXPORT_CONFIG.snippet_cache_max_bytes),
+  )
+
+  return ExportConfig(
+    pdf_parallel_min_cards=pdf_parallel_min_cards,
+    pdf_chunk_size=pdf_chunk_size,
+    pdf_workers=pdf_workers,
+    docx_writer=docx_writer,
+    snippet_dpi=snippet_dpi,
+    snippet_padding=snippet_padding,
+    snippet_max_per_card=snippet_max_per_card,
+    snippet_cache_max_bytes=snippet_cache_max_bytes,
+  )
+
+
+@lru_cache(maxsize=1)
+def get_document_delivery_config() -> DocumentDeliveryConfig:
+  etag_mode_raw = os.getenv("DOCUMENT_ETAG_MODE", _DEFAULT_DOCUMENT_DELIVERY_CONFIG.etag_mode).strip().lower()
+  etag_mode: Literal["hash", "mtime"] = "mtime" if etag_mode_raw == "mtime" else "hash"
+  cache_control = (
+    os.getenv("DOCUMENT_CACHE_CONTROL", "").strip() or _DEFAULT_DOCUMENT_DELIVERY_CONFIG.cache_control
+  )
+
+  derivatives_enabled = _env_bool("DOCUMENT_DERIVATIVES_ENABLED", _DEFAULT_DOCUMENT_DELIVERY_CONFIG.derivatives_enabled)
+  derivative_dir_raw = os.getenv("DOCUMENT_DERIVATIVE_DIR", "").strip()
+  derivative_dir = Path(derivative_dir_raw) if derivative_dir_raw else _DEFAULT_DOCUMENT_DELIVERY_CONFIG.derivative_dir
+  derivative_min_bytes = max(
+    0,
+    _env_int("DOCUMENT_DERIVATIVE_MIN_BYTES", _DEFAULT_DOCUMENT_DELIVERY_CONFIG.derivative_min_bytes),
+  )
+  derivative_workers = max(
+    1,
+    min(os.cpu_count() or 1, _env_int("DOCUMENT_DERIVATIVE_WORKERS", _DEFAULT_DOCUMENT_DELIVERY_CONFIG.derivative_workers)),
+  )
+
+  return DocumentDeliveryConfig(
+    etag_mode=etag_mode,
+    cache_control=cache_control,
+    derivatives_enabled=derivatives_enabled,
+    derivative_dir=derivative_dir,
+    derivative_min_bytes=derivative_min_bytes,
+    derivative_workers=derivative_workers,
+  )
+
+
+@lru_cache(maxsize=1)
+def get_page_render_config() -> PageRenderConfig:
+  cache_dir_raw = os.getenv("PAGE_RENDER_CACHE_DIR", "").strip()
+  cache_dir = Path(cache_dir_raw) if cache_dir_raw else _DEFAULT_PAGE_RENDER_CONFIG.cache_dir
+  cache_max_bytes = max(
+    1024 * 1024,
+    _env_int("PAGE_RENDER_CACHE_MAX_BYTES", _DEFAULT_PAGE_RENDER_CONFIG.cache_max_bytes),
+  )
+  max_scale = max(0.25, min(8.0, _env_float("PAGE_RENDER_MAX_SCALE", _DEFAULT_PAGE_RENDER_CONFIG.max_scale)))
+  default_scale = max(
+    0.1,
+    min(max_scale, _env_float("PAGE_RENDER_DEFAULT_SCALE", _DEFAULT_PAGE_RENDER_CONFIG.default_scale)),
+  )
+  tile_size = max(128, min(2048, _env_int("PAGE_RENDER_TILE_SIZE", _DEFAULT_PAGE_RENDER_CONFIG.tile_size)))
+  prewarm_radius = max(0, _env_int("PAGE_RENDER_PREWARM_RADIUS", _DEFAULT_PAGE_RENDER_CONFIG.prewarm_radius))
+  prewarm_workers = max(
+    0,
+    min(os.cpu_count() or 1, _env_int("PAGE_RENDER_PREWARM_WORKERS", _DEFAULT_PAGE_RENDER_CONFIG.prewarm_workers)),
+  )
+
+  return PageRenderConfig(
+    cache_dir=cache_dir,
+    cache_max_bytes=cache_max_bytes,
+    default_scale=default_scale,
+    max_scale=max_scale,
+    tile_size=tile_size,
+    prewarm_radius=prewarm_radius,
+    prewarm_workers=prewarm_workers,
+  )
+
+
+@lru_cache(maxsize=1)
+def get_locator_index_cache_config() -> LocatorIndexCacheConfig:
+  spill_dir_raw = os.getenv("LOCATOR_INDEX_SPILL_DIR", "").strip()
+  return LocatorIndexCacheConfig(
+    max_bytes=max(
+      1024 * 1024,
+      _env_int("LOCATOR_INDEX_CACHE_MAX_BYTES", _DEFAULT_LOCATOR_INDEX_CACHE_CONFIG.max_bytes),
+    ),
+    spill_enabled=_env_bool("LOCATOR_INDEX_SPILL_ENABLED", _DEFAULT_LOCATOR_INDEX_CACHE_CONFIG.spill_enabled),
+    spill_dir=Path(spill_dir_raw) if spill_dir_raw else _DEFAULT_LOCATOR_INDEX_CACHE_CONFIG.spill_dir,
+    spill_max_bytes=max(
+      1024 * 1024,
+      _env_int("LOCATOR_INDEX_SPILL_MAX_BYTES", _DEFAULT_LOCATOR_INDEX_CACHE_CONFIG.spill_max_bytes),
+    ),
+  )
+
+
+@lru_cache(maxsize=1)
+def get_locator_index_build_config() -> LocatorIndexBuildConfig:
+  return LocatorIndexBuildConfig(
+    workers=max(
+      0,
+      min(os.cpu_count() or 1, _env_int("LOCATOR_INDEX_BUILD_WORKERS", _DEFAULT_LOCATOR_INDEX_BUILD_CONFIG.workers)),
+    ),
+    parallel_min_pages=max(
+      1,
+      _env_int("LOCATOR_INDEX_PARALLEL_MIN_PAGES", _DEFAULT_LOCATOR_INDEX_BUILD_CONFIG.parallel_min_pages),
+    ),
+  )
+
+
+@lru_cache(maxsize=1)
+def get_config_reload_interval() -> float:
+  """Seconds a registry, template or report source stamp is trusted before it is re-checked."""
+  return max(0.0, _env_float("CONFIG_RELOAD_INTERVAL_SECONDS", 2.0))
+
+
+@lru_cache(maxsize=1)
+def get_stage_timing_enabled() -> bool:
+  """Whether request handlers record per-stage timings (Server-Timing and histograms) by default."""
+  return _env_bool("STAGE_TIMING_ENABLED", True)
+
+
+@lru_cache(maxsize=1)
+def get_warmup_config() -> WarmupConfig:
+  projects_raw = os.getenv("WARMUP_PROJECTS", "default").strip()
+  all_projects = projects_raw.lower() == "all"
+  projects = () if all_projects or projects_raw.lower() in {"", "default"} else tuple(
+    entry.strip() for entry in projects_raw.split(",") if entry.strip()
+  )
+
+  return WarmupConfig(
+    enabled=_env_bool("WARMUP_ENABLED", _DEFAULT_WARMUP_CONFIG.enabled),
+    workers=max(1, min(32, _env_int("WARMUP_WORKERS", _DEFAULT_WARMUP_CONFIG.workers))),
+    projects=projects,
+    all_projects=all_projects,
+    locator_indexes=_env_bool("WARMUP_LOCATOR_INDEXES", _DEFAULT_WARMUP_CONFIG.locator_indexes),
+    max_documents=max(0, _env_int("WARMUP_MAX_DOCUMENTS", _DEFAULT_WARMUP_CONFIG.max_documents)),
+  )
+
+
+@lru_cache(maxsize=1)
+def get_slow_request_config() -> SlowRequestConfig:
+  profile_dir_raw = os.getenv("SLOW_REQUEST_PROFILE_DIR", "").strip()
+  return SlowRequestConfig(
+    threshold_ms=max(0.0, _env_float("SLOW_REQUEST_THRESHOLD_MS", _DEFAULT_SLOW_REQUEST_CONFIG.threshold_ms)),
+    profile_rate=max(0.0, min(1.0, _env_float("SLOW_REQUEST_PROFILE_RATE", _DEFAULT_SLOW_REQUEST_CONFIG.profile_rate))),
+    profile_interval_ms=max(
+      1.0,
+      _env_float("SLOW_REQUEST_PROFILE_INTERVAL_MS", _DEFAULT_SLOW_REQUEST_CONFIG.profile_interval_ms),
+    ),
+    profile_dir=Path(profile_dir_raw) if profile_dir_raw else _DEFAULT_SLOW_REQUEST_CONFIG.profile_dir,
+    profile_max_files=max(1, _env_int("SLOW_REQUEST_PROFILE_MAX_FILES", _DEFAULT_SLOW_REQUEST_CONFIG.profile_max_files)),
   )
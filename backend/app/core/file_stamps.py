@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class FileStamp:
+  path: str
+  mtime_ns: int
+  size: int
+
+
+def read_file_stamp(path: Path) -> FileStamp | None:
+  try:
+    stat_result = path.stat()
+  except OSError:
+    return None
+  return FileStamp(path=str(path), mtime_ns=stat_result.st_mtime_ns, size=stat_result.st_size)
+
+
+def stamps_changed(stamps: tuple[FileStamp | None, ...], paths: tuple[Path, ...]) -> bool:
+  return stamps != tuple(read_file_stamp(path) for path in paths)
+
+
+@dataclass(slots=True)
+class _StampedValue(Generic[T]):
+  value: T
+  stamp: FileStamp | None
+  checked_at: float
+
+
+class StampedFileCache(Generic[T]):
+  """Parsed file contents that are reloaded when the file's mtime or size changes.
+
+  Stamps are re-read at most once per `check_interval` seconds per path, so hot request paths
+  pay a dictionary lookup rather than a `stat` call.
+  """
+
+  def __init__(self, loader: Callable[[Path], T], *, check_interval: Callable[[], float]) -> None:
+    self._loader = loader
+    self._check_interval = check_interval
+    self._values: dict[Path, _StampedValue[T]] = {}
+    self._lock = threading.Lock()
+    self.loads = 0
+    self.reloads = 0
+    self.hits = 0
+
+  def get(self, path: Path) -> T:
+    now = time.monotonic()
+    with self._lock:
+      cached = self._values.get(path)
+      if cached is not None and now - cached.checked_at < self._check_interval():
+        self.hits += 1
+        return cached.value
+
+    stamp = read_file_stamp(path)
+    with self._lock:
+      cached = self._values.get(path)
+      if cached is not None and cached.stamp == stamp:
+        cached.checked_at = now
+        self.hits += 1
+        return cached.value
+
+    value = self._loader(path)
+    with self._lock:
+      if path in self._values:
+        self.reloads += 1
+      else:
+        self.loads += 1
+      self._values[path] = _StampedValue(value=value, stamp=stamp, checked_at=now)
+    return value
+
+  def expire(self) -> None:
+    """Force the next `get` of every path to re-read its stamp."""
+    with self._lock:
+      for cached in self._values.values():
+        cached.checked_at = float("-inf")
+
+  def __len__(self) -> int:
+    return len(self._values)
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Literal
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_SIZE_BUCKETS = (1024.0, 16384.0, 131072.0, 1048576.0, 8388608.0, 67108864.0)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class HistogramSeries:
+  labels: Labels
+  bucket_counts: tuple[int, ...]
+  count: int
+  total: float
+
+
+@dataclass(slots=True)
+class MetricFamily:
+  """Point-in-time samples of one counter or gauge, produced by a scrape-time collector."""
+
+  name: str
+  description: str
+  kind: Literal["counter", "gauge"]
+  samples: list[tuple[Labels, float]] = field(default_factory=list)
+
+  def add(self, value: float, **labels: str) -> MetricFamily:
+    self.samples.append((tuple((name, str(label)) for name, label in labels.items()), float(value)))
+    return self
+
+
+class _LabelledValues:
+  kind: Literal["counter", "gauge"]
+
+  def __init__(self, name: str, description: str, *, label_names: tuple[str, ...] = ()) -> None:
+    self.name = name
+    self.description = description
+    self.label_names = label_names
+    self._values: dict[tuple[str, ...], float] = {}
+    self._lock = threading.Lock()
+
+  def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+    return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+  def _add(self, amount: float, labels: dict[str, str]) -> None:
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = self._values.get(key, 0.0) + amount
+
+  def value(self, **labels: str) -> float:
+    with self._lock:
+      return self._values.get(self._key(labels), 0.0)
+
+  def collect(self) -> MetricFamily:
+    with self._lock:
+      values = sorted(self._values.items())
+    if not values and not self.label_names:
+      values = [((), 0.0)]
+    return MetricFamily(
+      name=self.name,
+      description=self.description,
+      kind=self.kind,
+      samples=[(tuple(zip(self.label_names, key)), value) for key, value in values],
+    )
+
+
+class Counter(_LabelledValues):
+  kind = "counter"
+
+  def inc(self, amount: float = 1.0, **labels: str) -> None:
+    self._add(amount, labels)
+
+
+class Gauge(_LabelledValues):
+  kind = "gauge"
+
+  def inc(self, amount: float = 1.0, **labels: str) -> None:
+    self._add(amount, labels)
+
+  def dec(self, amount: float = 1.0, **labels: str) -> None:
+    self._add(-amount, labels)
+
+  def set(self, value: float, **labels: str) -> None:
+    key = self._key(labels)
+    with self._lock:
+      self._values[key] = value
+
+
+class Histogram:
+  """Fixed-bucket histogram with one series per label combination.
+
+  Bucket counts are stored per bucket and made cumulative only in `collect`, so `observe` is a
+  bisect and two additions under a lock.
+  """
+
+  kind = "histogram"
+
+  def __init__(
+    self,
+    name: str,
+    description: str,
+    *,
+    label_names: tuple[str, ...] = (),
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+  ) -> None:
+    self.name = name
+    self.description = description
+    self.label_names = label_names
+    self.buckets = tuple(sorted(buckets))
+    self._series: dict[tuple[str, ...], list[float]] = {}
+    self._lock = threading.Lock()
+
+  def observe(self, value: float, **labels: str) -> None:
+    key = tuple(str(labels.get(name, "")) for name in self.label_names)
+    slot = bisect.bisect_left(self.buckets, value)
+    with self._lock:
+      series = self._series.get(key)
+      if series is None:
+        # Per-bucket counts, the +Inf overflow count, then the running sum.
+        series = [0] * (len(self.buckets) + 1) + [0.0]
+        self._series[key] = series
+      series[slot] += 1
+      series[-1] += value
+
+  def collect(self) -> list[HistogramSeries]:
+    with self._lock:
+      snapshot = {key: list(series) for key, series in self._series.items()}
+
+    collected: list[HistogramSeries] = []
+    for key, series in sorted(snapshot.items()):
+      cumulative: list[int] = []
+      running = 0
+      for count in series[:-1]:
+        running += int(count)
+        cumulative.append(running)
+      collected.append(
+        HistogramSeries(
+          labels=tuple(zip(self.label_names, key)),
+          bucket_counts=tuple(cumulative[:-1]),
+          count=running,
+          total=float(series[-1]),
+        )
+      )
+    return collected
+
+  def reset(self) -> None:
+    with self._lock:
+      self._series.clear()
+
+
+Metric = Counter | Gauge | Histogram
+
+_METRICS: dict[str, Metric] = {}
+_COLLECTORS: list[Callable[[], list[MetricFamily]]] = []
+_EXECUTORS: dict[str, Executor] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _register(name: str, kind: str, factory: Callable[[], Metric]) -> Metric:
+  with _REGISTRY_LOCK:
+    existing = _METRICS.get(name)
+    if existing is None:
+      existing = factory()
+      _METRICS[name] = existing
+    elif existing.kind != kind:
+      raise ValueError(f"Metric {name} is already registered as a {existing.kind}, not a {kind}")
+    return existing
+
+
+def counter(name: str, description: str, *, label_names: tuple[str, ...] = ()) -> Counter:
+  """Register (or return the already registered) counter called `name`."""
+  return _register(name, "counter", lambda: Counter(name, description, label_names=label_names))  # type: ignore[return-value]
+
+
+def gauge(name: str, description: str, *, label_names: tuple[str, ...] = ()) -> Gauge:
+  """Register (or return the already registered) gauge called `name`."""
+  return _register(name, "gauge", lambda: Gauge(name, description, label_names=label_names))  # type: ignore[return-value]
+
+
+def histogram(
+  name: str,
+  description: str,
+  *,
+  label_names: tuple[str, ...] = (),
+  buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+) -> Histogram:
+  """Register (or return the already registered) histogram called `name`."""
+  return _register(  # type: ignore[return-value]
+    name,
+    "histogram",
+    lambda: Histogram(name, description, label_names=label_names, buckets=buckets),
+  )
+
+
+def registered_histograms() -> list[Histogram]:
+  with _REGISTRY_LOCK:
+    return [metric for metric in _METRICS.values() if isinstance(metric, Histogram)]
+
+
+def register_collector(collector: Callable[[], list[MetricFamily]]) -> None:
+  """Add a callback that reports values read at scrape time, such as cache sizes."""
+  with _REGISTRY_LOCK:
+    if collector not in _COLLECTORS:
+      _COLLECTORS.append(collector)
+
+
+def register_executor(name: str, executor: Executor) -> None:
+  """Report worker count and queue depth of `executor` under `name` on every scrape."""
+  with _REGISTRY_LOCK:
+    _EXECUTORS[name] = executor
+
+
+def unregister_executor(name: str) -> None:
+  """Stop reporting the pool registered under `name`, e.g. once it has been shut down."""
+  with _REGISTRY_LOCK:
+    _EXECUTORS.pop(name, None)
+
+
+def _executor_families() -> list[MetricFamily]:
+  with _REGISTRY_LOCK:
+    executors = sorted(_EXECUTORS.items())
+
+  workers = MetricFamily("executor_workers", "Worker threads or processes started by a background pool.", "gauge")
+  max_workers = MetricFamily("executor_max_workers", "Configured worker limit of a background pool.", "gauge")
+  queued = MetricFamily("executor_queue_depth", "Tasks submitted to a background pool and not yet finished.", "gauge")
+  for name, executor in executors:
+    # Executors expose no public introspection; these attributes are stable across CPython 3.8+.
+    if isinstance(executor, ThreadPoolExecutor):
+      workers.add(len(executor._threads), pool=name)
+      queued.add(executor._work_queue.qsize(), pool=name)
+    elif isinstance(executor, ProcessPoolExecutor):
+      workers.add(len(executor._processes or {}), pool=name)
+      queued.add(len(executor._pending_work_items), pool=name)
+    else:
+      continue
+    max_workers.add(executor._max_workers, pool=name)
+  return [workers, max_workers, queued]
+
+
+def _escape_label(value: str) -> str:
+  return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+  if not labels:
+    return ""
+  return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+  if math.isinf(value):
+    return "+Inf" if value > 0 else "-Inf"
+  if math.isnan(value):
+    return "NaN"
+  return repr(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _render_family(family: MetricFamily, lines: list[str]) -> None:
+  lines.append(f"# HELP {family.name} {family.description}")
+  lines.append(f"# TYPE {family.name} {family.kind}")
+  for labels, value in family.samples:
+    lines.append(f"{family.name}{_format_labels(labels)} {_format_value(value)}")
+
+
+def _render_histogram(metric: Histogram, lines: list[str]) -> None:
+  lines.append(f"# HELP {metric.name} {metric.description}")
+  lines.append(f"# TYPE {metric.name} histogram")
+  for series in metric.collect():
+    for bound, count in zip(metric.buckets, series.bucket_counts):
+      lines.append(f"{metric.name}_bucket{_format_labels(series.labels + (('le', _format_value(bound)),))} {count}")
+    lines.append(f"{metric.name}_bucket{_format_labels(series.labels + (('le', '+Inf'),))} {series.count}")
+    lines.append(f"{metric.name}_sum{_format_labels(series.labels)} {_format_value(series.total)}")
+    lines.append(f"{metric.name}_count{_format_labels(series.labels)} {series.count}")
+
+
+def render_prometheus(extra: list[MetricFamily] | None = None) -> str:
+  """Every registered metric and collector in the Prometheus text exposition format (0.0.4)."""
+  with _REGISTRY_LOCK:
+    metrics = sorted(_METRICS.values(), key=lambda metric: metric.name)
+    collectors = list(_COLLECTORS)
+
+  lines: list[str] = []
+  for metric in metrics:
+    if isinstance(metric, Histogram):
+      _render_histogram(metric, lines)
+    else:
+      _render_family(metric.collect(), lines)
+
+  families = [family for collector in collectors for family in collector()]
+  families.extend(_executor_families())
+  families.extend(extra or [])
+  for family in families:
+    _render_family(family, lines)
+  return "\n".join(lines) + "\n"
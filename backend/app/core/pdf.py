@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import fitz
+
+from app.core.metrics import counter, gauge
+
+OPEN_PDF_DOCUMENTS = gauge("pdf_open_documents", "PyMuPDF documents currently open in this process.")
+PDF_DOCUMENT_OPENS = counter("pdf_document_opens_total", "PyMuPDF documents opened since start.")
+
+
+@contextmanager
+def open_pdf(*args: Any, **kwargs: Any) -> Iterator[fitz.Document]:
+  """`fitz.open` that closes the document on exit and keeps the open-handle gauge current."""
+  document = fitz.open(*args, **kwargs)
+  PDF_DOCUMENT_OPENS.inc()
+  OPEN_PDF_DOCUMENTS.inc()
+  try:
+    yield document
+  finally:
+    document.close()
+    OPEN_PDF_DOCUMENTS.dec()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+# Leaf frames in these modules mean the thread is parked, not working.
+_IDLE_MODULES = ("threading.py", "queue.py", "selectors.py", "socket.py")
+
+
+class StackSampler:
+  """Statistical profiler that folds the stacks of busy threads every `interval_seconds`.
+
+  Samples cover every thread except the excluded ones and idle pool workers, so a request that
+  overlaps others can pick up their frames too; the thread name leads each folded stack to tell
+  them apart.
+  """
+
+  def __init__(self, *, interval_seconds: float, exclude_thread_ids: set[int] | None = None) -> None:
+    self._interval = interval_seconds
+    self._exclude = set(exclude_thread_ids or ())
+    self._stacks: Counter[str] = Counter()
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+    self.samples = 0
+
+  def start(self) -> StackSampler:
+    self._thread.start()
+    return self
+
+  def stop(self) -> Counter[str]:
+    self._stop.set()
+    self._thread.join()
+    return self._stacks
+
+  def _run(self) -> None:
+    self._exclude.add(threading.get_ident())
+    while not self._stop.wait(self._interval):
+      names = {thread.ident: thread.name for thread in threading.enumerate()}
+      for thread_id, frame in sys._current_frames().items():
+        if thread_id in self._exclude or frame.f_code.co_filename.endswith(_IDLE_MODULES):
+          continue
+        stack: list[str] = []
+        current = frame
+        while current is not None:
+          code = current.f_code
+          stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+          current = current.f_back
+        stack.append(names.get(thread_id, str(thread_id)))
+        self._stacks[";".join(reversed(stack))] += 1
+      self.samples += 1
+
+
+def write_folded_profile(directory: Path, name: str, stacks: Counter[str], *, max_files: int) -> Path:
+  """Write `stacks` in the folded format flamegraph tools read and keep only the newest files."""
+  directory.mkdir(parents=True, exist_ok=True)
+  path = directory / f"{name}.folded"
+  path.write_text("".join(f"{stack} {count}\n" for stack, count in stacks.most_common()), encoding="utf-8")
+
+  profiles = sorted(directory.glob("*.folded"), key=lambda candidate: candidate.stat().st_mtime_ns, reverse=True)
+  for stale in profiles[max_files:]:
+    stale.unlink(missing_ok=True)
+  return path
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Generic, TypeVar
+
+from app.core.metrics import counter
+
+SINGLE_FLIGHT_CALLS = counter(
+  "single_flight_calls_total",
+  "Build-on-miss calls by flight and role: leaders ran the build, followers shared its result.",
+  label_names=("flight", "role"),
+)
+
+ValueT = TypeVar("ValueT")
+
+
+class SingleFlight(Generic[ValueT]):
+  """Run at most one call per key at a time; concurrent callers for the key share its outcome.
+
+  The first caller (the leader) runs the function. Callers that arrive while it is running wait
+  and receive the same value, or the same exception. Nothing is kept once the call finishes, so
+  the function should store its result in the cache the callers consult first.
+  """
+
+  def __init__(self, name: str) -> None:
+    self.name = name
+    self._lock = threading.Lock()
+    self._calls: dict[Hashable, Future[ValueT]] = {}
+
+  def in_flight(self) -> int:
+    with self._lock:
+      return len(self._calls)
+
+  def do(self, key: Hashable, function: Callable[[], ValueT]) -> ValueT:
+    with self._lock:
+      call = self._calls.get(key)
+      leader = call is None
+      if call is None:
+        call = self._calls[key] = Future()
+
+    if not leader:
+      SINGLE_FLIGHT_CALLS.inc(flight=self.name, role="follower")
+      return call.result()
+
+    SINGLE_FLIGHT_CALLS.inc(flight=self.name, role="leader")
+    try:
+      value = function()
+    except BaseException as exc:
+      call.set_exception(exc)
+      raise
+    else:
+      call.set_result(value)
+      return value
+    finally:
+      with self._lock:
+        self._calls.pop(key, None)
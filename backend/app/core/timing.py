@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+
+from app.core.metrics import histogram
+
+STAGE_DURATION_SECONDS = histogram(
+  "stage_duration_seconds",
+  "Time spent in one instrumented stage of an operation.",
+  label_names=("operation", "stage"),
+)
+
+_NULL_STAGE = nullcontext()
+
+
+class StageTimings:
+  """Milliseconds per named stage for one operation; repeated stages accumulate."""
+
+  __slots__ = ("operation", "stages", "total_ms")
+
+  def __init__(self, operation: str) -> None:
+    self.operation = operation
+    self.stages: dict[str, float] = {}
+    self.total_ms = 0.0
+
+  def add(self, name: str, elapsed_ms: float) -> None:
+    self.stages[name] = self.stages.get(name, 0.0) + elapsed_ms
+
+  def rounded(self) -> dict[str, float]:
+    return {name: round(elapsed_ms, 3) for name, elapsed_ms in self.stages.items()}
+
+  def server_timing(self) -> str:
+    entries = [f"{name};dur={elapsed_ms:.2f}" for name, elapsed_ms in self.stages.items()]
+    entries.append(f"total;dur={self.total_ms:.2f}")
+    return ", ".join(entries)
+
+
+_ACTIVE_TIMINGS: ContextVar[StageTimings | None] = ContextVar("active_stage_timings", default=None)
+
+
+class _Stage:
+  __slots__ = ("_timings", "_name", "_started")
+
+  def __init__(self, timings: StageTimings, name: str) -> None:
+    self._timings = timings
+    self._name = name
+    self._started = 0.0
+
+  def __enter__(self) -> None:
+    self._started = time.perf_counter()
+
+  def __exit__(self, *_exc: object) -> None:
+    self._timings.add(self._name, (time.perf_counter() - self._started) * 1000)
+
+
+def stage(name: str) -> AbstractContextManager[None]:
+  """Time a block into the active collector; a shared no-op when nothing is collecting."""
+  timings = _ACTIVE_TIMINGS.get()
+  if timings is None:
+    return _NULL_STAGE
+  return _Stage(timings, name)
+
+
+@contextmanager
+def collect_stage_timings(operation: str, *, enabled: bool = True) -> Iterator[StageTimings | None]:
+  """Collect `stage` timings raised in this context and record them in the stage histogram.
+
+  Yields None when disabled, so instrumented code pays one context variable lookup per stage.
+  """
+  if not enabled:
+    yield None
+    return
+
+  timings = StageTimings(operation)
+  token = _ACTIVE_TIMINGS.set(timings)
+  started = time.perf_counter()
+  try:
+    yield timings
+  finally:
+    timings.total_ms = (time.perf_counter() - started) * 1000
+    _ACTIVE_TIMINGS.reset(token)
+    for name, elapsed_ms in timings.stages.items():
+      STAGE_DURATION_SECONDS.observe(elapsed_ms / 1000, operation=operation, stage=name)
+    STAGE_DURATION_SECONDS.observe(timings.total_ms / 1000, operation=operation, stage="total")
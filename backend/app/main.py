@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+import json
+import logging
 import os
+import random
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import partial
 from uuid import uuid4
 
+import anyio
+import anyio.to_thread
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.api.metrics import router as metrics_router
 from app.api.response import error_response
 from app.api.v1.router import router as api_v1_router
+from app.core.config import SlowRequestConfig, get_slow_request_config
 from app.core.errors import ApiError
+from app.core.metrics import gauge, histogram
+from app.core.profiling import StackSampler, write_folded_profile
+from app.services.warmup_service import start_warmup
 
-app = FastAPI(title="EPD Tender Analysis API", version="1.0.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+  start_warmup()
+  yield
+
+
+app = FastAPI(title="EPD Tender Analysis API", version="1.0.0", lifespan=lifespan)
 
 
 def _parse_cors_allow_origins() -> list[str]:
@@ -44,9 +67,160 @@ app.add_middleware(
   allow_credentials=True,
   allow_methods=["*"],
   allow_headers=["*"],
+  expose_headers=["Accept-Ranges", "Content-Length", "Content-Range", "ETag", "Last-Modified", "Server-Timing"],
+)
+
+
+HTTP_REQUESTS_IN_FLIGHT = gauge("http_requests_in_flight", "Requests currently being handled.")
+HTTP_REQUEST_DURATION_SECONDS = histogram(
+  "http_request_duration_seconds",
+  "Time until response headers are sent, by route template.",
+  label_names=("method", "route", "status"),
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+  HTTP_REQUESTS_IN_FLIGHT.inc()
+  started = time.perf_counter()
+  status = 500
+  try:
+    response = await call_next(request)
+    status = response.status_code
+    return response
+  finally:
+    HTTP_REQUESTS_IN_FLIGHT.dec()
+    route = request.scope.get("route")
+    HTTP_REQUEST_DURATION_SECONDS.observe(
+      time.perf_counter() - started,
+      method=request.method,
+      route=getattr(route, "path", "unmatched"),
+      status=str(status),
+    )
+
+
+slow_request_logger = logging.getLogger("app.slow_requests")
+
+
+def _parse_server_timing(header: str | None) -> dict[str, float]:
+  timings: dict[str, float] = {}
+  for entry in (header or "").split(","):
+    name, _, params = entry.strip().partition(";")
+    for param in params.split(";"):
+      key, _, value = param.strip().partition("=")
+      if key == "dur" and name:
+        try:
+          timings[name] = float(value)
+        except ValueError:
+          pass
+  return timings
+
+
+def _content_length(request: Request) -> int | None:
+  try:
+    return int(request.headers.get("content-length") or 0)
+  except ValueError:
+    return None
+
+
+def _log_slow_request(
+  request: Request,
+  *,
+  config: SlowRequestConfig,
+  status: int,
+  headers_ms: float,
+  total_ms: float,
+  response_bytes: int,
+  server_timing: str | None,
+  sampler: StackSampler | None,
+) -> None:
+  stacks = sampler.stop() if sampler is not None else None
+  if total_ms < config.threshold_ms:
+    return
+
+  request_id = getattr(request.state, "request_id", None)
+  profile_path = None
+  if stacks:
+    name = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{request_id or 'request'}"
+    try:
+      profile_path = str(write_folded_profile(config.profile_dir, name, stacks, max_files=config.profile_max_files))
+    except OSError:
+      slow_request_logger.warning("Could not write request profile to %s", config.profile_dir)
+
+  route = request.scope.get("route")
+  slow_request_logger.warning(
+    json.dumps(
+      {
+        "event": "slow_request",
+        "request_id": request_id,
+        "method": request.method,
+        "route": getattr(route, "path", None),
+        "path": request.url.path,
+        "status": status,
+        "duration_ms": round(total_ms, 1),
+        "headers_ms": round(headers_ms, 1),
+        "timings_ms": _parse_server_timing(server_timing),
+        "request_bytes": _content_length(request),
+        "response_bytes": response_bytes,
+        "profile": profile_path,
+      },
+      ensure_ascii=False,
+    )
+  )
+
+
+@app.middleware("http")
+async def log_slow_requests(request: Request, call_next):
+  config = get_slow_request_config()
+  if not config.threshold_ms:
+    return await call_next(request)
+
+  sampler = None
+  if config.profile_rate and random.random() < config.profile_rate:
+    sampler = StackSampler(
+      interval_seconds=config.profile_interval_ms / 1000,
+      exclude_thread_ids={threading.get_ident()},
+    ).start()
+
+  started = time.perf_counter()
+  try:
+    response = await call_next(request)
+  except BaseException:
+    if sampler is not None:
+      with anyio.CancelScope(shield=True):
+        await anyio.to_thread.run_sync(sampler.stop)
+    raise
+  headers_ms = (time.perf_counter() - started) * 1000
+  body = response.body_iterator
+
+  # Streamed exports do most of their work after the headers, so time until the last chunk.
+  async def body_with_slow_log():
+    sent = 0
+    try:
+      async for chunk in body:
+        sent += len(chunk)
+        yield chunk
+    finally:
+      # Stopping the sampler joins its thread and the profile is written to disk, so keep both
+      # off the event loop; the shield still logs requests whose client went away mid-stream.
+      log = partial(
+        _log_slow_request,
+        request,
+        config=config,
+        status=response.status_code,
+        headers_ms=headers_ms,
+        total_ms=(time.perf_counter() - started) * 1000,
+        response_bytes=sent,
+        server_timing=response.headers.get("server-timing"),
+        sampler=sampler,
+      )
+      with anyio.CancelScope(shield=True):
+        await anyio.to_thread.run_sync(log)
+
+  response.body_iterator = body_with_slow_log()
+  return response
+
+
 @app.middleware("http")
 async def attach_request_id(request: Request, call_next):
   request_id = request.headers.get("X-Request-Id") or str(uuid4())
@@ -103,3 +277,4 @@ def handle_unknown_error(request: Request, _: Exception):
 
 
 app.include_router(api_v1_router, prefix="/api/v1")
+app.include_router(metrics_router)
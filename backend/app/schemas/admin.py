@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class ConfigCacheMetricsData(BaseModel):
+  registry_loads: int
+  artifact_loads: int
+  artifact_reloads: int
+  artifact_cache_hits: int
+  project_builds: int
+  project_rebuilds: int
+  project_cache_hits: int
+  cached_projects: list[str] = Field(default_factory=list)
+  check_interval_seconds: float
+  last_reload_at: str | None = None
+
+
+class WorkspaceConfigReloadData(BaseModel):
+  registry_reloaded: bool
+  rebuilt_projects: list[str] = Field(default_factory=list)
+  unchanged_projects: list[str] = Field(default_factory=list)
+  removed_projects: list[str] = Field(default_factory=list)
+  metrics: ConfigCacheMetricsData
+
+
+class LocatorIndexCacheData(BaseModel):
+  documents: int
+  lines: int
+  bytes: int
+  max_bytes: int
+  hits: int
+  disk_hits: int
+  misses: int
+  evictions: int
+  spills: int
+  spill_bytes: int
+  spill_max_bytes: int | None = None
+
+
+class LocatorIndexInvalidateRequest(BaseModel):
+  project_id: str | None = None
+  document_id: str | None = None
+
+
+class LocatorIndexInvalidateData(BaseModel):
+  invalidated: int
+  cache: LocatorIndexCacheData
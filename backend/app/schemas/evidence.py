@@ -52,6 +52,13 @@ class EvidenceResolveRequest(BaseModel):
   document_id: str
   evidence_text: str
   hints: EvidenceResolveHints | None = None
+  search_all_references: bool = False
+  debug: bool = False
+
+
+class EvidenceResolveDebug(BaseModel):
+  stages_ms: dict[str, float]
+  total_ms: float
 
 
 class EvidenceResolveData(BaseModel):
@@ -59,3 +66,5 @@ class EvidenceResolveData(BaseModel):
   document_id: str
   file_name: str
   anchors: list[EvidenceAnchor]
+  searched_document_ids: list[str] = Field(default_factory=list)
+  debug: EvidenceResolveDebug | None = None
@@ -13,6 +13,8 @@ class SelectedStandard(BaseModel):
 
 class ExportRequest(BaseModel):
   report_id: str
-  format: Literal["docx", "pdf"]
+  format: Literal["docx", "pdf", "csv", "ndjson", "xlsx"]
   selected_standards: list[SelectedStandard]
   card_ids: list[str]
+  include_toc: bool = False
+  include_evidence_snippets: bool = False
@@ -56,3 +56,25 @@ class WorkspaceProjectConfig(BaseModel):
 class WorkspaceConfigData(BaseModel):
   default_project_id: str
   projects: list[WorkspaceProjectConfig] = Field(default_factory=list)
+
+
+class WorkspaceProjectSummary(BaseModel):
+  project_id: str
+  name: str
+  default_template_id: str | None = None
+  report_sources: list[ProjectReportSourceSummary] = Field(default_factory=list)
+  loaded: bool = False
+
+
+class WorkspaceSummaryData(BaseModel):
+  default_project_id: str
+  projects: list[WorkspaceProjectSummary] = Field(default_factory=list)
+
+
+class ProjectDocumentRefreshData(BaseModel):
+  project_id: str
+  scanned_directories: int
+  unchanged_directories: int
+  added_files: int
+  removed_files: int
+  document_count: int
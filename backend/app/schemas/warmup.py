@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+WarmupTaskStatus = Literal["pending", "running", "done", "failed"]
+WarmupStatus = Literal["disabled", "running", "ready", "degraded"]
+
+
+class WarmupTaskData(BaseModel):
+  name: str
+  status: WarmupTaskStatus = "pending"
+  duration_ms: float | None = None
+  error: str | None = None
+
+
+class WarmupStatusData(BaseModel):
+  status: WarmupStatus
+  ready: bool
+  total: int = 0
+  completed: int = 0
+  failed: int = 0
+  started_at: str | None = None
+  finished_at: str | None = None
+  tasks: list[WarmupTaskData] = Field(default_factory=list)
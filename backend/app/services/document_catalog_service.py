@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.config import DOCUMENT_CATALOG_DIR, get_config_reload_interval
+
+logger = logging.getLogger(__name__)
+
+_MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogRefreshResult:
+  scanned_directories: int
+  unchanged_directories: int
+  added_files: int
+  removed_files: int
+  document_count: int
+
+
+@dataclass(slots=True)
+class _DirectoryEntry:
+  mtime_ns: int
+  subdirs: list[str]
+  files: list[str]
+
+
+class DocumentCatalog:
+  """PDF listing for one search root that is persisted and refreshed by directory mtime.
+
+  A refresh stats every known directory but only re-lists those whose mtime changed, since
+  adding, removing or renaming an entry bumps its parent directory's mtime. The manifest is
+  written next to the other backend caches, so a restart re-lists nothing that is unchanged.
+  `get_index` refreshes at most once per `check_interval` seconds.
+  """
+
+  def __init__(
+    self,
+    root: Path,
+    *,
+    manifest_path: Path,
+    lookup_keys: Callable[[str], set[str]],
+    check_interval: Callable[[], float] = get_config_reload_interval,
+  ) -> None:
+    self._root = root
+    self._manifest_path = manifest_path
+    self._lookup_keys = lookup_keys
+    self._check_interval = check_interval
+    self._checked_at = float("-inf")
+    self._directories: dict[str, _DirectoryEntry] = {}
+    self._index: dict[str, Path] = {}
+    self._loaded = False
+    self._lock = threading.Lock()
+    self.version = 0
+
+  @property
+  def root(self) -> Path:
+    return self._root
+
+  def _load_manifest(self) -> None:
+    try:
+      payload = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+      return
+    if not isinstance(payload, dict) or payload.get("version") != _MANIFEST_VERSION:
+      return
+    if payload.get("root") != str(self._root):
+      return
+
+    directories = payload.get("directories")
+    if not isinstance(directories, dict):
+      return
+    for relative_dir, raw in directories.items():
+      try:
+        self._directories[relative_dir] = _DirectoryEntry(
+          mtime_ns=int(raw["mtime_ns"]),
+          subdirs=[str(name) for name in raw["subdirs"]],
+          files=[str(name) for name in raw["files"]],
+        )
+      except (KeyError, TypeError, ValueError):
+        self._directories.clear()
+        return
+
+  def _save_manifest(self) -> None:
+    payload = {
+      "version": _MANIFEST_VERSION,
+      "root": str(self._root),
+      "directories": {
+        relative_dir: {"mtime_ns": entry.mtime_ns, "subdirs": entry.subdirs, "files": entry.files}
+        for relative_dir, entry in self._directories.items()
+      },
+    }
+    try:
+      self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+      temp_path = self._manifest_path.with_name(f"{self._manifest_path.name}.{threading.get_ident()}.tmp")
+      temp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+      os.replace(temp_path, self._manifest_path)
+    except OSError:
+      logger.warning("Could not persist document catalog manifest: %s", self._manifest_path)
+
+  def _directory_path(self, relative_dir: str) -> Path:
+    return self._root / relative_dir if relative_dir else self._root
+
+  def _scan_directory(self, relative_dir: str, mtime_ns: int) -> _DirectoryEntry:
+    subdirs: list[str] = []
+    files: list[str] = []
+    with os.scandir(self._directory_path(relative_dir)) as entries:
+      for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+          subdirs.append(entry.name)
+        elif entry.name.lower().endswith(".pdf") and not entry.name.startswith("~$"):
+          files.append(entry.name)
+    return _DirectoryEntry(mtime_ns=mtime_ns, subdirs=subdirs, files=files)
+
+  def _rebuild_index(self) -> None:
+    # Walk pre-order in listing order, as rglob did, so duplicate file names keep resolving
+    # to the same path they did before the catalog existed.
+    index: dict[str, Path] = {}
+    pending = [""]
+    while pending:
+      relative_dir = pending.pop()
+      entry = self._directories.get(relative_dir)
+      if entry is None:
+        continue
+      pending.extend(reversed([f"{relative_dir}/{name}" if relative_dir else name for name in entry.subdirs]))
+      directory = self._directory_path(relative_dir)
+      for file_name in entry.files:
+        path = directory / file_name
+        for key in self._lookup_keys(path.name):
+          index.setdefault(key, path)
+        for key in self._lookup_keys(path.stem):
+          index.setdefault(key, path)
+    self._index = index
+
+  def _refresh_locked(self, *, force: bool) -> CatalogRefreshResult:
+    self._checked_at = time.monotonic()
+    previous = self._directories
+    refreshed: dict[str, _DirectoryEntry] = {}
+    scanned = 0
+    unchanged = 0
+    pending = [""]
+
+    while pending:
+      relative_dir = pending.pop()
+      try:
+        mtime_ns = self._directory_path(relative_dir).stat().st_mtime_ns
+      except OSError:
+        continue
+
+      known = previous.get(relative_dir)
+      if known is not None and known.mtime_ns == mtime_ns and not force:
+        entry = known
+        unchanged += 1
+      else:
+        try:
+          entry = self._scan_directory(relative_dir, mtime_ns)
+        except OSError:
+          continue
+        scanned += 1
+
+      refreshed[relative_dir] = entry
+      pending.extend(f"{relative_dir}/{name}" if relative_dir else name for name in entry.subdirs)
+
+    previous_files = {(relative_dir, name) for relative_dir, entry in previous.items() for name in entry.files}
+    current_files = {(relative_dir, name) for relative_dir, entry in refreshed.items() for name in entry.files}
+    added = len(current_files - previous_files)
+    removed = len(previous_files - current_files)
+
+    self._directories = refreshed
+    if added or removed or not self._loaded:
+      self._rebuild_index()
+    if scanned:
+      self._save_manifest()
+    if added or removed:
+      self.version += 1
+    self._loaded = True
+
+    return CatalogRefreshResult(
+      scanned_directories=scanned,
+      unchanged_directories=unchanged,
+      added_files=added,
+      removed_files=removed,
+      document_count=len(current_files),
+    )
+
+  def refresh(self, *, force: bool = False) -> CatalogRefreshResult:
+    with self._lock:
+      if not self._loaded and not self._directories:
+        self._load_manifest()
+      return self._refresh_locked(force=force)
+
+  def get_index(self) -> dict[str, Path]:
+    now = time.monotonic()
+    with self._lock:
+      if not self._loaded and not self._directories:
+        self._load_manifest()
+      if not self._loaded or now - self._checked_at >= self._check_interval():
+        self._refresh_locked(force=False)
+      return self._index
+
+
+_CATALOGS: dict[str, DocumentCatalog] = {}
+_CATALOGS_LOCK = threading.Lock()
+
+
+def get_document_catalog(root: Path, *, lookup_keys: Callable[[str], set[str]]) -> DocumentCatalog:
+  resolved_root = root.resolve()
+  key = str(resolved_root)
+  with _CATALOGS_LOCK:
+    catalog = _CATALOGS.get(key)
+    if catalog is None:
+      manifest_name = hashlib.sha1(key.encode("utf-8"), usedforsecurity=False).hexdigest()
+      catalog = DocumentCatalog(
+        resolved_root,
+        manifest_path=DOCUMENT_CATALOG_DIR / f"{manifest_name}.json",
+        lookup_keys=lookup_keys,
+      )
+      _CATALOGS[key] = catalog
+    return catalog
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from app.core.config import DocumentDeliveryConfig, get_document_delivery_config
+from app.core.metrics import register_executor
+from app.core.pdf import open_pdf
+from app.services.document_service import get_document_fingerprint
+
+logger = logging.getLogger(__name__)
+
+_SKIP_SUFFIX = ".skip"
+
+_DERIVATIVE_POOL: ThreadPoolExecutor | None = None
+_DERIVATIVE_POOL_LOCK = threading.Lock()
+_PENDING: dict[str, Future[Path | None]] = {}
+
+
+def _get_derivative_pool(workers: int) -> ThreadPoolExecutor:
+  global _DERIVATIVE_POOL
+  with _DERIVATIVE_POOL_LOCK:
+    if _DERIVATIVE_POOL is None:
+      _DERIVATIVE_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-derivative")
+      register_executor("pdf-derivative", _DERIVATIVE_POOL)
+    return _DERIVATIVE_POOL
+
+
+def _derivative_path(source_sha256: str, config: DocumentDeliveryConfig) -> Path:
+  return config.derivative_dir / f"{source_sha256}.pdf"
+
+
+def build_document_derivative(source_path: Path, target_path: Path) -> Path | None:
+  """Write a garbage-collected, deflated, object-stream-packed copy of `source_path`.
+
+  A `.skip` marker is left next to the target when the rewrite is not smaller than the
+  source, so the original keeps being served without retrying on every request.
+  """
+  target_path.parent.mkdir(parents=True, exist_ok=True)
+  temp_path = target_path.with_name(f"{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+  try:
+    with open_pdf(source_path) as document:
+      document.save(temp_path, garbage=3, deflate=True, use_objstms=1)
+
+    if temp_path.stat().st_size >= source_path.stat().st_size:
+      target_path.with_suffix(_SKIP_SUFFIX).touch()
+      return None
+
+    os.replace(temp_path, target_path)
+    return target_path
+  finally:
+    temp_path.unlink(missing_ok=True)
+
+
+def _build_and_release(source_path: Path, target_path: Path, key: str) -> Path | None:
+  try:
+    return build_document_derivative(source_path, target_path)
+  except Exception:
+    logger.exception("PDF derivative build failed for %s", source_path)
+    return None
+  finally:
+    with _DERIVATIVE_POOL_LOCK:
+      _PENDING.pop(key, None)
+
+
+def schedule_document_derivative(
+  source_path: Path,
+  *,
+  config: DocumentDeliveryConfig | None = None,
+) -> Future[Path | None] | None:
+  """Queue a background derivative build unless one exists, is pending, or is not worthwhile."""
+  active_config = config or get_document_delivery_config()
+  if not active_config.derivatives_enabled:
+    return None
+  if source_path.stat().st_size < active_config.derivative_min_bytes:
+    return None
+
+  target_path = _derivative_path(get_document_fingerprint(source_path).sha256, active_config)
+  if target_path.exists() or target_path.with_suffix(_SKIP_SUFFIX).exists():
+    return None
+
+  pool = _get_derivative_pool(active_config.derivative_workers)
+  key = str(target_path)
+  with _DERIVATIVE_POOL_LOCK:
+    pending = _PENDING.get(key)
+    if pending is not None:
+      return pending
+    future = pool.submit(_build_and_release, source_path, target_path, key)
+    _PENDING[key] = future
+  return future
+
+
+def get_optimized_document_path(
+  source_path: Path,
+  *,
+  config: DocumentDeliveryConfig | None = None,
+) -> Path | None:
+  """Return the cached derivative for `source_path`, scheduling its build on a miss."""
+  active_config = config or get_document_delivery_config()
+  if not active_config.derivatives_enabled:
+    return None
+
+  target_path = _derivative_path(get_document_fingerprint(source_path).sha256, active_config)
+  if target_path.exists():
+    return target_path
+
+  schedule_document_derivative(source_path, config=active_config)
+  return None
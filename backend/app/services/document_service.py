@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import hashlib
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 from app.core.config import REFERENCE_DIR
 from app.core.errors import ApiError
+from app.core.single_flight import SingleFlight
+from app.services.pdf_locator_service import clear_index_cache
 from app.services.project_service import get_default_project_id
 from app.services.project_service import get_project_document
+from app.services.project_service import get_workspace_project
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class DocumentFingerprint:
+  sha256: str
+  size: int
+  mtime_ns: int
+
+
+_FINGERPRINT_CACHE: dict[str, DocumentFingerprint] = {}
+_FINGERPRINT_LOCK = threading.Lock()
+_FINGERPRINT_FLIGHTS: SingleFlight[DocumentFingerprint] = SingleFlight("document_fingerprint")
 
 
 def resolve_project_document_path(project_id: str, document_id: str) -> Path:
@@ -30,3 +50,55 @@ def resolve_project_document_path(project_id: str, document_id: str) -> Path:
 
 def resolve_document_path(document_id: str) -> Path:
   return resolve_project_document_path(get_default_project_id(), document_id)
+
+
+def get_document_fingerprint(pdf_path: Path) -> DocumentFingerprint:
+  """Content hash of a reference file, recomputed only when its size or mtime changes."""
+  resolved = pdf_path.resolve()
+  stat_result = resolved.stat()
+  key = str(resolved)
+
+  with _FINGERPRINT_LOCK:
+    cached = _FINGERPRINT_CACHE.get(key)
+  if cached is not None and cached.size == stat_result.st_size and cached.mtime_ns == stat_result.st_mtime_ns:
+    return cached
+
+  def compute() -> DocumentFingerprint:
+    with _FINGERPRINT_LOCK:
+      current = _FINGERPRINT_CACHE.get(key)
+    if current is not None and current.size == stat_result.st_size and current.mtime_ns == stat_result.st_mtime_ns:
+      return current
+    digest = hashlib.sha256()
+    with resolved.open("rb") as handle:
+      while chunk := handle.read(_HASH_CHUNK_SIZE):
+        digest.update(chunk)
+
+    fingerprint = DocumentFingerprint(
+      sha256=digest.hexdigest(),
+      size=stat_result.st_size,
+      mtime_ns=stat_result.st_mtime_ns,
+    )
+    with _FINGERPRINT_LOCK:
+      _FINGERPRINT_CACHE[key] = fingerprint
+    return fingerprint
+
+  return _FINGERPRINT_FLIGHTS.do((key, stat_result.st_size, stat_result.st_mtime_ns), compute)
+
+
+def invalidate_locator_indexes(project_id: str | None = None, document_id: str | None = None) -> int:
+  """Drop cached locator indexes for one document, every document of a project, or everything."""
+  if document_id:
+    if project_id:
+      return clear_index_cache(resolve_project_document_path(project_id, document_id))
+    return clear_index_cache(resolve_document_path(document_id))
+  if not project_id:
+    return clear_index_cache()
+
+  invalidated = 0
+  for document in get_workspace_project(project_id).documents:
+    try:
+      pdf_path = resolve_project_document_path(project_id, document.document_id)
+    except ApiError:
+      continue
+    invalidated += clear_index_cache(pdf_path)
+  return invalidated
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from pathlib import Path
 from uuid import uuid4
 
+from app.core.errors import ApiError
 from app.schemas.evidence import BBox, EvidenceAnchor, EvidenceResolveData, EvidenceResolveRequest
 from app.services.document_service import resolve_project_document_path
-from app.services.pdf_locator_service import locate_evidence
+from app.services.page_render_service import schedule_page_prewarm
+from app.services.pdf_locator_service import LocatorResult, locate_evidence, locate_evidence_across_documents
 from app.services.project_service import get_project_document
 from app.services.report_service import get_item, get_report_project_id
 
@@ -24,35 +27,88 @@ def _to_bboxes(raw_list: list[tuple[float, float, float, float]] | None) -> list
   return [BBox(x0=x0, y0=y0, x1=x1, y1=y1) for x0, y0, x1, y1 in raw_list]
 
 
+def _to_anchor(document_id: str, located: LocatorResult) -> EvidenceAnchor:
+  return EvidenceAnchor(
+    anchor_id=f"anc_{uuid4().hex[:8]}",
+    document_id=document_id,
+    page=located.page,
+    quote=located.quote,
+    bbox=_to_bbox(located.bbox),
+    bboxes=_to_bboxes(located.bboxes),
+    match_method=located.match_method,
+    match_score=located.match_score,
+    status=located.status,
+  )
+
+
+def _reference_documents(project_id: str, document_ids: list[str]) -> list[tuple[str, Path]]:
+  documents: dict[str, Path] = {}
+  for document_id in document_ids:
+    if document_id in documents:
+      continue
+    try:
+      documents[document_id] = resolve_project_document_path(project_id, document_id)
+    except ApiError:
+      continue
+  return list(documents.items())
+
+
+def _resolve_across_references(
+  payload: EvidenceResolveRequest,
+  project_id: str,
+  document_references: list[str],
+  evidence_text: str,
+  clause_keyword: str | None,
+) -> EvidenceResolveData:
+  # The requested document is searched first, so an exact hit there skips the other references.
+  documents = _reference_documents(project_id, [payload.document_id, *document_references])
+  if not documents:
+    # Surface the same 404 as single-document mode.
+    resolve_project_document_path(project_id, payload.document_id)
+
+  ranked = locate_evidence_across_documents(documents, evidence_text, clause_keyword=clause_keyword)
+  best_document_id, best = ranked[0]
+  paths = dict(documents)
+  if best.status != "unresolved":
+    schedule_page_prewarm(paths[best_document_id], best.page)
+
+  document = get_project_document(project_id, best_document_id)
+  return EvidenceResolveData(
+    item_id=payload.item_id,
+    document_id=best_document_id,
+    file_name=document.file_name if document else paths[best_document_id].name,
+    anchors=[_to_anchor(document_id, located) for document_id, located in ranked],
+    searched_document_ids=[document_id for document_id, _ in ranked],
+  )
+
+
 def resolve_evidence(payload: EvidenceResolveRequest) -> EvidenceResolveData:
   report_item = get_item(payload.report_id, payload.item_id)
   project_id = get_report_project_id(payload.report_id)
-  pdf_path = resolve_project_document_path(project_id, payload.document_id)
   clause_keyword = payload.hints.clause_keyword if payload.hints else None
   evidence_text = payload.evidence_text or report_item.evidence
 
+  if payload.search_all_references:
+    return _resolve_across_references(
+      payload,
+      project_id,
+      report_item.document_references,
+      evidence_text,
+      clause_keyword,
+    )
+
+  pdf_path = resolve_project_document_path(project_id, payload.document_id)
   located = locate_evidence(pdf_path, evidence_text, clause_keyword=clause_keyword)
-  bbox = _to_bbox(located.bbox)
-  bboxes = _to_bboxes(located.bboxes)
+  if located.status != "unresolved":
+    schedule_page_prewarm(pdf_path, located.page)
 
   document = get_project_document(project_id, payload.document_id)
   file_name = document.file_name if document else pdf_path.name
 
-  anchor = EvidenceAnchor(
-    anchor_id=f"anc_{uuid4().hex[:8]}",
-    document_id=payload.document_id,
-    page=located.page,
-    quote=located.quote,
-    bbox=bbox,
-    bboxes=bboxes,
-    match_method=located.match_method,
-    match_score=located.match_score,
-    status=located.status,
-  )
-
   return EvidenceResolveData(
     item_id=payload.item_id,
     document_id=payload.document_id,
     file_name=file_name,
-    anchors=[anchor],
+    anchors=[_to_anchor(payload.document_id, located)],
+    searched_document_ids=[payload.document_id],
   )
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+
+import fitz
+
+from app.core.pdf import open_pdf
+from app.schemas.evidence import EvidenceAnchor
+
+
+@dataclass(frozen=True, slots=True)
+class EvidenceSnippet:
+  document_id: str
+  page: int
+  png: bytes
+  width_pt: float
+  height_pt: float
+
+
+class PagePixmapCache:
+  """Renders each (document, page) once at a fixed DPI and crops anchor regions out of it.
+
+  Pixmaps are kept in LRU order and evicted once their sample buffers exceed `max_bytes`,
+  so cards that point at the same page reuse one rasterisation instead of reopening the PDF.
+  """
+
+  def __init__(self, *, dpi: int, max_bytes: int) -> None:
+    self._dpi = dpi
+    self._max_bytes = max_bytes
+    self._documents: dict[str, fitz.Document] = {}
+    self._open_documents = ExitStack()
+    self._pixmaps: OrderedDict[tuple[str, int], fitz.Pixmap] = OrderedDict()
+    self._bytes = 0
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  @property
+  def scale(self) -> float:
+    return self._dpi / 72.0
+
+  @property
+  def cached_bytes(self) -> int:
+    return self._bytes
+
+  def __enter__(self) -> PagePixmapCache:
+    return self
+
+  def __exit__(self, *_exc: object) -> None:
+    self.close()
+
+  def close(self) -> None:
+    with self._lock:
+      self._pixmaps.clear()
+      self._bytes = 0
+      self._open_documents.close()
+      self._documents.clear()
+
+  def _open_document(self, pdf_path: Path) -> fitz.Document:
+    key = str(pdf_path)
+    document = self._documents.get(key)
+    if document is None:
+      document = self._open_documents.enter_context(open_pdf(pdf_path))
+      self._documents[key] = document
+    return document
+
+  def _evict(self) -> None:
+    while self._bytes > self._max_bytes and len(self._pixmaps) > 1:
+      _, evicted = self._pixmaps.popitem(last=False)
+      self._bytes -= len(evicted.samples_mv)
+
+  def get_page_pixmap(self, pdf_path: Path, page: int) -> fitz.Pixmap | None:
+    key = (str(pdf_path), page)
+    with self._lock:
+      cached = self._pixmaps.get(key)
+      if cached is not None:
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return cached
+
+      document = self._open_document(pdf_path)
+      if page < 1 or page > document.page_count:
+        return None
+
+      pixmap = document.load_page(page - 1).get_pixmap(dpi=self._dpi)
+      self.misses += 1
+      self._pixmaps[key] = pixmap
+      self._bytes += len(pixmap.samples_mv)
+      self._evict()
+      return pixmap
+
+  def render_clip(
+    self,
+    pdf_path: Path,
+    page: int,
+    clip: tuple[float, float, float, float],
+  ) -> tuple[bytes, float, float] | None:
+    page_pixmap = self.get_page_pixmap(pdf_path, page)
+    if page_pixmap is None:
+      return None
+
+    scale = self.scale
+    pixel_rect = fitz.IRect(
+      int(clip[0] * scale),
+      int(clip[1] * scale),
+      int(clip[2] * scale + 0.999),
+      int(clip[3] * scale + 0.999),
+    ) & page_pixmap.irect
+    if pixel_rect.is_empty:
+      return None
+
+    cropped = fitz.Pixmap(page_pixmap.colorspace, pixel_rect, page_pixmap.alpha)
+    cropped.copy(page_pixmap, pixel_rect)
+    return cropped.tobytes("png"), pixel_rect.width / scale, pixel_rect.height / scale
+
+
+def _anchor_clip(anchor: EvidenceAnchor, *, padding: float) -> tuple[float, float, float, float] | None:
+  boxes = anchor.bboxes or ([anchor.bbox] if anchor.bbox else [])
+  if not boxes:
+    return None
+
+  return (
+    max(0.0, min(box.x0 for box in boxes) - padding),
+    max(0.0, min(box.y0 for box in boxes) - padding),
+    max(box.x1 for box in boxes) + padding,
+    max(box.y1 for box in boxes) + padding,
+  )
+
+
+def render_anchor_snippets(
+  anchors: list[EvidenceAnchor] | None,
+  *,
+  resolve_path: Callable[[str], Path | None],
+  cache: PagePixmapCache,
+  padding: float,
+  limit: int,
+) -> list[EvidenceSnippet]:
+  snippets: list[EvidenceSnippet] = []
+  for anchor in anchors or []:
+    if len(snippets) >= limit:
+      break
+    if anchor.status == "unresolved":
+      continue
+
+    clip = _anchor_clip(anchor, padding=padding)
+    if clip is None:
+      continue
+
+    pdf_path = resolve_path(anchor.document_id)
+    if pdf_path is None:
+      continue
+
+    rendered = cache.render_clip(pdf_path, anchor.page, clip)
+    if rendered is None:
+      continue
+
+    png, width_pt, height_pt = rendered
+    snippets.append(
+      EvidenceSnippet(
+        document_id=anchor.document_id,
+        page=anchor.page,
+        png=png,
+        width_pt=width_pt,
+        height_pt=height_pt,
+      )
+    )
+
+  return snippets
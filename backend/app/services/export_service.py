@@ -1,22 +1,84 @@
 from __future__ import annotations
 
+import csv
+import json
+import logging
+import multiprocessing
 import re
+import threading
+import time
+import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from io import BytesIO
+from functools import lru_cache
+from io import BytesIO, StringIO, TextIOWrapper
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
 from xml.sax.saxutils import escape
 
+import fitz
 from docx import Document
+from openpyxl import Workbook
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from reportlab.platypus import Flowable, Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 
-from app.schemas.exports import ExportRequest
+from app.core.config import ExportConfig, get_export_config
+from app.core.errors import ApiError
+from app.core.metrics import DEFAULT_SIZE_BUCKETS, histogram, register_executor, unregister_executor
+from app.core.pdf import open_pdf
+from app.schemas.exports import ExportRequest, SelectedStandard
 from app.schemas.reports import ManualReviewHistoryEntry, ReportItem
+from app.services.document_service import resolve_project_document_path
+from app.services.evidence_snippet_service import EvidenceSnippet, PagePixmapCache, render_anchor_snippets
 
+logger = logging.getLogger(__name__)
 
 _FILENAME_RE = re.compile(r"[^a-zA-Z0-9._-]+")
 _HONG_KONG_TZ = timezone(timedelta(hours=8), name="HKT")
+_XML_INVALID_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_STREAM_CHUNK_SIZE = 64 * 1024
+_XLSX_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+_XLSX_CELL_MAX_LENGTH = 32767
+STREAMING_EXPORT_FORMATS = frozenset({"csv", "ndjson", "xlsx"})
+_TABULAR_EXPORT_COLUMNS = (
+  "index",
+  "item_id",
+  "title",
+  "status",
+  "consistency_status",
+  "status_domain",
+  "raw_status",
+  "check_type",
+  "severity",
+  "confidence_score",
+  "description",
+  "reasoning",
+  "evidence",
+  "document_references",
+  "keywords",
+  "source_pack",
+  "manual_verdict",
+  "manual_verdict_category",
+  "manual_verdict_note",
+  "anchor_pages",
+  "manual_review_history_count",
+  "manual_review_history",
+)
+_DOCX_DOCUMENT_PART = "word/document.xml"
+_DOCX_CORE_PART = "docProps/core.xml"
+_DOCX_TABLE_STYLE_ID = "LightGrid-Accent1"
+# Usable width of the default python-docx template: 12240 page - 2 * 1800 margins, in twips.
+_DOCX_TABLE_WIDTH_TWIPS = 8640
+_PDF_FRAME_WIDTH = A4[0] - 80
+_SNIPPET_MAX_HEIGHT = 240.0
+_PDF_RENDER_POOL: ProcessPoolExecutor | None = None
+_PDF_RENDER_POOL_WORKERS = 0
+_PDF_RENDER_POOL_LOCK = threading.Lock()
 _REVIEW_TITLE_BY_DOMAIN_STATUS = {
   "consistency": {
     "consistent": "Consistency Review",
@@ -199,39 +261,213 @@ def _build_docx(
   return output.getvalue()
 
 
-def _build_pdf(
+@dataclass(frozen=True, slots=True)
+class _DocxTemplate:
+  parts: tuple[tuple[zipfile.ZipInfo, bytes], ...]
+  document_prefix: str
+  document_suffix: str
+  core_properties: str
+
+
+@lru_cache(maxsize=1)
+def _docx_template() -> _DocxTemplate:
+  template_output = BytesIO()
+  Document().save(template_output)
+
+  with zipfile.ZipFile(template_output) as archive:
+    parts = tuple((info, archive.read(info)) for info in archive.infolist())
+
+  by_name = {info.filename: data for info, data in parts}
+  document_xml = by_name[_DOCX_DOCUMENT_PART].decode("utf-8")
+  body_start = document_xml.index("<w:body>") + len("<w:body>")
+  section_start = document_xml.index("<w:sectPr", body_start)
+
+  return _DocxTemplate(
+    parts=parts,
+    document_prefix=document_xml[:body_start],
+    document_suffix=document_xml[section_start:],
+    core_properties=by_name[_DOCX_CORE_PART].decode("utf-8"),
+  )
+
+
+def _docx_run(text: str) -> str:
+  cleaned = _XML_INVALID_CHARS_RE.sub("", text)
+  if not cleaned:
+    return ""
+
+  pieces: list[str] = []
+  for segment in re.split(r"(\n|\t)", cleaned):
+    if segment == "\n":
+      pieces.append("<w:br/>")
+    elif segment == "\t":
+      pieces.append("<w:tab/>")
+    elif segment:
+      space = ' xml:space="preserve"' if segment != segment.strip() else ""
+      pieces.append(f"<w:t{space}>{escape(segment)}</w:t>")
+  return f"<w:r>{''.join(pieces)}</w:r>"
+
+
+def _docx_paragraph(text: str, style_id: str | None = None) -> str:
+  properties = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>' if style_id else ""
+  content = properties + _docx_run(text)
+  return f"<w:p>{content}</w:p>" if content else "<w:p/>"
+
+
+def _docx_heading(text: str, level: int) -> str:
+  return _docx_paragraph(text, "Title" if level == 0 else f"Heading{level}")
+
+
+def _docx_standards_table(standards: list[SelectedStandard]) -> str:
+  column_width = _DOCX_TABLE_WIDTH_TWIPS // 3
+  cell_properties = f'<w:tcPr><w:tcW w:type="dxa" w:w="{column_width}"/></w:tcPr>'
+
+  def row(values: tuple[str, str, str]) -> str:
+    cells = "".join(f"<w:tc>{cell_properties}{_docx_paragraph(value)}</w:tc>" for value in values)
+    return f"<w:tr>{cells}</w:tr>"
+
+  rows = [row(("Priority", "Standard ID", "Name"))]
+  rows.extend(row((str(standard.priority), standard.standard_id, standard.name)) for standard in standards)
+  grid = "".join(f'<w:gridCol w:w="{column_width}"/>' for _ in range(3))
+  return (
+    "<w:tbl><w:tblPr>"
+    f'<w:tblStyle w:val="{_DOCX_TABLE_STYLE_ID}"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    f"</w:tblPr><w:tblGrid>{grid}</w:tblGrid>{''.join(rows)}</w:tbl>"
+  )
+
+
+def _docx_body_fragments(
+  payload: ExportRequest,
+  ordered_cards: list[ReportItem],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
+  generated_at: str,
+) -> Iterator[str]:
+  yield _docx_heading("EPD Tender Analysis Report", 0)
+  yield _docx_paragraph(f"Report ID: {payload.report_id}")
+  yield _docx_paragraph(f"Format: {payload.format.upper()}")
+  yield _docx_paragraph(f"Generated At (HKT): {generated_at}")
+
+  yield _docx_heading("Selected Standards", 1)
+  if payload.selected_standards:
+    yield _docx_standards_table(sorted(payload.selected_standards, key=lambda item: item.priority))
+  else:
+    yield _docx_paragraph("No selected standards.")
+
+  yield _docx_heading("Cards", 1)
+  if not ordered_cards:
+    yield _docx_paragraph("No cards selected for export.")
+
+  for index, card in enumerate(ordered_cards, start=1):
+    title = _review_title(card.consistency_status, card.status_domain)
+    history_entries = _history_for_item(manual_review_history, card.item_id)
+    fragments = [
+      _docx_heading(f"{index}. {title}", 2),
+      _docx_paragraph(f"Item ID: {card.item_id}"),
+      _docx_paragraph(f"Title: {title}"),
+      _docx_paragraph(f"Status: {_status_label(card)}"),
+      _docx_paragraph(f"Category: {_format_label(card.check_type)}"),
+      _docx_paragraph(f"Severity: {_format_label(card.severity)}"),
+      _docx_paragraph(f"Confidence: {card.confidence_score:.2f}"),
+      _docx_paragraph("Description:"),
+      _docx_paragraph(card.description),
+      _docx_paragraph("Reasoning:"),
+      _docx_paragraph(card.reasoning),
+      _docx_paragraph("Evidence:"),
+      _docx_paragraph(card.evidence),
+      _docx_paragraph(f"Referenced Sources: {', '.join(card.document_references)}"),
+    ]
+    if card.keywords:
+      fragments.append(_docx_paragraph(f"Keywords: {', '.join(card.keywords)}"))
+    fragments.append(_docx_paragraph("Manual Review History:"))
+    if history_entries:
+      fragments.extend(
+        _docx_paragraph(_history_line(history_index, entry))
+        for history_index, entry in enumerate(history_entries, start=1)
+      )
+    else:
+      fragments.append(_docx_paragraph("No manual review history."))
+    yield "".join(fragments)
+
+
+def _build_docx_from_template(
   payload: ExportRequest,
   cards: list[ReportItem],
   manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
 ) -> bytes:
   ordered_cards = _ordered_cards(payload, cards)
   now = _current_hong_kong_time()
+  template = _docx_template()
+  core_properties = template.core_properties.replace(
+    "<dc:title/>",
+    f"<dc:title>{escape(f'EPD Tender Analysis - {payload.report_id}')}</dc:title>",
+    1,
+  )
 
   output = BytesIO()
-  doc = SimpleDocTemplate(
-    output,
-    pagesize=A4,
-    leftMargin=40,
-    rightMargin=40,
-    topMargin=40,
-    bottomMargin=40,
-  )
+  with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    for info, data in template.parts:
+      if info.filename == _DOCX_DOCUMENT_PART:
+        with archive.open(_DOCX_DOCUMENT_PART, "w") as raw_part, TextIOWrapper(raw_part, encoding="utf-8") as part:
+          part.write(template.document_prefix)
+          for fragment in _docx_body_fragments(payload, ordered_cards, manual_review_history, now):
+            part.write(fragment)
+          part.write(template.document_suffix)
+      elif info.filename == _DOCX_CORE_PART:
+        archive.writestr(info.filename, core_properties, compress_type=zipfile.ZIP_DEFLATED)
+      else:
+        archive.writestr(info.filename, data, compress_type=zipfile.ZIP_DEFLATED)
 
+  return output.getvalue()
+
+
+def _pdf_styles() -> dict[str, ParagraphStyle]:
   styles = getSampleStyleSheet()
-  title_style = ParagraphStyle("ReportTitle", parent=styles["Title"], fontSize=18, leading=22, spaceAfter=12)
-  heading_style = ParagraphStyle("ReportHeading", parent=styles["Heading2"], fontSize=13, leading=16, spaceAfter=6)
-  body_style = ParagraphStyle("ReportBody", parent=styles["BodyText"], fontSize=10, leading=14)
-  meta_style = ParagraphStyle("ReportMeta", parent=styles["BodyText"], fontSize=9, leading=12, textColor=colors.HexColor("#334155"))
+  return {
+    "title": ParagraphStyle("ReportTitle", parent=styles["Title"], fontSize=18, leading=22, spaceAfter=12),
+    "heading": ParagraphStyle("ReportHeading", parent=styles["Heading2"], fontSize=13, leading=16, spaceAfter=6),
+    "body": ParagraphStyle("ReportBody", parent=styles["BodyText"], fontSize=10, leading=14),
+    "meta": ParagraphStyle(
+      "ReportMeta",
+      parent=styles["BodyText"],
+      fontSize=9,
+      leading=12,
+      textColor=colors.HexColor("#334155"),
+    ),
+  }
+
+
+class _CardOutlineMarker(Flowable):
+  """Zero-size flowable that records the page a card heading was laid out on."""
+
+  def __init__(self, index: int, title: str, sink: list[tuple[int, str, int]]) -> None:
+    super().__init__()
+    self._index = index
+    self._title = title
+    self._sink = sink
+
+  def wrap(self, available_width: float, available_height: float) -> tuple[float, float]:
+    return (0, 0)
+
+  def draw(self) -> None:
+    self._sink.append((self._index, self._title, self.canv.getPageNumber()))
+
 
+def _pdf_preamble_story(
+  payload: ExportRequest,
+  generated_at: str,
+  *,
+  has_cards: bool,
+  styles: dict[str, ParagraphStyle],
+) -> list:
   story: list = []
 
-  story.append(Paragraph("EPD Tender Analysis Report", title_style))
-  story.append(Paragraph(f"Report ID: {_safe_text(payload.report_id)}", meta_style))
-  story.append(Paragraph(f"Format: {_safe_text(payload.format.upper())}", meta_style))
-  story.append(Paragraph(f"Generated At (HKT): {_safe_text(now)}", meta_style))
+  story.append(Paragraph("EPD Tender Analysis Report", styles["title"]))
+  story.append(Paragraph(f"Report ID: {_safe_text(payload.report_id)}", styles["meta"]))
+  story.append(Paragraph(f"Format: {_safe_text(payload.format.upper())}", styles["meta"]))
+  story.append(Paragraph(f"Generated At (HKT): {_safe_text(generated_at)}", styles["meta"]))
   story.append(Spacer(1, 12))
 
-  story.append(Paragraph("Selected Standards", heading_style))
+  story.append(Paragraph("Selected Standards", styles["heading"]))
   if payload.selected_standards:
     rows = [["Priority", "Standard ID", "Name"]]
     for standard in sorted(payload.selected_standards, key=lambda item: item.priority):
@@ -255,71 +491,491 @@ def _build_pdf(
     )
     story.append(table)
   else:
-    story.append(Paragraph("No selected standards.", body_style))
+    story.append(Paragraph("No selected standards.", styles["body"]))
 
   story.append(Spacer(1, 12))
-  story.append(Paragraph("Cards", heading_style))
+  story.append(Paragraph("Cards", styles["heading"]))
+
+  if not has_cards:
+    story.append(Paragraph("No cards selected for export.", styles["body"]))
+
+  return story
+
+
+def _pdf_card_story(
+  index: int,
+  card: ReportItem,
+  history_entries: list[ManualReviewHistoryEntry],
+  *,
+  styles: dict[str, ParagraphStyle],
+  outline: list[tuple[int, str, int]],
+  snippets: list[EvidenceSnippet] | None = None,
+) -> list:
+  heading_style = styles["heading"]
+  body_style = styles["body"]
+  meta_style = styles["meta"]
+  title = _review_title(card.consistency_status, card.status_domain)
+  story: list = []
 
-  if not ordered_cards:
-    story.append(Paragraph("No cards selected for export.", body_style))
+  story.append(Spacer(1, 6))
+  story.append(Paragraph(f"{index}. {_safe_text(title)}", heading_style))
+  story.append(_CardOutlineMarker(index, f"{index}. {title}", outline))
+  story.append(Paragraph(f"Item ID: {_safe_text(card.item_id)}", meta_style))
+  story.append(Paragraph(f"Title: {_safe_text(title)}", meta_style))
+  story.append(Paragraph(f"Status: {_safe_text(_status_label(card))}", meta_style))
+  story.append(Paragraph(f"Category: {_safe_text(_format_label(card.check_type))}", meta_style))
+  story.append(Paragraph(f"Severity: {_safe_text(_format_label(card.severity))}", meta_style))
+  story.append(Paragraph(f"Confidence: {card.confidence_score:.2f}", meta_style))
+  story.append(Paragraph("Description:", meta_style))
+  story.append(Paragraph(_safe_text(card.description), body_style))
+  story.append(Paragraph("Reasoning:", meta_style))
+  story.append(Paragraph(_safe_text(card.reasoning), body_style))
+  story.append(Paragraph("Evidence:", meta_style))
+  story.append(Paragraph(_safe_text(card.evidence), body_style))
+  for snippet in snippets or []:
+    story.append(Paragraph(f"Source Snippet: {_safe_text(snippet.document_id)}, page {snippet.page}", meta_style))
+    story.append(_snippet_image(snippet))
+  story.append(Paragraph(f"Referenced Sources: {_safe_text(', '.join(card.document_references))}", meta_style))
+  if card.keywords:
+    story.append(Paragraph(f"Keywords: {_safe_text(', '.join(card.keywords))}", meta_style))
+  story.append(Paragraph("Manual Review History:", meta_style))
+  if history_entries:
+    for history_index, entry in enumerate(history_entries, start=1):
+      story.append(
+        Paragraph(
+          _safe_text(
+            (
+              f"{history_index}. Edited At (HKT): {_format_history_time(entry.edited_at)} | "
+              f"Verdict: {_format_optional_label(entry.manual_verdict)} | "
+              f"Category: {_format_optional_label(entry.manual_verdict_category)} | "
+              f"Note: {entry.manual_verdict_note or 'N/A'}"
+            )
+          ),
+          body_style,
+        )
+      )
+  else:
+    story.append(Paragraph("No manual review history.", body_style))
 
-  for index, card in enumerate(ordered_cards, start=1):
-    title = _review_title(card.consistency_status, card.status_domain)
-    history_entries = _history_for_item(manual_review_history, card.item_id)
-    story.append(Spacer(1, 6))
-    story.append(Paragraph(f"{index}. {_safe_text(title)}", heading_style))
-    story.append(Paragraph(f"Item ID: {_safe_text(card.item_id)}", meta_style))
-    story.append(Paragraph(f"Title: {_safe_text(title)}", meta_style))
-    story.append(Paragraph(f"Status: {_safe_text(_status_label(card))}", meta_style))
-    story.append(Paragraph(f"Category: {_safe_text(_format_label(card.check_type))}", meta_style))
-    story.append(Paragraph(f"Severity: {_safe_text(_format_label(card.severity))}", meta_style))
-    story.append(Paragraph(f"Confidence: {card.confidence_score:.2f}", meta_style))
-    story.append(Paragraph("Description:", meta_style))
-    story.append(Paragraph(_safe_text(card.description), body_style))
-    story.append(Paragraph("Reasoning:", meta_style))
-    story.append(Paragraph(_safe_text(card.reasoning), body_style))
-    story.append(Paragraph("Evidence:", meta_style))
-    story.append(Paragraph(_safe_text(card.evidence), body_style))
-    story.append(Paragraph(f"Referenced Sources: {_safe_text(', '.join(card.document_references))}", meta_style))
-    if card.keywords:
-      story.append(Paragraph(f"Keywords: {_safe_text(', '.join(card.keywords))}", meta_style))
-    story.append(Paragraph("Manual Review History:", meta_style))
-    if history_entries:
-      for history_index, entry in enumerate(history_entries, start=1):
-        story.append(
-          Paragraph(
-            _safe_text(
-              (
-                f"{history_index}. Edited At (HKT): {_format_history_time(entry.edited_at)} | "
-                f"Verdict: {_format_optional_label(entry.manual_verdict)} | "
-                f"Category: {_format_optional_label(entry.manual_verdict_category)} | "
-                f"Note: {entry.manual_verdict_note or 'N/A'}"
-              )
-            ),
-            body_style,
-          )
+  return story
+
+
+@dataclass(frozen=True, slots=True)
+class _SnippetOptions:
+  project_id: str
+  dpi: int
+  padding: float
+  limit: int
+  cache_max_bytes: int
+
+
+def _snippet_options(
+  payload: ExportRequest,
+  project_id: str | None,
+  export_config: ExportConfig,
+) -> _SnippetOptions | None:
+  if not payload.include_evidence_snippets or not project_id:
+    return None
+
+  return _SnippetOptions(
+    project_id=project_id,
+    dpi=export_config.snippet_dpi,
+    padding=export_config.snippet_padding,
+    limit=export_config.snippet_max_per_card,
+    cache_max_bytes=export_config.snippet_cache_max_bytes,
+  )
+
+
+def _document_path_resolver(project_id: str) -> Callable[[str], Path | None]:
+  resolved: dict[str, Path | None] = {}
+
+  def resolve(document_id: str) -> Path | None:
+    if document_id not in resolved:
+      try:
+        resolved[document_id] = resolve_project_document_path(project_id, document_id)
+      except ApiError:
+        resolved[document_id] = None
+    return resolved[document_id]
+
+  return resolve
+
+
+def _snippet_image(snippet: EvidenceSnippet) -> Image:
+  scale = min(1.0, _PDF_FRAME_WIDTH / snippet.width_pt, _SNIPPET_MAX_HEIGHT / snippet.height_pt)
+  return Image(BytesIO(snippet.png), width=snippet.width_pt * scale, height=snippet.height_pt * scale)
+
+
+def _render_pdf_part(
+  payload: ExportRequest,
+  cards: list[tuple[int, ReportItem]],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
+  *,
+  generated_at: str,
+  include_preamble: bool,
+  has_cards: bool,
+  snippet_options: _SnippetOptions | None = None,
+) -> tuple[bytes, list[tuple[int, str, int]]]:
+  output = BytesIO()
+  doc = SimpleDocTemplate(
+    output,
+    pagesize=A4,
+    leftMargin=40,
+    rightMargin=40,
+    topMargin=40,
+    bottomMargin=40,
+  )
+  styles = _pdf_styles()
+  outline: list[tuple[int, str, int]] = []
+
+  story: list = []
+  if include_preamble:
+    story.extend(_pdf_preamble_story(payload, generated_at, has_cards=has_cards, styles=styles))
+
+  snippet_cache = (
+    PagePixmapCache(dpi=snippet_options.dpi, max_bytes=snippet_options.cache_max_bytes) if snippet_options else None
+  )
+  resolve_path = _document_path_resolver(snippet_options.project_id) if snippet_options else None
+  try:
+    for index, card in cards:
+      history_entries = _history_for_item(manual_review_history, card.item_id)
+      snippets = (
+        render_anchor_snippets(
+          card.anchors,
+          resolve_path=resolve_path,
+          cache=snippet_cache,
+          padding=snippet_options.padding,
+          limit=snippet_options.limit,
         )
-    else:
-      story.append(Paragraph("No manual review history.", body_style))
+        if snippet_options and snippet_cache and resolve_path
+        else None
+      )
+      story.extend(
+        _pdf_card_story(index, card, history_entries, styles=styles, outline=outline, snippets=snippets)
+      )
+  finally:
+    if snippet_cache is not None:
+      snippet_cache.close()
 
   doc.build(story)
-  return output.getvalue()
+  return output.getvalue(), outline
+
+
+def _render_pdf_chunk(
+  payload: ExportRequest,
+  cards: list[tuple[int, ReportItem]],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
+  generated_at: str,
+  include_preamble: bool,
+  snippet_options: _SnippetOptions | None,
+) -> tuple[bytes, list[tuple[int, str, int]]]:
+  # Process-pool entry point: positional arguments only so it pickles cleanly.
+  return _render_pdf_part(
+    payload,
+    cards,
+    manual_review_history,
+    generated_at=generated_at,
+    include_preamble=include_preamble,
+    has_cards=True,
+    snippet_options=snippet_options,
+  )
+
+
+def _get_pdf_render_pool(workers: int) -> ProcessPoolExecutor:
+  global _PDF_RENDER_POOL, _PDF_RENDER_POOL_WORKERS
+
+  with _PDF_RENDER_POOL_LOCK:
+    if _PDF_RENDER_POOL is None or _PDF_RENDER_POOL_WORKERS != workers:
+      if _PDF_RENDER_POOL is not None:
+        _PDF_RENDER_POOL.shutdown(wait=False)
+      # Spawn avoids forking a multi-threaded server process.
+      _PDF_RENDER_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+      _PDF_RENDER_POOL_WORKERS = workers
+      register_executor("pdf-export-render", _PDF_RENDER_POOL)
+    return _PDF_RENDER_POOL
+
+
+def _discard_pdf_render_pool(pool: ProcessPoolExecutor) -> None:
+  global _PDF_RENDER_POOL, _PDF_RENDER_POOL_WORKERS
+
+  with _PDF_RENDER_POOL_LOCK:
+    if _PDF_RENDER_POOL is pool:
+      _PDF_RENDER_POOL = None
+      _PDF_RENDER_POOL_WORKERS = 0
+      unregister_executor("pdf-export-render")
+  pool.shutdown(wait=False)
+
+
+def _stamp_page_numbers(document: fitz.Document) -> None:
+  page_total = document.page_count
+  for page_index in range(page_total):
+    page = document.load_page(page_index)
+    label = f"Page {page_index + 1} of {page_total}"
+    label_width = fitz.get_text_length(label, fontname="helv", fontsize=8)
+    page.insert_text(
+      (page.rect.width - 40 - label_width, page.rect.height - 22),
+      label,
+      fontname="helv",
+      fontsize=8,
+      color=(0.2, 0.255, 0.333),
+    )
+
+
+def _merge_pdf_parts(parts: list[tuple[bytes, list[tuple[int, str, int]]]], *, include_toc: bool) -> bytes:
+  toc: list[list] = []
+
+  with open_pdf() as merged:
+    for content, outline in parts:
+      page_offset = merged.page_count
+      with open_pdf(stream=content, filetype="pdf") as part:
+        merged.insert_pdf(part)
+      toc.extend([1, title, page + page_offset] for _, title, page in sorted(outline))
+
+    _stamp_page_numbers(merged)
+    if include_toc and toc:
+      merged.set_toc(toc)
+    return merged.tobytes(garbage=3, deflate=True)
+
+
+def _chunk_cards(cards: list[tuple[int, ReportItem]], chunk_size: int) -> list[list[tuple[int, ReportItem]]]:
+  return [cards[start : start + chunk_size] for start in range(0, len(cards), chunk_size)]
+
+
+def _build_pdf(
+  payload: ExportRequest,
+  cards: list[ReportItem],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
+  *,
+  export_config: ExportConfig,
+  project_id: str | None = None,
+) -> bytes:
+  ordered_cards = list(enumerate(_ordered_cards(payload, cards), start=1))
+  now = _current_hong_kong_time()
+  snippet_options = _snippet_options(payload, project_id, export_config)
+
+  use_pool = export_config.pdf_workers > 1 and len(ordered_cards) >= export_config.pdf_parallel_min_cards
+  chunks = _chunk_cards(ordered_cards, export_config.pdf_chunk_size) if use_pool else []
+  if len(chunks) <= 1:
+    part = _render_pdf_part(
+      payload,
+      ordered_cards,
+      manual_review_history,
+      generated_at=now,
+      include_preamble=True,
+      has_cards=bool(ordered_cards),
+      snippet_options=snippet_options,
+    )
+    return _merge_pdf_parts([part], include_toc=payload.include_toc)
+
+  pool = _get_pdf_render_pool(export_config.pdf_workers)
+  try:
+    futures = [
+      pool.submit(
+        _render_pdf_chunk,
+        payload,
+        chunk,
+        {card.item_id: _history_for_item(manual_review_history, card.item_id) for _, card in chunk},
+        now,
+        chunk_index == 0,
+        snippet_options,
+      )
+      for chunk_index, chunk in enumerate(chunks)
+    ]
+    parts = [future.result() for future in futures]
+  except BrokenProcessPool:
+    logger.exception("PDF export render pool broke; rendering %d cards serially", len(ordered_cards))
+    _discard_pdf_render_pool(pool)
+    parts = [
+      _render_pdf_part(
+        payload,
+        ordered_cards,
+        manual_review_history,
+        generated_at=now,
+        include_preamble=True,
+        has_cards=bool(ordered_cards),
+        snippet_options=snippet_options,
+      )
+    ]
+  return _merge_pdf_parts(parts, include_toc=payload.include_toc)
+
+
+def _history_line(history_index: int, entry: ManualReviewHistoryEntry) -> str:
+  return (
+    f"{history_index}. Edited At (HKT): {_format_history_time(entry.edited_at)} | "
+    f"Verdict: {_format_optional_label(entry.manual_verdict)} | "
+    f"Category: {_format_optional_label(entry.manual_verdict_category)} | "
+    f"Note: {entry.manual_verdict_note or 'N/A'}"
+  )
+
+
+def _card_export_row(
+  index: int,
+  card: ReportItem,
+  history_entries: list[ManualReviewHistoryEntry],
+) -> tuple[object, ...]:
+  anchor_pages = sorted({anchor.page for anchor in card.anchors or []})
+  return (
+    index,
+    card.item_id,
+    _review_title(card.consistency_status, card.status_domain),
+    _status_label(card),
+    card.consistency_status,
+    card.status_domain,
+    card.raw_status or "",
+    card.check_type,
+    card.severity,
+    round(card.confidence_score, 4),
+    card.description,
+    card.reasoning,
+    card.evidence,
+    "; ".join(card.document_references),
+    "; ".join(card.keywords),
+    card.source_pack or "",
+    card.manual_verdict or "",
+    card.manual_verdict_category or "",
+    card.manual_verdict_note or "",
+    "; ".join(str(page) for page in anchor_pages),
+    len(history_entries),
+    "\n".join(_history_line(history_index, entry) for history_index, entry in enumerate(history_entries, start=1)),
+  )
+
+
+def _iter_export_rows(
+  payload: ExportRequest,
+  cards: list[ReportItem],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None,
+) -> Iterator[tuple[object, ...]]:
+  for index, card in enumerate(_ordered_cards(payload, cards), start=1):
+    yield _card_export_row(index, card, _history_for_item(manual_review_history, card.item_id))
+
+
+def _iter_csv_chunks(rows: Iterator[tuple[object, ...]]) -> Iterator[bytes]:
+  buffer = StringIO()
+  writer = csv.writer(buffer, lineterminator="\r\n")
+  writer.writerow(_TABULAR_EXPORT_COLUMNS)
+
+  for row in rows:
+    writer.writerow(row)
+    if buffer.tell() >= _STREAM_CHUNK_SIZE:
+      yield buffer.getvalue().encode("utf-8")
+      buffer.seek(0)
+      buffer.truncate()
+
+  if buffer.tell():
+    yield buffer.getvalue().encode("utf-8")
+
+
+def _iter_ndjson_chunks(rows: Iterator[tuple[object, ...]]) -> Iterator[bytes]:
+  pending: list[str] = []
+  pending_size = 0
+
+  for row in rows:
+    line = json.dumps(dict(zip(_TABULAR_EXPORT_COLUMNS, row)), ensure_ascii=False) + "\n"
+    pending.append(line)
+    pending_size += len(line)
+    if pending_size >= _STREAM_CHUNK_SIZE:
+      yield "".join(pending).encode("utf-8")
+      pending.clear()
+      pending_size = 0
+
+  if pending:
+    yield "".join(pending).encode("utf-8")
+
+
+def _xlsx_cell(value: object) -> object:
+  if not isinstance(value, str):
+    return value
+  return _XML_INVALID_CHARS_RE.sub("", value)[:_XLSX_CELL_MAX_LENGTH]
+
+
+def _iter_xlsx_chunks(rows: Iterator[tuple[object, ...]]) -> Iterator[bytes]:
+  # Write-only mode keeps one row in memory; the package itself spills to disk past the spool limit.
+  workbook = Workbook(write_only=True)
+  worksheet = workbook.create_sheet("Cards")
+  worksheet.append(_TABULAR_EXPORT_COLUMNS)
+  for row in rows:
+    worksheet.append([_xlsx_cell(value) for value in row])
+
+  with SpooledTemporaryFile(max_size=_XLSX_SPOOL_MAX_BYTES) as spool:
+    workbook.save(spool)
+    spool.seek(0)
+    while chunk := spool.read(_STREAM_CHUNK_SIZE):
+      yield chunk
+
+
+EXPORT_DURATION_SECONDS = histogram(
+  "export_duration_seconds",
+  "Time from export request to the last byte sent, by format.",
+  label_names=("format",),
+  buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+EXPORT_SIZE_BYTES = histogram(
+  "export_size_bytes",
+  "Bytes sent per export, by format.",
+  label_names=("format",),
+  buckets=DEFAULT_SIZE_BUCKETS,
+)
+
+
+def measure_export(export_format: str, chunks: Iterable[bytes], *, started: float) -> Iterator[bytes]:
+  """Pass `chunks` through and record the export's duration and size once the last one is sent."""
+  sent = 0
+  for chunk in chunks:
+    sent += len(chunk)
+    yield chunk
+  EXPORT_DURATION_SECONDS.observe(time.perf_counter() - started, format=export_format)
+  EXPORT_SIZE_BYTES.observe(sent, format=export_format)
+
+
+def stream_export_file(
+  payload: ExportRequest,
+  cards: list[ReportItem],
+  manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None = None,
+) -> tuple[str, str, Iterator[bytes]]:
+  if payload.format not in STREAMING_EXPORT_FORMATS:
+    raise ValueError(f"Export format is not streamable: {payload.format}")
+
+  safe_report_id = _sanitize_file_token(payload.report_id)
+  file_name = f"tender-analysis-{safe_report_id}.{payload.format}"
+  rows = _iter_export_rows(payload, cards, manual_review_history)
+
+  if payload.format == "csv":
+    return file_name, "text/csv; charset=utf-8", _iter_csv_chunks(rows)
+  if payload.format == "ndjson":
+    return file_name, "application/x-ndjson", _iter_ndjson_chunks(rows)
+  return file_name, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", _iter_xlsx_chunks(rows)
 
 
 def build_export_file(
   payload: ExportRequest,
   cards: list[ReportItem],
   manual_review_history: dict[str, list[ManualReviewHistoryEntry]] | None = None,
+  *,
+  export_config: ExportConfig | None = None,
+  project_id: str | None = None,
 ) -> tuple[str, str, bytes]:
+  config = export_config or get_export_config()
   safe_report_id = _sanitize_file_token(payload.report_id)
 
+  if payload.format in STREAMING_EXPORT_FORMATS:
+    file_name, media_type, chunks = stream_export_file(payload, cards, manual_review_history)
+    return file_name, media_type, b"".join(chunks)
+
   if payload.format == "pdf":
     media_type = "application/pdf"
     file_name = f"tender-analysis-{safe_report_id}.pdf"
-    content = _build_pdf(payload, cards, manual_review_history)
+    content = _build_pdf(
+      payload,
+      cards,
+      manual_review_history,
+      export_config=config,
+      project_id=project_id,
+    )
   else:
     media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     file_name = f"tender-analysis-{safe_report_id}.docx"
-    content = _build_docx(payload, cards, manual_review_history)
+    if config.docx_writer == "python-docx":
+      content = _build_docx(payload, cards, manual_review_history)
+    else:
+      content = _build_docx_from_template(payload, cards, manual_review_history)
 
   return file_name, media_type, content
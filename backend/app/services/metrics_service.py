@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from app.core.metrics import MetricFamily, render_prometheus
+from app.services.pdf_locator_service import get_index_cache_stats
+from app.services.project_service import get_config_cache_metrics
+from app.services.report_service import get_report_store_stats
+
+
+def _index_cache_families() -> list[MetricFamily]:
+  stats = get_index_cache_stats()
+  lookups = stats.hits + stats.disk_hits + stats.misses
+  return [
+    MetricFamily("locator_index_documents", "Documents with a cached locator index.", "gauge").add(stats.documents),
+    MetricFamily("locator_index_lines", "Text lines held across cached locator indexes.", "gauge").add(stats.lines),
+    MetricFamily("locator_index_bytes", "Estimated size of the cached locator indexes.", "gauge").add(stats.bytes),
+    MetricFamily("locator_index_max_bytes", "Memory budget of the locator index cache.", "gauge").add(stats.max_bytes),
+    MetricFamily("locator_index_lookups_total", "Locator index lookups by result.", "counter")
+    .add(stats.hits, result="hit")
+    .add(stats.disk_hits, result="disk")
+    .add(stats.misses, result="miss"),
+    MetricFamily("locator_index_hit_ratio", "Share of locator index lookups served from memory.", "gauge").add(
+      stats.hits / lookups if lookups else 0.0
+    ),
+    MetricFamily("locator_index_evictions_total", "Locator indexes evicted to stay within budget.", "counter").add(
+      stats.evictions
+    ),
+    MetricFamily("locator_index_spills_total", "Evicted locator indexes written to the spill directory.", "counter").add(
+      stats.spills
+    ),
+    MetricFamily("locator_index_spill_bytes", "Size of the locator index spill directory.", "gauge").add(
+      stats.spill_bytes
+    ),
+  ]
+
+
+def _report_store_families() -> list[MetricFamily]:
+  stats = get_report_store_stats()
+  return [
+    MetricFamily("report_store_reports", "Ingested reports held in memory.", "gauge").add(stats.reports),
+    MetricFamily("report_store_cards", "Report cards held in memory across all reports.", "gauge").add(stats.cards),
+    MetricFamily("report_store_history_entries", "Manual review history entries held in memory.", "gauge").add(
+      stats.history_entries
+    ),
+    MetricFamily("report_store_seed_items", "Normalized seed items cached per source pack.", "gauge").add(
+      stats.seed_items
+    ),
+  ]
+
+
+def _config_cache_families() -> list[MetricFamily]:
+  metrics = get_config_cache_metrics()
+  loads = MetricFamily("config_cache_loads_total", "Registry and artifact file loads by kind.", "counter")
+  loads.add(metrics.registry_loads, kind="registry")
+  loads.add(metrics.artifact_loads, kind="artifact")
+  loads.add(metrics.artifact_reloads, kind="artifact_reload")
+  projects = MetricFamily("config_cache_project_lookups_total", "Project config lookups by result.", "counter")
+  projects.add(metrics.project_builds, result="build")
+  projects.add(metrics.project_rebuilds, result="rebuild")
+  projects.add(metrics.project_cache_hits, result="hit")
+  return [
+    loads,
+    MetricFamily("config_cache_artifact_hits_total", "Artifact reads served without reloading.", "counter").add(
+      metrics.artifact_cache_hits
+    ),
+    projects,
+    MetricFamily("config_cache_projects", "Projects with a built config entry.", "gauge").add(
+      len(metrics.cached_projects)
+    ),
+  ]
+
+
+def render_metrics(extra: list[MetricFamily] | None = None) -> str:
+  """Registered metrics plus cache and store sizes read at scrape time, as Prometheus text."""
+  families = [*_index_cache_families(), *_report_store_families(), *_config_cache_families()]
+  return render_prometheus([*families, *(extra or [])])
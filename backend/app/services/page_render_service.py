@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import fitz
+
+from app.core.config import PageRenderConfig, get_page_render_config
+from app.core.errors import ApiError
+from app.core.metrics import register_executor
+from app.core.pdf import open_pdf
+from app.core.single_flight import SingleFlight
+from app.services.document_service import get_document_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PageImage:
+  png: bytes
+  cache_key: str
+
+
+class PageImageDiskCache:
+  """PNG store on disk, evicted least-recently-used once the directory exceeds `max_bytes`.
+
+  The LRU order is seeded from file mtimes on first use and refreshed on every hit, so the
+  budget survives restarts without a separate manifest.
+  """
+
+  def __init__(self, directory: Path, *, max_bytes: int) -> None:
+    self._directory = directory
+    self._max_bytes = max_bytes
+    self._entries: OrderedDict[str, int] | None = None
+    self._bytes = 0
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+
+  @property
+  def cached_bytes(self) -> int:
+    return self._bytes
+
+  def _path(self, key: str) -> Path:
+    return self._directory / f"{key}.png"
+
+  def _load_entries(self) -> OrderedDict[str, int]:
+    if self._entries is not None:
+      return self._entries
+
+    self._directory.mkdir(parents=True, exist_ok=True)
+    existing = sorted(
+      (entry.stat().st_mtime_ns, entry.stem, entry.stat().st_size)
+      for entry in self._directory.glob("*.png")
+    )
+    self._entries = OrderedDict((stem, size) for _, stem, size in existing)
+    self._bytes = sum(self._entries.values())
+    return self._entries
+
+  def __contains__(self, key: str) -> bool:
+    with self._lock:
+      return key in self._load_entries()
+
+  def get(self, key: str) -> bytes | None:
+    with self._lock:
+      entries = self._load_entries()
+      if key not in entries:
+        self.misses += 1
+        return None
+
+      path = self._path(key)
+      try:
+        data = path.read_bytes()
+      except FileNotFoundError:
+        self._bytes -= entries.pop(key)
+        self.misses += 1
+        return None
+
+      entries.move_to_end(key)
+      self.hits += 1
+    try:
+      os.utime(path)
+    except OSError:
+      pass
+    return data
+
+  def put(self, key: str, data: bytes) -> None:
+    path = self._path(key)
+    with self._lock:
+      entries = self._load_entries()
+      temp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+      temp_path.write_bytes(data)
+      os.replace(temp_path, path)
+
+      self._bytes -= entries.pop(key, 0)
+      entries[key] = len(data)
+      self._bytes += len(data)
+      while self._bytes > self._max_bytes and len(entries) > 1:
+        evicted_key, evicted_size = entries.popitem(last=False)
+        self._bytes -= evicted_size
+        self._path(evicted_key).unlink(missing_ok=True)
+
+
+_PAGE_IMAGE_CACHES: dict[Path, PageImageDiskCache] = {}
+_PREWARM_POOL: ThreadPoolExecutor | None = None
+_PAGE_RENDER_LOCK = threading.Lock()
+_RENDER_FLIGHTS: SingleFlight[bytes] = SingleFlight("page_render")
+
+
+def get_page_image_cache(config: PageRenderConfig | None = None) -> PageImageDiskCache:
+  active_config = config or get_page_render_config()
+  with _PAGE_RENDER_LOCK:
+    cache = _PAGE_IMAGE_CACHES.get(active_config.cache_dir)
+    if cache is None:
+      cache = PageImageDiskCache(active_config.cache_dir, max_bytes=active_config.cache_max_bytes)
+      _PAGE_IMAGE_CACHES[active_config.cache_dir] = cache
+    return cache
+
+
+def _normalize_scale(scale: float | None, config: PageRenderConfig) -> float:
+  if scale is None:
+    return config.default_scale
+  return round(max(0.1, min(config.max_scale, scale)), 2)
+
+
+def _page_cache_key(pdf_path: Path, page: int, scale: float) -> str:
+  return f"{get_document_fingerprint(pdf_path).sha256}-p{page}-s{scale:.2f}"
+
+
+def page_image_cache_key(
+  pdf_path: Path,
+  page: int,
+  *,
+  scale: float | None = None,
+  config: PageRenderConfig | None = None,
+) -> str:
+  """Validator for a page render, known without reading or rendering the image."""
+  active_config = config or get_page_render_config()
+  return _page_cache_key(pdf_path, page, _normalize_scale(scale, active_config))
+
+
+def page_tile_cache_key(
+  pdf_path: Path,
+  page: int,
+  tile_x: int,
+  tile_y: int,
+  *,
+  scale: float | None = None,
+  config: PageRenderConfig | None = None,
+) -> str:
+  active_config = config or get_page_render_config()
+  page_key = _page_cache_key(pdf_path, page, _normalize_scale(scale, active_config))
+  return f"{page_key}-t{active_config.tile_size}-{tile_x}-{tile_y}"
+
+
+def _load_page(document: fitz.Document, page: int) -> fitz.Page:
+  if page < 1 or page > document.page_count:
+    raise ApiError(
+      status_code=404,
+      code="NOT_FOUND",
+      message=f"Page {page} out of range (1-{document.page_count})",
+    )
+  return document.load_page(page - 1)
+
+
+def _render_page_png(pdf_path: Path, page: int, scale: float, clip: fitz.Rect | None = None) -> bytes:
+  with open_pdf(pdf_path) as document:
+    pdf_page = _load_page(document, page)
+    pixmap = pdf_page.get_pixmap(matrix=fitz.Matrix(scale, scale), clip=clip, alpha=False)
+    return pixmap.tobytes("png")
+
+
+def get_page_image(
+  pdf_path: Path,
+  page: int,
+  *,
+  scale: float | None = None,
+  config: PageRenderConfig | None = None,
+) -> PageImage:
+  active_config = config or get_page_render_config()
+  normalized_scale = _normalize_scale(scale, active_config)
+  cache = get_page_image_cache(active_config)
+  cache_key = page_image_cache_key(pdf_path, page, scale=scale, config=active_config)
+
+  cached = cache.get(cache_key)
+  if cached is not None:
+    return PageImage(png=cached, cache_key=cache_key)
+
+  def render() -> bytes:
+    if cache_key in cache and (cached := cache.get(cache_key)) is not None:
+      return cached
+    png = _render_page_png(pdf_path, page, normalized_scale)
+    cache.put(cache_key, png)
+    return png
+
+  return PageImage(png=_RENDER_FLIGHTS.do(cache_key, render), cache_key=cache_key)
+
+
+def get_page_tile(
+  pdf_path: Path,
+  page: int,
+  tile_x: int,
+  tile_y: int,
+  *,
+  scale: float | None = None,
+  config: PageRenderConfig | None = None,
+) -> PageImage:
+  """Render one `tile_size`-pixel square of a page at `scale`, counted from the top-left corner."""
+  active_config = config or get_page_render_config()
+  normalized_scale = _normalize_scale(scale, active_config)
+  tile_size = active_config.tile_size
+  cache = get_page_image_cache(active_config)
+  cache_key = page_tile_cache_key(pdf_path, page, tile_x, tile_y, scale=scale, config=active_config)
+
+  cached = cache.get(cache_key)
+  if cached is not None:
+    return PageImage(png=cached, cache_key=cache_key)
+
+  def render() -> bytes:
+    if cache_key in cache and (cached := cache.get(cache_key)) is not None:
+      return cached
+    with open_pdf(pdf_path) as document:
+      page_rect = _load_page(document, page).rect
+    tile_points = tile_size / normalized_scale
+    clip = fitz.Rect(
+      page_rect.x0 + tile_x * tile_points,
+      page_rect.y0 + tile_y * tile_points,
+      page_rect.x0 + (tile_x + 1) * tile_points,
+      page_rect.y0 + (tile_y + 1) * tile_points,
+    ) & page_rect
+    if tile_x < 0 or tile_y < 0 or clip.is_empty:
+      raise ApiError(
+        status_code=404,
+        code="NOT_FOUND",
+        message=f"Tile {tile_x},{tile_y} out of range for page {page} at scale {normalized_scale}",
+      )
+
+    png = _render_page_png(pdf_path, page, normalized_scale, clip)
+    cache.put(cache_key, png)
+    return png
+
+  return PageImage(png=_RENDER_FLIGHTS.do(cache_key, render), cache_key=cache_key)
+
+
+def _prewarm_pages(pdf_path: Path, page: int, config: PageRenderConfig) -> None:
+  try:
+    with open_pdf(pdf_path) as document:
+      page_count = document.page_count
+    cache = get_page_image_cache(config)
+    scale = _normalize_scale(None, config)
+    for candidate in range(max(1, page - config.prewarm_radius), min(page_count, page + config.prewarm_radius) + 1):
+      if _page_cache_key(pdf_path, candidate, scale) not in cache:
+        get_page_image(pdf_path, candidate, config=config)
+  except Exception:
+    logger.exception("Page prewarm failed for %s", pdf_path)
+
+
+def schedule_page_prewarm(
+  pdf_path: Path,
+  page: int,
+  *,
+  config: PageRenderConfig | None = None,
+) -> Future[None] | None:
+  """Render the default-scale images for `page` and its neighbours in the background.
+
+  Only the submission happens on the caller's thread; opening the PDF, fingerprinting it and
+  rendering all run on the prewarm pool, and failures there are logged rather than raised.
+  """
+  global _PREWARM_POOL
+  active_config = config or get_page_render_config()
+  if active_config.prewarm_workers <= 0:
+    return None
+
+  with _PAGE_RENDER_LOCK:
+    if _PREWARM_POOL is None:
+      _PREWARM_POOL = ThreadPoolExecutor(
+        max_workers=active_config.prewarm_workers,
+        thread_name_prefix="page-prewarm",
+      )
+      register_executor("page-prewarm", _PREWARM_POOL)
+    pool = _PREWARM_POOL
+  return pool.submit(_prewarm_pages, pdf_path, page, active_config)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.errors import ApiError
+from app.core.pdf import open_pdf
+from app.services.document_service import get_document_fingerprint
+from app.services.pdf_locator_service import get_page_lines
+
+PAGE_TEXT_LINE_FIELDS = ("x0", "y0", "x1", "y1", "block", "line", "text")
+
+
+@dataclass(frozen=True, slots=True)
+class PageTextLayer:
+  payload: bytes
+  cache_key: str
+
+
+def page_text_cache_key(pdf_path: Path, page: int) -> str:
+  """Validator for a page's text layer, known without opening the PDF or loading its lines."""
+  return f"{get_document_fingerprint(pdf_path).sha256}-p{page}-text"
+
+
+def get_page_text_layer(pdf_path: Path, page: int) -> PageTextLayer:
+  """Serialize the locator's cached lines for one page as compact JSON.
+
+  Each line is a positional array ordered like `PAGE_TEXT_LINE_FIELDS`, with bbox coordinates
+  in PDF points rounded to two decimals, so the payload stays close to the raw text size.
+  """
+  with open_pdf(pdf_path) as document:
+    if page < 1 or page > document.page_count:
+      raise ApiError(
+        status_code=404,
+        code="NOT_FOUND",
+        message=f"Page {page} out of range (1-{document.page_count})",
+      )
+    page_rect = document.load_page(page - 1).rect
+
+  lines = [
+    [
+      round(line.bbox[0], 2),
+      round(line.bbox[1], 2),
+      round(line.bbox[2], 2),
+      round(line.bbox[3], 2),
+      line.block_index,
+      line.line_index,
+      line.text,
+    ]
+    for line in get_page_lines(pdf_path, page)
+  ]
+  payload = {
+    "page": page,
+    "width": round(page_rect.width, 2),
+    "height": round(page_rect.height, 2),
+    "fields": PAGE_TEXT_LINE_FIELDS,
+    "lines": lines,
+  }
+
+  return PageTextLayer(
+    payload=json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+    cache_key=page_text_cache_key(pdf_path, page),
+  )
@@ -1,17 +1,41 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 import heapq
+import logging
+import multiprocessing
+import os
 import re
+import struct
+import sys
 import threading
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
 
 import fitz
 from rapidfuzz import fuzz
 
-from app.core.config import EvidenceResolveConfig, get_evidence_resolve_config
+from app.core.config import (
+  EvidenceResolveConfig,
+  LocatorIndexBuildConfig,
+  get_evidence_resolve_config,
+  get_locator_index_build_config,
+  get_locator_index_cache_config,
+)
+from app.core.metrics import counter, register_executor, unregister_executor
+from app.core.pdf import open_pdf
+from app.core.single_flight import SingleFlight
+from app.core.timing import stage
 
 
+logger = logging.getLogger(__name__)
+
 _SPACE_RE = re.compile(r"\s+")
 _CLAUSE_RE = re.compile(r"(?:Clause\s*)?(\d{1,3})(?:\.\d+)?", re.IGNORECASE)
 _DOUBLE_QUOTE_RE = re.compile(r'"([^"]{20,})"')
@@ -99,10 +123,532 @@ class ScoredCandidate:
   content_query: str | None
 
 
-_INDEX_CACHE: dict[str, tuple[int, list[IndexedLine]]] = {}
+@dataclass(frozen=True, slots=True)
+class PreparedQuery:
+  text: str
+  normalized: str
+  tokens: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class TextSpan:
+  """A match in `DocumentIndex.text`, with the positions of the first and last lines it covers."""
+
+  start: int
+  end: int
+  first_line: int
+  last_line: int
+
+
+_INDEX_MAGIC = b"LIX1"
+# Magic, array('I') item size, then the byte length of each column and buffer in `to_bytes` order.
+_INDEX_HEADER = "<4sB8Q"
+# Measured size of the token postings and block lookup per line, which `estimated_bytes` adds up front.
+_LOOKUP_BYTES_PER_LINE = 160
+
+
+class DocumentIndex(Sequence[IndexedLine]):
+  """The indexed lines of one document, stored column-wise.
+
+  Page, block and line numbers live in `array('I')` columns and bboxes in one `array('d')`, four
+  values per line. Raw texts are concatenated into one UTF-8 buffer with byte offsets. `text` joins
+  every line's normalized text with single spaces, which is the normalized text of the whole
+  document, so a substring or regex search over it also finds matches that run across line
+  breaks; `line_starts` maps buffer offsets back to lines. Indexing returns an `IndexedLine` built
+  on access, so only the lines in use exist as objects. `token_postings` and the block and page
+  lookups are built on first use.
+  """
+
+  def __init__(self, lines: Iterable[IndexedLine]) -> None:
+    pages = array("I")
+    block_indexes = array("I")
+    line_indexes = array("I")
+    bboxes = array("d")
+    raw_starts = array("I")
+    line_starts = array("I")
+    raw_parts: list[bytes] = []
+    normalized_parts: list[str] = []
+    raw_offset = 0
+    normalized_offset = 0
+    for line in lines:
+      pages.append(line.page)
+      block_indexes.append(line.block_index)
+      line_indexes.append(line.line_index)
+      bboxes.extend(line.bbox)
+      raw = line.text.encode("utf-8")
+      raw_starts.append(raw_offset)
+      raw_offset += len(raw)
+      raw_parts.append(raw)
+      line_starts.append(normalized_offset)
+      normalized_offset += len(line.normalized) + 1
+      normalized_parts.append(line.normalized)
+    raw_starts.append(raw_offset)
+
+    self._pages = pages
+    self._block_indexes = block_indexes
+    self._line_indexes = line_indexes
+    self._bboxes = bboxes
+    self._raw_text = b"".join(raw_parts)
+    self._raw_starts = raw_starts
+    self._text = " ".join(normalized_parts)
+    self._line_starts = line_starts
+    self._token_postings: dict[str, array[int]] | None = None
+    self._block_positions: dict[tuple[int, int], list[int]] | None = None
+
+  @classmethod
+  def from_bytes(cls, data: bytes) -> DocumentIndex:
+    """Rebuild an index written by `to_bytes`; raises ValueError for data from another layout."""
+    header_size = struct.calcsize(_INDEX_HEADER)
+    if len(data) < header_size:
+      raise ValueError("truncated index data")
+    magic, itemsize, *lengths = struct.unpack_from(_INDEX_HEADER, data)
+    if magic != _INDEX_MAGIC or itemsize != array("I").itemsize or header_size + sum(lengths) != len(data):
+      raise ValueError("unsupported index data")
+
+    parts: list[bytes] = []
+    offset = header_size
+    for length in lengths:
+      parts.append(data[offset : offset + length])
+      offset += length
+
+    index = cls(())
+    columns = (index._pages, index._block_indexes, index._line_indexes, index._bboxes, index._raw_starts, index._line_starts)
+    for column, part in zip(columns, parts):
+      del column[:]
+      column.frombytes(part)
+    index._raw_text = parts[6]
+    index._text = parts[7].decode("utf-8")
+    return index
+
+  def to_bytes(self) -> bytes:
+    parts = [
+      self._pages.tobytes(),
+      self._block_indexes.tobytes(),
+      self._line_indexes.tobytes(),
+      self._bboxes.tobytes(),
+      self._raw_starts.tobytes(),
+      self._line_starts.tobytes(),
+      self._raw_text,
+      self._text.encode("utf-8"),
+    ]
+    header = struct.pack(_INDEX_HEADER, _INDEX_MAGIC, array("I").itemsize, *(len(part) for part in parts))
+    return b"".join([header, *parts])
+
+  @property
+  def estimated_bytes(self) -> int:
+    """Resident size of the columns and text buffers, plus an allowance for lookups built on first use."""
+    columns = (self._pages, self._block_indexes, self._line_indexes, self._bboxes, self._raw_starts, self._line_starts)
+    return (
+      sum(sys.getsizeof(column) for column in columns)
+      + sys.getsizeof(self._raw_text)
+      + sys.getsizeof(self._text)
+      + len(self) * _LOOKUP_BYTES_PER_LINE
+    )
+
+  def __len__(self) -> int:
+    return len(self._pages)
+
+  def __getitem__(self, position):  # type: ignore[override]
+    if isinstance(position, slice):
+      return [self._line(item) for item in range(*position.indices(len(self)))]
+    if position < 0:
+      position += len(self)
+    if not 0 <= position < len(self):
+      raise IndexError("DocumentIndex index out of range")
+    return self._line(position)
+
+  def __iter__(self) -> Iterator[IndexedLine]:
+    for position in range(len(self)):
+      yield self._line(position)
+
+  def _line(self, position: int) -> IndexedLine:
+    bbox_start = position * 4
+    return IndexedLine(
+      page=self._pages[position],
+      text=self._raw_text[self._raw_starts[position] : self._raw_starts[position + 1]].decode("utf-8"),
+      normalized=self.normalized_at(position),
+      bbox=tuple(self._bboxes[bbox_start : bbox_start + 4]),  # type: ignore[arg-type]
+      block_index=self._block_indexes[position],
+      line_index=self._line_indexes[position],
+    )
+
+  def _line_end(self, position: int) -> int:
+    return self._line_starts[position + 1] - 1 if position + 1 < len(self) else len(self._text)
+
+  def normalized_at(self, position: int) -> str:
+    return self._text[self._line_starts[position] : self._line_end(position)]
+
+  def page_at(self, position: int) -> int:
+    return self._pages[position]
+
+  @property
+  def text(self) -> str:
+    return self._text
+
+  @property
+  def line_starts(self) -> array[int]:
+    return self._line_starts
+
+  def line_at(self, offset: int) -> int:
+    """Position of the line that holds buffer `offset`; a separator belongs to the line before it."""
+    return bisect.bisect_right(self._line_starts, offset) - 1
+
+  def _span(self, start: int, end: int) -> TextSpan:
+    return TextSpan(start=start, end=end, first_line=self.line_at(start), last_line=self.line_at(max(start, end - 1)))
+
+  def find_line_matches(self, needle: str) -> list[int]:
+    """Positions of the lines whose normalized text contains `needle`, in document order."""
+    text, starts = self._text, self._line_starts
+    positions: list[int] = []
+    if not needle:
+      return positions
+
+    offset = text.find(needle)
+    while offset >= 0:
+      position = bisect.bisect_right(starts, offset) - 1
+      if offset + len(needle) <= self._line_end(position):
+        positions.append(position)
+        # Resume after this line; one hit per line is enough.
+        offset = text.find(needle, starts[position + 1]) if position + 1 < len(starts) else -1
+      else:
+        offset = text.find(needle, offset + 1)
+    return positions
+
+  def find_spans(self, needle: str) -> list[TextSpan]:
+    """Non-overlapping occurrences of `needle` in `text`, including ones that cross lines."""
+    text = self._text
+    spans: list[TextSpan] = []
+    if not needle:
+      return spans
+
+    offset = text.find(needle)
+    while offset >= 0:
+      spans.append(self._span(offset, offset + len(needle)))
+      offset = text.find(needle, offset + len(needle))
+    return spans
+
+  def search(self, pattern: str | re.Pattern[str], flags: int = 0) -> list[TextSpan]:
+    """Non-empty matches of a regex over `text`. Patterns see normalized (lowercase) text."""
+    compiled = re.compile(pattern, flags) if isinstance(pattern, str) else pattern
+    return [self._span(match.start(), match.end()) for match in compiled.finditer(self._text) if match.end() > match.start()]
+
+  def span_lines(self, span: TextSpan) -> list[IndexedLine]:
+    return self[span.first_line : span.last_line + 1]
+
+  @property
+  def token_postings(self) -> dict[str, array[int]]:
+    if self._token_postings is None:
+      postings: dict[str, array[int]] = {}
+      for position in range(len(self)):
+        for token in set(self.normalized_at(position).split()):
+          positions = postings.get(token)
+          if positions is None:
+            positions = postings[token] = array("I")
+          positions.append(position)
+      self._token_postings = postings
+    return self._token_postings
+
+  def _ordered_positions(self) -> dict[tuple[int, int], list[int]] | None:
+    """None when lines are in (page, block) order, as extraction emits them; a lookup table otherwise."""
+    if self._block_positions is None:
+      keys = list(zip(self._pages, self._block_indexes))
+      if all(previous <= current for previous, current in zip(keys, keys[1:])):
+        self._block_positions = {}
+      else:
+        block_positions: dict[tuple[int, int], list[int]] = {}
+        for position, key in enumerate(keys):
+          block_positions.setdefault(key, []).append(position)
+        self._block_positions = block_positions
+    return self._block_positions or None
+
+  def _page_range(self, page: int) -> tuple[int, int]:
+    return bisect.bisect_left(self._pages, page), bisect.bisect_right(self._pages, page)
+
+  def block_lines(self, page: int, block_index: int) -> list[IndexedLine]:
+    """Lines of one text block, ordered by line number."""
+    lookup = self._ordered_positions()
+    if lookup is None:
+      low, high = self._page_range(page)
+      positions: Iterable[int] = range(
+        bisect.bisect_left(self._block_indexes, block_index, low, high),
+        bisect.bisect_right(self._block_indexes, block_index, low, high),
+      )
+    else:
+      positions = lookup.get((page, block_index), ())
+    return sorted((self._line(position) for position in positions), key=lambda line: line.line_index)
+
+  def page_lines(self, page: int) -> list[IndexedLine]:
+    """Lines of one page, in extraction order."""
+    lookup = self._ordered_positions()
+    if lookup is None:
+      return self[slice(*self._page_range(page))]
+    return [self._line(position) for position in sorted(
+      position for key, positions in lookup.items() if key[0] == page for position in positions
+    )]
+
+
+def _as_document_index(index: Sequence[IndexedLine]) -> DocumentIndex:
+  return index if isinstance(index, DocumentIndex) else DocumentIndex(list(index))
+
+
+LOCATOR_STAGE_RESULTS = counter(
+  "locator_stage_results_total",
+  "Locate calls by the pipeline stage that produced the result.",
+  label_names=("stage",),
+)
+LOCATOR_STAGE_LINES = counter(
+  "locator_stage_lines_total",
+  "Lines handled by each locator stage: exact hits, overlap survivors and pruned lines, fuzzy-scored lines.",
+  label_names=("stage",),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class IndexCacheStats:
+  documents: int
+  lines: int
+  bytes: int
+  max_bytes: int
+  hits: int
+  disk_hits: int
+  misses: int
+  evictions: int
+  spills: int
+  spill_bytes: int
+  spill_max_bytes: int | None
+
+
+class IndexCache:
+  """Document indexes in LRU order, bounded by their estimated size.
+
+  Once `max_bytes` is exceeded the least recently used entries are evicted. With a spill
+  directory, an evicted index is written there and read back on its next lookup instead of
+  re-parsing the PDF. Entries whose file has changed are dropped when looked up. Spilled files
+  beyond `spill_max_bytes` are pruned least recently used first, seeded from their mtimes.
+  """
+
+  def __init__(
+    self,
+    *,
+    max_bytes: int,
+    spill_dir: Path | None = None,
+    spill_max_bytes: int | None = None,
+  ) -> None:
+    self._max_bytes = max_bytes
+    self._spill_dir = spill_dir
+    self._spill_max_bytes = spill_max_bytes
+    self._entries: OrderedDict[str, tuple[int, DocumentIndex, int]] = OrderedDict()
+    self._bytes = 0
+    self._spilled: OrderedDict[str, int] | None = None
+    self._spill_bytes = 0
+    self._lock = threading.Lock()
+    self.hits = 0
+    self.disk_hits = 0
+    self.misses = 0
+    self.evictions = 0
+    self.spills = 0
+
+  def _spill_path(self, key: str) -> Path | None:
+    if self._spill_dir is None:
+      return None
+    return self._spill_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.idx"
+
+  def _spilled_locked(self) -> OrderedDict[str, int]:
+    if self._spilled is not None:
+      return self._spilled
+
+    existing = []
+    if self._spill_dir is not None and self._spill_dir.is_dir():
+      for entry in self._spill_dir.glob("*.idx"):
+        try:
+          stat = entry.stat()
+        except OSError:
+          continue
+        existing.append((stat.st_mtime_ns, entry.name, stat.st_size))
+    self._spilled = OrderedDict((name, size) for _, name, size in sorted(existing))
+    self._spill_bytes = sum(self._spilled.values())
+    return self._spilled
+
+  def _forget_spill(self, path: Path) -> None:
+    with self._lock:
+      self._spill_bytes -= self._spilled_locked().pop(path.name, 0)
+    path.unlink(missing_ok=True)
+
+  def _record_spill(self, path: Path, size: int) -> None:
+    pruned: list[Path] = []
+    with self._lock:
+      spilled = self._spilled_locked()
+      self._spill_bytes -= spilled.pop(path.name, 0)
+      spilled[path.name] = size
+      self._spill_bytes += size
+      while self._spill_max_bytes is not None and self._spill_bytes > self._spill_max_bytes and len(spilled) > 1:
+        pruned_name, pruned_size = spilled.popitem(last=False)
+        self._spill_bytes -= pruned_size
+        pruned.append(path.with_name(pruned_name))
+    for pruned_path in pruned:
+      pruned_path.unlink(missing_ok=True)
+
+  def _read_spill(self, key: str, mtime_ns: int) -> DocumentIndex | None:
+    path = self._spill_path(key)
+    if path is None:
+      return None
+    try:
+      data = path.read_bytes()
+    except OSError:
+      return None
+
+    key_bytes = key.encode("utf-8")
+    prefix = struct.pack("<QI", mtime_ns, len(key_bytes)) + key_bytes
+    if data.startswith(prefix):
+      try:
+        index = DocumentIndex.from_bytes(data[len(prefix) :])
+      except ValueError:
+        pass
+      else:
+        with self._lock:
+          spilled = self._spilled_locked()
+          if path.name in spilled:
+            spilled.move_to_end(path.name)
+        try:
+          os.utime(path)
+        except OSError:
+          pass
+        return index
+    # Written for an older version of the file, or by an incompatible build.
+    self._forget_spill(path)
+    return None
+
+  def _write_spill(self, key: str, mtime_ns: int, index: DocumentIndex) -> bool:
+    path = self._spill_path(key)
+    if path is None:
+      return False
+    key_bytes = key.encode("utf-8")
+    prefix = struct.pack("<QI", mtime_ns, len(key_bytes)) + key_bytes
+    try:
+      with path.open("rb") as existing:
+        if existing.read(len(prefix)) == prefix:
+          return False
+    except OSError:
+      pass
+
+    try:
+      path.parent.mkdir(parents=True, exist_ok=True)
+      temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+      data = prefix + index.to_bytes()
+      temp_path.write_bytes(data)
+      os.replace(temp_path, path)
+    except OSError:
+      return False
+    self._record_spill(path, len(data))
+    return True
+
+  def _pop(self, key: str) -> bool:
+    cached = self._entries.pop(key, None)
+    if cached is None:
+      return False
+    self._bytes -= cached[2]
+    return True
+
+  def get(self, key: str, mtime_ns: int, *, record: bool = True) -> DocumentIndex | None:
+    """Cached index for `key` at `mtime_ns`; `record=False` leaves the hit and miss counters alone."""
+    with self._lock:
+      cached = self._entries.get(key)
+      if cached is not None:
+        if cached[0] == mtime_ns:
+          self._entries.move_to_end(key)
+          self.hits += record
+          return cached[1]
+        self._pop(key)
+
+    index = self._read_spill(key, mtime_ns)
+    with self._lock:
+      if index is None:
+        self.misses += record
+        return None
+      self.disk_hits += record
+    self.put(key, mtime_ns, index)
+    return index
+
+  def put(self, key: str, mtime_ns: int, index: DocumentIndex) -> None:
+    size = index.estimated_bytes
+    evicted: list[tuple[str, int, DocumentIndex]] = []
+    with self._lock:
+      self._pop(key)
+      self._entries[key] = (mtime_ns, index, size)
+      self._bytes += size
+      while self._bytes > self._max_bytes and len(self._entries) > 1:
+        evicted_key, (evicted_mtime, evicted_index, evicted_size) = self._entries.popitem(last=False)
+        self._bytes -= evicted_size
+        self.evictions += 1
+        evicted.append((evicted_key, evicted_mtime, evicted_index))
+
+    for evicted_key, evicted_mtime, evicted_index in evicted:
+      if self._write_spill(evicted_key, evicted_mtime, evicted_index):
+        with self._lock:
+          self.spills += 1
+
+  def invalidate(self, key: str | None = None) -> int:
+    """Drop one document's index, or every index, from memory and the spill directory.
+
+    Returns how many in-memory indexes were dropped.
+    """
+    with self._lock:
+      if key is None:
+        dropped = len(self._entries)
+        self._entries.clear()
+        self._bytes = 0
+      else:
+        dropped = int(self._pop(key))
+
+    if self._spill_dir is not None:
+      if key is None:
+        spilled = list(self._spill_dir.glob("*.idx")) if self._spill_dir.is_dir() else []
+      else:
+        spilled = [path] if (path := self._spill_path(key)) is not None else []
+      for path in spilled:
+        self._forget_spill(path)
+    return dropped
+
+  def stats(self) -> IndexCacheStats:
+    with self._lock:
+      self._spilled_locked()
+      return IndexCacheStats(
+        documents=len(self._entries),
+        lines=sum(len(index) for _, index, _ in self._entries.values()),
+        bytes=self._bytes,
+        max_bytes=self._max_bytes,
+        hits=self.hits,
+        disk_hits=self.disk_hits,
+        misses=self.misses,
+        evictions=self.evictions,
+        spills=self.spills,
+        spill_bytes=self._spill_bytes,
+        spill_max_bytes=self._spill_max_bytes,
+      )
+
+
+_INDEX_BUILD_POOL: ProcessPoolExecutor | None = None
+_INDEX_BUILD_POOL_WORKERS = 0
+_INDEX_BUILD_POOL_LOCK = threading.Lock()
+
+_INDEX_CACHE: IndexCache | None = None
+_INDEX_BUILDS: SingleFlight[DocumentIndex] = SingleFlight("locator_index")
 _CACHE_LOCK = threading.Lock()
 
 
+def _index_cache() -> IndexCache:
+  global _INDEX_CACHE
+  with _CACHE_LOCK:
+    if _INDEX_CACHE is None:
+      config = get_locator_index_cache_config()
+      _INDEX_CACHE = IndexCache(
+        max_bytes=config.max_bytes,
+        spill_dir=config.spill_dir if config.spill_enabled else None,
+        spill_max_bytes=config.spill_max_bytes,
+      )
+    return _INDEX_CACHE
+
+
 def _normalize_text(text: str) -> str:
   return _SPACE_RE.sub(" ", text).strip().lower()
 
@@ -135,61 +681,142 @@ def _line_bbox(spans: list[dict]) -> tuple[float, float, float, float] | None:
   return (x0, y0, x1, y1)
 
 
-def _build_index(pdf_path: Path) -> list[IndexedLine]:
-  entries: list[IndexedLine] = []
+def _iter_index_lines(document: fitz.Document, page_indexes: Iterable[int] | None = None) -> Iterator[IndexedLine]:
+  for page_index in range(document.page_count) if page_indexes is None else page_indexes:
+    page = document.load_page(page_index)
+    blocks = page.get_text("dict").get("blocks", [])
+
+    for block_index, block in enumerate(blocks):
+      if block.get("type") != 0:
+        continue
 
-  with fitz.open(pdf_path) as document:
-    for page_index in range(document.page_count):
-      page = document.load_page(page_index)
-      blocks = page.get_text("dict").get("blocks", [])
+      for line_index, line in enumerate(block.get("lines", [])):
+        spans = line.get("spans", [])
+        text = "".join(str(span.get("text", "")) for span in spans).strip()
+        if not text:
+          continue
 
-      for block_index, block in enumerate(blocks):
-        if block.get("type") != 0:
+        bbox = _line_bbox(spans)
+        if bbox is None:
           continue
 
-        for line_index, line in enumerate(block.get("lines", [])):
-          spans = line.get("spans", [])
-          text = "".join(str(span.get("text", "")) for span in spans).strip()
-          if not text:
-            continue
-
-          bbox = _line_bbox(spans)
-          if bbox is None:
-            continue
-
-          normalized = _normalize_text(text)
-          if not normalized:
-            continue
-
-          entries.append(
-            IndexedLine(
-              page=page_index + 1,
-              text=text,
-              normalized=normalized,
-              bbox=bbox,
-              block_index=block_index,
-              line_index=line_index,
-            )
-          )
+        normalized = _normalize_text(text)
+        if not normalized:
+          continue
+
+        yield IndexedLine(
+          page=page_index + 1,
+          text=text,
+          normalized=normalized,
+          bbox=bbox,
+          block_index=block_index,
+          line_index=line_index,
+        )
+
+
+def _extract_page_range(pdf_path: str, start: int, stop: int) -> list[IndexedLine]:
+  # Process-pool entry point: each worker opens its own document and reads pages [start, stop).
+  with open_pdf(pdf_path) as document:
+    return list(_iter_index_lines(document, range(start, stop)))
+
+
+def _get_index_build_pool(workers: int) -> ProcessPoolExecutor:
+  global _INDEX_BUILD_POOL, _INDEX_BUILD_POOL_WORKERS
+
+  with _INDEX_BUILD_POOL_LOCK:
+    if _INDEX_BUILD_POOL is None or _INDEX_BUILD_POOL_WORKERS != workers:
+      if _INDEX_BUILD_POOL is not None:
+        _INDEX_BUILD_POOL.shutdown(wait=False)
+      # Spawn avoids forking a multi-threaded server process.
+      _INDEX_BUILD_POOL = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+      _INDEX_BUILD_POOL_WORKERS = workers
+      register_executor("locator-index-build", _INDEX_BUILD_POOL)
+    return _INDEX_BUILD_POOL
+
+
+def _discard_index_build_pool(pool: ProcessPoolExecutor) -> None:
+  global _INDEX_BUILD_POOL
 
-  return entries
+  with _INDEX_BUILD_POOL_LOCK:
+    if _INDEX_BUILD_POOL is pool:
+      _INDEX_BUILD_POOL = None
+      unregister_executor("locator-index-build")
+  pool.shutdown(wait=False)
 
 
-def _get_index(pdf_path: Path) -> list[IndexedLine]:
+def _page_ranges(page_count: int, parts: int) -> list[tuple[int, int]]:
+  size = -(-page_count // max(1, parts))
+  return [(start, min(page_count, start + size)) for start in range(0, page_count, size)]
+
+
+def _build_index(pdf_path: Path, *, build_config: LocatorIndexBuildConfig | None = None) -> DocumentIndex:
+  """Extract every text line of `pdf_path`.
+
+  Documents with at least `parallel_min_pages` pages are split into page ranges that worker
+  processes extract in parallel; the ranges are merged back in page order.
+  """
+  config = build_config or get_locator_index_build_config()
+  with open_pdf(pdf_path) as document:
+    if config.workers <= 1 or document.page_count < config.parallel_min_pages:
+      return DocumentIndex(_iter_index_lines(document))
+    page_count = document.page_count
+
+  # Two ranges per worker keep the pool busy when some pages are much denser than others.
+  pool = _get_index_build_pool(config.workers)
+  try:
+    futures = [
+      pool.submit(_extract_page_range, str(pdf_path), start, stop)
+      for start, stop in _page_ranges(page_count, config.workers * 2)
+    ]
+    return DocumentIndex(line for future in futures for line in future.result())
+  except BrokenProcessPool:
+    logger.exception("Parallel index build failed for %s; extracting serially", pdf_path)
+    _discard_index_build_pool(pool)
+    with open_pdf(pdf_path) as document:
+      return DocumentIndex(_iter_index_lines(document))
+
+
+def _get_index(pdf_path: Path) -> DocumentIndex:
   key = str(pdf_path.resolve())
   mtime_ns = pdf_path.stat().st_mtime_ns
 
-  with _CACHE_LOCK:
-    cached = _INDEX_CACHE.get(key)
-    if cached and cached[0] == mtime_ns:
-      return cached[1]
+  cache = _index_cache()
+  cached = cache.get(key, mtime_ns)
+  if cached is not None:
+    return cached
 
-  entries = _build_index(pdf_path)
+  def build() -> DocumentIndex:
+    # A leader that arrives just after the previous build finished finds its result here.
+    cached = cache.get(key, mtime_ns, record=False)
+    if cached is not None:
+      return cached
+    entries = _build_index(pdf_path)
+    cache.put(key, mtime_ns, entries)
+    return entries
+
+  return _INDEX_BUILDS.do((key, mtime_ns), build)
+
+
+def warm_index(pdf_path: Path) -> int:
+  """Build (or reuse) the line index for `pdf_path` ahead of the first resolve; returns its line count."""
+  return len(_get_index(pdf_path))
+
+
+def get_index_cache_stats() -> IndexCacheStats:
+  return _index_cache().stats()
 
-  with _CACHE_LOCK:
-    _INDEX_CACHE[key] = (mtime_ns, entries)
 
-  return entries
+def clear_index_cache(pdf_path: Path | None = None) -> int:
+  """Drop the cached index of `pdf_path`, or of every document, including spilled copies.
+
+  Returns how many in-memory indexes were dropped.
+  """
+  return _index_cache().invalidate(None if pdf_path is None else str(pdf_path.resolve()))
+
+
+def get_page_lines(pdf_path: Path, page: int) -> list[IndexedLine]:
+  """Indexed lines of one page, in extraction order."""
+  return _as_document_index(_get_index(pdf_path)).page_lines(page)
 
 
 def _dedupe_queries(queries: list[str], *, limit: int) -> list[str]:
@@ -352,7 +979,13 @@ def _build_query_bundle(
   )
 
 
-def _score_query(query_norm: str, entry_norm: str, *, resolve_config: EvidenceResolveConfig) -> float:
+def _score_query(
+  query_norm: str,
+  entry_norm: str,
+  *,
+  resolve_config: EvidenceResolveConfig,
+  query_tokens: frozenset[str] | None = None,
+) -> float:
   partial = float(fuzz.partial_ratio(query_norm, entry_norm))
   token_set = float(fuzz.token_set_ratio(query_norm, entry_norm))
   ratio = float(fuzz.ratio(query_norm, entry_norm))
@@ -373,7 +1006,8 @@ def _score_query(query_norm: str, entry_norm: str, *, resolve_config: EvidenceRe
   else:
     score = max(partial, token_set, ratio)
 
-  query_tokens = {token for token in query_norm.split() if len(token) >= 3}
+  if query_tokens is None:
+    query_tokens = _query_tokens(query_norm)
   if query_tokens:
     entry_tokens = set(entry_norm.split())
     overlap_count = len(query_tokens & entry_tokens)
@@ -387,6 +1021,19 @@ def _score_query(query_norm: str, entry_norm: str, *, resolve_config: EvidenceRe
   return score
 
 
+def _query_tokens(query_norm: str) -> frozenset[str]:
+  return frozenset(token for token in query_norm.split() if len(token) >= 3)
+
+
+def _prepare_queries(queries: list[str]) -> list[PreparedQuery]:
+  prepared: list[PreparedQuery] = []
+  for query in queries:
+    normalized = _normalize_text(query)
+    if normalized:
+      prepared.append(PreparedQuery(text=query, normalized=normalized, tokens=_query_tokens(normalized)))
+  return prepared
+
+
 def _sanitize_search_text(text: str) -> str:
   cleaned = _SPACE_RE.sub(" ", text).strip()
   if not cleaned:
@@ -474,6 +1121,25 @@ def _max_query_score(
   return best_score, best_query
 
 
+def _max_prepared_score(
+  queries: list[PreparedQuery],
+  target_norm: str,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> tuple[float, str | None]:
+  """`_max_query_score` for queries normalized and tokenized once per locate call."""
+  best_score = 0.0
+  best_query: str | None = None
+
+  for query in queries:
+    score = _score_query(query.normalized, target_norm, resolve_config=resolve_config, query_tokens=query.tokens)
+    if score > best_score:
+      best_score = score
+      best_query = query.text
+
+  return best_score, best_query
+
+
 def _contains_clause_token(text_norm: str, clause_token: str) -> bool:
   if not text_norm or not clause_token:
     return False
@@ -512,20 +1178,7 @@ def _blend_scores(
   return weighted / total_weight
 
 
-def _build_block_context_map(index: list[IndexedLine]) -> dict[tuple[int, int], list[IndexedLine]]:
-  block_map: dict[tuple[int, int], list[IndexedLine]] = {}
-  for entry in index:
-    key = (entry.page, entry.block_index)
-    block_map.setdefault(key, []).append(entry)
-
-  for entries in block_map.values():
-    entries.sort(key=lambda line: line.line_index)
-
-  return block_map
-
-
-def _get_entry_context(entry: IndexedLine, block_map: dict[tuple[int, int], list[IndexedLine]], *, window: int = 1) -> str:
-  block_entries = block_map.get((entry.page, entry.block_index))
+def _get_entry_context(entry: IndexedLine, block_entries: list[IndexedLine], *, window: int = 1) -> str:
   if not block_entries:
     return entry.text
 
@@ -540,7 +1193,7 @@ def _get_entry_context(entry: IndexedLine, block_map: dict[tuple[int, int], list
   return _SPACE_RE.sub(" ", " ".join(context_lines)).strip()
 
 
-def _find_clause_fallback_page(index: list[IndexedLine], clause_candidates: list[str]) -> int | None:
+def _find_clause_fallback_page(index: Sequence[IndexedLine], clause_candidates: list[str]) -> int | None:
   if not clause_candidates:
     return None
 
@@ -813,7 +1466,7 @@ def _expand_rect_group_with_token_overlap(
   if len(evidence_tokens) < 3:
     return base_group
 
-  page_entries = [entry for entry in _get_index(pdf_path) if entry.page == page]
+  page_entries = get_page_lines(pdf_path, page)
   if not page_entries:
     return base_group
 
@@ -883,6 +1536,25 @@ def _expand_rect_group_with_token_overlap(
   return _prune_redundant_rects(base_with_tail)
 
 
+def _span_highlight_bboxes(
+  index: DocumentIndex,
+  needles: list[str],
+  anchor: IndexedLine,
+  *,
+  min_length: int,
+) -> list[tuple[float, float, float, float]] | None:
+  """Line bboxes of a verbatim match of a needle that runs across `anchor`'s line break, on its page."""
+  for needle in needles:
+    key = _normalize_text(needle)
+    if len(key) < min_length:
+      continue
+    for span in index.find_spans(key):
+      lines = index.span_lines(span)
+      if len(lines) > 1 and anchor in lines:
+        return [line.bbox for line in lines if line.page == anchor.page]
+  return None
+
+
 def _resolve_highlight_bboxes(
   pdf_path: Path,
   *,
@@ -891,6 +1563,7 @@ def _resolve_highlight_bboxes(
   best_query: str | None,
   best_entry: IndexedLine,
   resolve_config: EvidenceResolveConfig,
+  index: DocumentIndex | None = None,
 ) -> list[tuple[float, float, float, float]]:
   needles = _collect_search_needles(
     evidence_text,
@@ -899,10 +1572,18 @@ def _resolve_highlight_bboxes(
     resolve_config=resolve_config,
   )
 
+  def fallback() -> list[tuple[float, float, float, float]]:
+    # PDF text search missed; a cross-line match in the index still outlines the lines it covers.
+    if index is not None:
+      span_bboxes = _span_highlight_bboxes(index, needles, best_entry, min_length=resolve_config.segment_min_length)
+      if span_bboxes:
+        return span_bboxes
+    return [best_entry.bbox]
+
   try:
-    with fitz.open(pdf_path) as document:
+    with open_pdf(pdf_path) as document:
       if page < 1 or page > document.page_count:
-        return [best_entry.bbox]
+        return fallback()
 
       pdf_page = document.load_page(page - 1)
       best_match: list[tuple[float, float, float, float]] | None = None
@@ -910,7 +1591,8 @@ def _resolve_highlight_bboxes(
       anchor_center_y = _center_y(best_entry.bbox)
 
       for needle in needles:
-        rects = [bbox for rect in pdf_page.search_for(needle) if (bbox := _rect_to_bbox(rect)) is not None]
+        with stage("search_for"):
+          rects = [bbox for rect in pdf_page.search_for(needle) if (bbox := _rect_to_bbox(rect)) is not None]
         if not rects:
           continue
 
@@ -933,78 +1615,169 @@ def _resolve_highlight_bboxes(
 
       if best_match:
         # Expand fragmented matches when minor punctuation/symbol mismatch exists.
-        best_match = _expand_rect_group_with_token_overlap(
-          pdf_path=pdf_path,
-          page=page,
-          base_group=best_match,
-          evidence_text=evidence_text,
-          anchor_bbox=best_entry.bbox,
-        )
+        with stage("expand"):
+          best_match = _expand_rect_group_with_token_overlap(
+            pdf_path=pdf_path,
+            page=page,
+            base_group=best_match,
+            evidence_text=evidence_text,
+            anchor_bbox=best_entry.bbox,
+          )
         return best_match
   except Exception:
     # Locator must remain fault-tolerant even when PDF text search fails.
-    return [best_entry.bbox]
+    return fallback()
 
-  return [best_entry.bbox]
+  return fallback()
 
 
-def locate_evidence(
-  pdf_path: Path,
-  evidence_text: str,
-  clause_keyword: str | None = None,
+def _unresolved_without_index(evidence_text: str, *, resolve_config: EvidenceResolveConfig) -> LocatorResult:
+  return LocatorResult(
+    page=resolve_config.page_min,
+    quote=_trim_quote(evidence_text, resolve_config=resolve_config),
+    bbox=None,
+    bboxes=None,
+    match_score=0.0,
+    match_method="fuzzy",
+    status="unresolved",
+  )
+
+
+def _overlap_survivors(
+  index: DocumentIndex,
+  queries: list[PreparedQuery],
   *,
-  resolve_config: EvidenceResolveConfig | None = None,
-) -> LocatorResult:
-  config = resolve_config or get_evidence_resolve_config()
+  resolve_config: EvidenceResolveConfig,
+) -> tuple[list[int] | None, float]:
+  """Lines that at least one query can score without the low-overlap cap in `_score_query`.
 
-  index = _get_index(pdf_path)
-  if not index:
-    return LocatorResult(
-      page=config.page_min,
-      quote=_trim_quote(evidence_text, resolve_config=config),
-      bbox=None,
-      bboxes=None,
-      match_score=0.0,
-      match_method="fuzzy",
-      status="unresolved",
+  Returns the survivors' positions in document order, or None when every line survives, and an
+  upper bound on the content score of every other line.
+  """
+  postings = index.token_postings
+  survivors: set[int] = set()
+  capped_bound = 0.0
+
+  for query in queries:
+    token_count = len(query.tokens)
+    if not token_count:
+      return None, 100.0
+
+    # Mirror `_score_query`: the cap is skipped only when both overlap conditions hold.
+    required = next(
+      (count for count in range(token_count + 1) if count / token_count >= resolve_config.min_token_overlap_ratio),
+      token_count + 1,
     )
+    if token_count >= 4:
+      required = max(required, resolve_config.min_token_overlap_count)
+    if required <= 0:
+      return None, 100.0
 
-  query_bundle = _build_query_bundle(evidence_text, clause_keyword, resolve_config=config)
+    overlap: Counter[int] = Counter()
+    for token in query.tokens:
+      overlap.update(postings.get(token, ()))
+    survivors.update(position for position, count in overlap.items() if count >= required)
+    capped_bound = max(capped_bound, min(100.0, resolve_config.low_overlap_score_cap + 10.0))
 
-  pre_scored_candidates: list[PreScoredCandidate] = []
-  best_content_candidate: PreScoredCandidate | None = None
+  return sorted(survivors), capped_bound
 
-  for entry in index:
-    content_score, content_query = _max_query_score(
-      query_bundle.content_queries,
-      entry.normalized,
-      resolve_config=config,
-    )
-    candidate = PreScoredCandidate(
-      entry=entry,
-      content_score=content_score,
-      content_query=content_query,
-    )
-    pre_scored_candidates.append(candidate)
 
+def _best_content_candidate(candidates: list[PreScoredCandidate]) -> PreScoredCandidate | None:
+  best_content_candidate: PreScoredCandidate | None = None
+  for candidate in candidates:
     if best_content_candidate is None or candidate.content_score > best_content_candidate.content_score:
       best_content_candidate = candidate
+  return best_content_candidate
+
+
+def _fuzzy_stage(
+  index: DocumentIndex,
+  queries: list[PreparedQuery],
+  query_bundle: QueryBundle,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> tuple[ScoredCandidate | None, PreScoredCandidate | None]:
+  """Fuzzy-score overlap survivors first and the capped lines only if they could still matter.
+
+  Capped lines are skipped when `candidate_limit` survivors already score above the cap, or when
+  the best reranked survivor beats the best final score any capped line could reach. Either way
+  the result equals scoring every line.
+  """
+  top_limit = max(1, resolve_config.candidate_limit)
+  scored: dict[int, tuple[float, str | None]] = {}
+
+  def score(positions: Iterable[int]) -> None:
+    for position in positions:
+      scored[position] = _max_prepared_score(queries, index.normalized_at(position), resolve_config=resolve_config)
+
+  def top_candidates() -> list[PreScoredCandidate]:
+    # Only the lines reranking can pick become IndexedLine objects. nlargest keeps line order
+    # among ties, so the choice and the best content candidate match ranking every line.
+    top = heapq.nlargest(top_limit, sorted(scored), key=lambda position: scored[position][0])
+    return [
+      PreScoredCandidate(entry=index[position], content_score=scored[position][0], content_query=scored[position][1])
+      for position in sorted(top)
+    ]
+
+  with stage("overlap"):
+    survivors, capped_bound = _overlap_survivors(index, queries, resolve_config=resolve_config)
+  with stage("prescore"):
+    score(range(len(index)) if survivors is None else survivors)
+  LOCATOR_STAGE_LINES.inc(len(scored), stage="overlap_survivors")
+
+  if len(scored) < len(index):
+    top_scores = heapq.nlargest(top_limit, (content_score for content_score, _ in scored.values()))
+    if len(top_scores) < top_limit or top_scores[-1] <= capped_bound:
+      survivor_candidates = top_candidates()
+      with stage("rerank"):
+        best_candidate = _rerank_candidates(index, survivor_candidates, query_bundle, resolve_config=resolve_config)
+      final_bound = _blend_scores(
+        content_score=capped_bound,
+        context_score=100.0,
+        clause_score=100.0,
+        resolve_config=resolve_config,
+      )
+      if (
+        best_candidate is not None
+        and best_candidate.content_score > capped_bound
+        and best_candidate.final_score > final_bound
+      ):
+        LOCATOR_STAGE_LINES.inc(len(index) - len(scored), stage="overlap_pruned")
+        return best_candidate, _best_content_candidate(survivor_candidates)
+
+      with stage("prescore"):
+        score(position for position in range(len(index)) if position not in scored)
+    else:
+      LOCATOR_STAGE_LINES.inc(len(index) - len(scored), stage="overlap_pruned")
 
-  top_limit = min(len(pre_scored_candidates), max(1, config.candidate_limit))
+  pre_scored_candidates = top_candidates()
+  with stage("rerank"):
+    best_candidate = _rerank_candidates(index, pre_scored_candidates, query_bundle, resolve_config=resolve_config)
+  return best_candidate, _best_content_candidate(pre_scored_candidates)
+
+
+def _rerank_candidates(
+  index: DocumentIndex,
+  pre_scored_candidates: list[PreScoredCandidate],
+  query_bundle: QueryBundle,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> ScoredCandidate | None:
+  top_limit = min(len(pre_scored_candidates), max(1, resolve_config.candidate_limit))
   top_candidates = heapq.nlargest(top_limit, pre_scored_candidates, key=lambda candidate: candidate.content_score)
 
-  block_map = _build_block_context_map(index)
+  context_queries = _prepare_queries(query_bundle.context_queries)
 
   best_candidate: ScoredCandidate | None = None
   best_key: tuple[float, float, float, float] | None = None
 
   for candidate in top_candidates:
-    context_text = _get_entry_context(candidate.entry, block_map)
+    context_text = _get_entry_context(candidate.entry, index.block_lines(candidate.entry.page, candidate.entry.block_index))
     context_norm = _normalize_text(context_text)
-    context_score, _ = _max_query_score(
-      query_bundle.context_queries,
+    context_score, _ = _max_prepared_score(
+      context_queries,
       context_norm,
-      resolve_config=config,
+      resolve_config=resolve_config,
     )
     clause_score = _score_clause_alignment(
       query_bundle.clause_candidates,
@@ -1015,7 +1788,7 @@ def locate_evidence(
       content_score=candidate.content_score,
       context_score=context_score,
       clause_score=clause_score,
-      resolve_config=config,
+      resolve_config=resolve_config,
     )
 
     ranking_key = (
@@ -1035,21 +1808,72 @@ def locate_evidence(
         content_query=candidate.content_query,
       )
 
+  return best_candidate
+
+
+def _is_exact(candidate: ScoredCandidate | None, *, resolve_config: EvidenceResolveConfig) -> bool:
+  return (
+    candidate is not None
+    and candidate.content_score >= resolve_config.content_min_resolve
+    and candidate.final_score >= resolve_config.exact_threshold
+  )
+
+
+def _exact_stage(
+  index: DocumentIndex,
+  queries: list[PreparedQuery],
+  query_bundle: QueryBundle,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> ScoredCandidate | None:
+  """Rerank only the lines a content query matches verbatim, within or across lines; the best one if exact."""
+  positions: set[int] = set()
+  for query in queries:
+    if len(query.normalized) < resolve_config.segment_min_length:
+      continue
+    positions.update(index.find_line_matches(query.normalized))
+    # A query that runs across line breaks brings in every line it covers.
+    for span in index.find_spans(query.normalized):
+      if span.last_line > span.first_line:
+        positions.update(range(span.first_line, span.last_line + 1))
+  if not positions:
+    return None
+
+  LOCATOR_STAGE_LINES.inc(len(positions), stage="exact_hits")
+  candidates: list[PreScoredCandidate] = []
+  for position in sorted(positions):
+    entry = index[position]
+    content_score, content_query = _max_prepared_score(queries, entry.normalized, resolve_config=resolve_config)
+    candidates.append(PreScoredCandidate(entry=entry, content_score=content_score, content_query=content_query))
+
+  best_candidate = _rerank_candidates(index, candidates, query_bundle, resolve_config=resolve_config)
+  return best_candidate if _is_exact(best_candidate, resolve_config=resolve_config) else None
+
+
+def _finalize_result(
+  pdf_path: Path,
+  index: Sequence[IndexedLine],
+  evidence_text: str,
+  query_bundle: QueryBundle,
+  best_candidate: ScoredCandidate | None,
+  best_content_candidate: PreScoredCandidate | None,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> LocatorResult:
+  config = resolve_config
   best_final_score = best_candidate.final_score if best_candidate else 0.0
 
-  if (
-    best_candidate
-    and best_candidate.content_score >= config.content_min_resolve
-    and best_candidate.final_score >= config.exact_threshold
-  ):
-    resolved_bboxes = _resolve_highlight_bboxes(
-      pdf_path,
-      page=best_candidate.entry.page,
-      evidence_text=evidence_text,
-      best_query=best_candidate.content_query,
-      best_entry=best_candidate.entry,
-      resolve_config=config,
-    )
+  if best_candidate and _is_exact(best_candidate, resolve_config=config):
+    with stage("highlight"):
+      resolved_bboxes = _resolve_highlight_bboxes(
+        pdf_path,
+        page=best_candidate.entry.page,
+        evidence_text=evidence_text,
+        best_query=best_candidate.content_query,
+        best_entry=best_candidate.entry,
+        resolve_config=config,
+        index=_as_document_index(index),
+      )
     return LocatorResult(
       page=best_candidate.entry.page,
       quote=_trim_quote(best_candidate.entry.text, resolve_config=config),
@@ -1065,14 +1889,16 @@ def locate_evidence(
     and best_candidate.content_score >= config.content_min_resolve
     and best_candidate.final_score >= config.approximate_threshold
   ):
-    resolved_bboxes = _resolve_highlight_bboxes(
-      pdf_path,
-      page=best_candidate.entry.page,
-      evidence_text=evidence_text,
-      best_query=best_candidate.content_query,
-      best_entry=best_candidate.entry,
-      resolve_config=config,
-    )
+    with stage("highlight"):
+      resolved_bboxes = _resolve_highlight_bboxes(
+        pdf_path,
+        page=best_candidate.entry.page,
+        evidence_text=evidence_text,
+        best_query=best_candidate.content_query,
+        best_entry=best_candidate.entry,
+        resolve_config=config,
+        index=_as_document_index(index),
+      )
     return LocatorResult(
       page=best_candidate.entry.page,
       quote=_trim_quote(best_candidate.entry.text, resolve_config=config),
@@ -1100,3 +1926,108 @@ def locate_evidence(
     match_method="fuzzy",
     status="unresolved",
   )
+
+
+def _locate_in_index(
+  pdf_path: Path,
+  index: Sequence[IndexedLine],
+  evidence_text: str,
+  query_bundle: QueryBundle,
+  *,
+  resolve_config: EvidenceResolveConfig,
+) -> LocatorResult:
+  """Run the staged pipeline: verbatim line hits, then overlap-filtered fuzzy scoring.
+
+  With `staged_early_exit`, an exact result from the verbatim stage is returned without scoring
+  the rest of the document.
+  """
+  if not index:
+    return _unresolved_without_index(evidence_text, resolve_config=resolve_config)
+
+  index = _as_document_index(index)
+  content_queries = _prepare_queries(query_bundle.content_queries)
+
+  if resolve_config.staged_early_exit:
+    with stage("exact"):
+      exact_candidate = _exact_stage(index, content_queries, query_bundle, resolve_config=resolve_config)
+    if exact_candidate is not None:
+      LOCATOR_STAGE_RESULTS.inc(stage="exact")
+      return _finalize_result(
+        pdf_path,
+        index,
+        evidence_text,
+        query_bundle,
+        exact_candidate,
+        None,
+        resolve_config=resolve_config,
+      )
+
+  best_candidate, best_content_candidate = _fuzzy_stage(
+    index,
+    content_queries,
+    query_bundle,
+    resolve_config=resolve_config,
+  )
+  LOCATOR_STAGE_RESULTS.inc(stage="fuzzy")
+  return _finalize_result(
+    pdf_path,
+    index,
+    evidence_text,
+    query_bundle,
+    best_candidate,
+    best_content_candidate,
+    resolve_config=resolve_config,
+  )
+
+
+def locate_evidence(
+  pdf_path: Path,
+  evidence_text: str,
+  clause_keyword: str | None = None,
+  *,
+  resolve_config: EvidenceResolveConfig | None = None,
+) -> LocatorResult:
+  config = resolve_config or get_evidence_resolve_config()
+
+  with stage("index"):
+    index = _get_index(pdf_path)
+  if not index:
+    return _unresolved_without_index(evidence_text, resolve_config=config)
+
+  with stage("query"):
+    query_bundle = _build_query_bundle(evidence_text, clause_keyword, resolve_config=config)
+  return _locate_in_index(pdf_path, index, evidence_text, query_bundle, resolve_config=config)
+
+
+_STATUS_RANK = {"resolved_exact": 2, "resolved_approximate": 1, "unresolved": 0}
+
+
+def locate_evidence_across_documents(
+  documents: list[tuple[str, Path]],
+  evidence_text: str,
+  clause_keyword: str | None = None,
+  *,
+  resolve_config: EvidenceResolveConfig | None = None,
+  stop_on_exact: bool = True,
+) -> list[tuple[str, LocatorResult]]:
+  """Locate one piece of evidence in several documents and rank the per-document results.
+
+  The query bundle is built once and shared by every document. Documents are searched in the
+  given order; with `stop_on_exact`, the remaining ones are skipped after an exact match. Results
+  are ranked by status, then score, then input order.
+  """
+  config = resolve_config or get_evidence_resolve_config()
+  with stage("query"):
+    query_bundle = _build_query_bundle(evidence_text, clause_keyword, resolve_config=config)
+
+  ranked: list[tuple[tuple[int, float, int], str, LocatorResult]] = []
+  for order, (document_key, pdf_path) in enumerate(documents):
+    with stage("index"):
+      index = _get_index(pdf_path)
+    result = _locate_in_index(pdf_path, index, evidence_text, query_bundle, resolve_config=config)
+    ranked.append(((-_STATUS_RANK[result.status], -result.match_score, order), document_key, result))
+    if stop_on_exact and result.status == "resolved_exact":
+      break
+
+  ranked.sort(key=lambda item: item[0])
+  return [(document_key, result) for _, document_key, result in ranked]
@@ -2,24 +2,34 @@ from __future__ import annotations
 
 import json
 import re
-from functools import lru_cache
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from app.core.config import PROJECT_REGISTRY_PATH, PROJECT_ROOT, REFERENCE_DIR
+from app.core.config import PROJECT_REGISTRY_PATH, PROJECT_ROOT, REFERENCE_DIR, get_config_reload_interval
 from app.core.errors import ApiError
+from app.core.file_stamps import FileStamp, StampedFileCache, read_file_stamp, stamps_changed
+from app.core.single_flight import SingleFlight
+from app.schemas.admin import ConfigCacheMetricsData, WorkspaceConfigReloadData
 from app.schemas.projects import (
   ProjectDocumentReference,
+  ProjectDocumentRefreshData,
   ProjectReportSourceSummary,
   ProjectStandardDefinition,
   ProjectTemplate,
   ProjectTemplateEntry,
   WorkspaceConfigData,
   WorkspaceProjectConfig,
+  WorkspaceProjectSummary,
+  WorkspaceSummaryData,
 )
 from app.schemas.templates import DocumentReference, NecTemplateData, TemplateStandard
+from app.services.document_catalog_service import DocumentCatalog, get_document_catalog
 
 
 class RegistryReportSource(BaseModel):
@@ -42,6 +52,14 @@ class RegistryProject(BaseModel):
 class RegistryPayload(BaseModel):
   default_project_id: str
   projects: list[RegistryProject] = Field(default_factory=list)
+  _projects_by_id: dict[str, RegistryProject] = PrivateAttr(default_factory=dict)
+
+  def model_post_init(self, __context: Any) -> None:
+    for project in self.projects:
+      self._projects_by_id.setdefault(project.project_id, project)
+
+  def get_project(self, project_id: str) -> RegistryProject | None:
+    return self._projects_by_id.get(project_id)
 
 
 def _read_json_file(path: Path) -> Any:
@@ -56,10 +74,85 @@ def _read_json_file(path: Path) -> Any:
     return json.load(fh)
 
 
-@lru_cache(maxsize=1)
+def _parse_registry(path: Path) -> RegistryPayload:
+  return RegistryPayload.model_validate(_read_json_file(path))
+
+
+@dataclass(frozen=True, slots=True)
+class SourcePackProfile:
+  item_count: int
+  check_types: tuple[str, ...]
+  check_type_counts: dict[str, int]
+  check_type_domains: dict[str, frozenset[str]]
+  document_references: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class SourcePack:
+  items: tuple[dict[str, Any], ...]
+  profile: SourcePackProfile
+
+
+def _parse_report_source(path: Path) -> SourcePack:
+  """Load one report source file and profile it in the same pass over its items."""
+  payload = _read_json_file(path)
+  items = payload.get("report_items") if isinstance(payload, dict) else payload
+  if not isinstance(items, list):
+    raise ApiError(
+      status_code=500,
+      code="VALIDATION_ERROR",
+      message=f"Report source must be an array of items: {_normalize_project_relative_path(path)}",
+    )
+
+  normalized_items: list[dict[str, Any]] = []
+  check_type_counts: dict[str, int] = {}
+  check_type_domains: dict[str, set[str]] = {}
+  document_references: dict[str, None] = {}
+  for raw in items:
+    if not isinstance(raw, dict):
+      continue
+    normalized_items.append(raw)
+
+    check_type = raw.get("check_type")
+    if isinstance(check_type, str) and check_type.strip():
+      normalized_check_type = check_type.strip()
+      check_type_counts[normalized_check_type] = check_type_counts.get(normalized_check_type, 0) + 1
+      check_type_domains.setdefault(normalized_check_type, set()).add(_infer_item_status_domain(raw))
+
+    references = raw.get("document_references", [])
+    if isinstance(references, list):
+      for reference in references:
+        if isinstance(reference, str):
+          document_references.setdefault(reference, None)
+
+  return SourcePack(
+    items=tuple(normalized_items),
+    profile=SourcePackProfile(
+      item_count=len(normalized_items),
+      check_types=tuple(check_type_counts),
+      check_type_counts=check_type_counts,
+      check_type_domains={check_type: frozenset(domains) for check_type, domains in check_type_domains.items()},
+      document_references=tuple(document_references),
+    ),
+  )
+
+
+_REGISTRY_FILE: StampedFileCache[RegistryPayload] = StampedFileCache(
+  _parse_registry,
+  check_interval=get_config_reload_interval,
+)
+_TEMPLATE_FILES: StampedFileCache[dict[str, Any]] = StampedFileCache(
+  _read_json_file,
+  check_interval=get_config_reload_interval,
+)
+_REPORT_SOURCE_FILES: StampedFileCache[SourcePack] = StampedFileCache(
+  _parse_report_source,
+  check_interval=get_config_reload_interval,
+)
+
+
 def _load_registry() -> RegistryPayload:
-  payload = _read_json_file(PROJECT_REGISTRY_PATH)
-  return RegistryPayload.model_validate(payload)
+  return _REGISTRY_FILE.get(PROJECT_REGISTRY_PATH)
 
 
 def _normalize_project_relative_path(path: Path) -> str:
@@ -69,6 +162,21 @@ def _normalize_project_relative_path(path: Path) -> str:
     return path.relative_to(PROJECT_ROOT).as_posix()
 
 
+_KNOWN_DOCUMENT_SUFFIXES = (".pdf", ".docx", ".doc", ".md", ".rtf", ".txt")
+_LOOKUP_SEPARATOR_RE = re.compile(r"[\s_-]+")
+
+
+def _canonical_document_key(value: str) -> str:
+  """Case-, separator- and extension-insensitive form shared by every `_document_lookup_keys` variant."""
+  canonical = value.strip()
+  while True:
+    suffix = Path(canonical).suffix.lower()
+    if suffix not in _KNOWN_DOCUMENT_SUFFIXES or len(canonical) == len(suffix):
+      break
+    canonical = canonical[: -len(suffix)].strip()
+  return _LOOKUP_SEPARATOR_RE.sub(" ", canonical.lower()).strip()
+
+
 def _document_lookup_keys(value: str) -> set[str]:
   normalized = value.strip()
   if not normalized:
@@ -103,31 +211,15 @@ def _document_lookup_keys(value: str) -> set[str]:
   return lookup_keys
 
 
-@lru_cache(maxsize=None)
 def _load_template_payload(relative_path: str) -> dict[str, Any]:
-  return _read_json_file(PROJECT_ROOT / relative_path)
-
+  return _TEMPLATE_FILES.get(PROJECT_ROOT / relative_path)
 
-@lru_cache(maxsize=None)
-def _load_report_source_items(relative_path: str) -> tuple[dict[str, Any], ...]:
-  payload = _read_json_file(PROJECT_ROOT / relative_path)
-  items = payload.get("report_items") if isinstance(payload, dict) else payload
-  if not isinstance(items, list):
-    raise ApiError(
-      status_code=500,
-      code="VALIDATION_ERROR",
-      message=f"Report source must be an array of items: {relative_path}",
-    )
 
-  normalized_items: list[dict[str, Any]] = []
-  for raw in items:
-    if isinstance(raw, dict):
-      normalized_items.append(raw)
-  return tuple(normalized_items)
+def _load_report_source_pack(relative_path: str) -> SourcePack:
+  return _REPORT_SOURCE_FILES.get(PROJECT_ROOT / relative_path)
 
 
-@lru_cache(maxsize=None)
-def _build_pdf_index(document_search_root: str) -> dict[str, Path]:
+def _get_project_document_catalog(document_search_root: str) -> DocumentCatalog:
   root = PROJECT_ROOT / document_search_root
   if not root.exists():
     raise ApiError(
@@ -136,15 +228,11 @@ def _build_pdf_index(document_search_root: str) -> dict[str, Path]:
       message=f"Document search root missing: {root}",
     )
 
-  index: dict[str, Path] = {}
-  for path in root.rglob("*.pdf"):
-    if path.name.startswith("~$"):
-      continue
-    for key in _document_lookup_keys(path.name):
-      index.setdefault(key, path)
-    for key in _document_lookup_keys(path.stem):
-      index.setdefault(key, path)
-  return index
+  return get_document_catalog(root, lookup_keys=_document_lookup_keys)
+
+
+def _build_pdf_index(document_search_root: str) -> dict[str, Path]:
+  return _get_project_document_catalog(document_search_root).get_index()
 
 
 def _format_label(value: str) -> str:
@@ -187,16 +275,9 @@ def _build_check_type_domain_map(report_sources: list[RegistryReportSource]) ->
   domains_by_check_type: dict[str, set[str]] = {}
 
   for source in sorted(report_sources, key=lambda item: item.order):
-    for raw in _load_report_source_items(source.report_json_path):
-      check_type = raw.get("check_type")
-      if not isinstance(check_type, str):
-        continue
-
-      normalized_check_type = check_type.strip()
-      if not normalized_check_type:
-        continue
-
-      domains_by_check_type.setdefault(normalized_check_type, set()).add(_infer_item_status_domain(raw))
+    profile = _load_report_source_pack(source.report_json_path).profile
+    for check_type, domains in profile.check_type_domains.items():
+      domains_by_check_type.setdefault(check_type, set()).update(domains)
 
   return {
     check_type: sorted(domains)
@@ -211,6 +292,14 @@ def _to_report_source_summaries(report_sources: list[RegistryReportSource]) -> l
   ]
 
 
+def _resolve_default_template_id(project: RegistryProject) -> str:
+  if project.default_template_id:
+    return project.default_template_id
+  if project.template_json_path:
+    return _load_template_payload(project.template_json_path).get("template_id") or f"{project.project_id}-default-v1"
+  return f"{project.project_id}-all-v1"
+
+
 def _build_template_backed_project(project: RegistryProject) -> WorkspaceProjectConfig:
   if not project.template_json_path:
     raise ApiError(
@@ -247,7 +336,7 @@ def _build_template_backed_project(project: RegistryProject) -> WorkspaceProject
     for standard in payload.get("standards", [])
   ]
   ordered_standards = sorted(standards, key=lambda standard: standard.default_priority)
-  default_template_id = project.default_template_id or payload.get("template_id") or f"{project.project_id}-default-v1"
+  default_template_id = _resolve_default_template_id(project)
   templates = [
     ProjectTemplate(
       template_id=default_template_id,
@@ -277,26 +366,22 @@ def _discover_documents(project: RegistryProject, report_sources: list[RegistryR
   pdf_index = _build_pdf_index(project.document_search_root)
   documents: dict[str, ProjectDocumentReference] = {}
   for source in sorted(report_sources, key=lambda item: item.order):
-    for raw in _load_report_source_items(source.report_json_path):
-      references = raw.get("document_references", [])
-      if not isinstance(references, list):
+    for reference in _load_report_source_pack(source.report_json_path).profile.document_references:
+      if reference in documents:
         continue
-      for reference in references:
-        if not isinstance(reference, str):
-          continue
-        matched_path = None
-        for key in _document_lookup_keys(reference):
-          matched_path = pdf_index.get(key)
-          if matched_path is not None:
-            break
-        if matched_path is None or reference in documents:
-          continue
-        documents[reference] = ProjectDocumentReference(
-          document_id=reference,
-          file_name=matched_path.name,
-          display_name=matched_path.stem,
-          relative_path=_normalize_project_relative_path(matched_path),
-        )
+      matched_path = None
+      for key in _document_lookup_keys(reference):
+        matched_path = pdf_index.get(key)
+        if matched_path is not None:
+          break
+      if matched_path is None:
+        continue
+      documents[reference] = ProjectDocumentReference(
+        document_id=reference,
+        file_name=matched_path.name,
+        display_name=matched_path.stem,
+        relative_path=_normalize_project_relative_path(matched_path),
+      )
 
   return sorted(documents.values(), key=lambda document: document.file_name)
 
@@ -316,14 +401,20 @@ def _document_reference_alias_values(document: ProjectDocumentReference) -> set[
   }
 
 
-@lru_cache(maxsize=None)
-def _build_project_document_alias_index(project_id: str) -> dict[str, ProjectDocumentReference]:
-  project = get_workspace_project(project_id)
+def _build_project_document_id_index(project: WorkspaceProjectConfig) -> dict[str, ProjectDocumentReference]:
+  id_index: dict[str, ProjectDocumentReference] = {}
+  for document in project.documents:
+    id_index.setdefault(document.document_id, document)
+  return id_index
+
+
+def _build_project_document_alias_index(project: WorkspaceProjectConfig) -> dict[str, ProjectDocumentReference]:
   alias_index: dict[str, ProjectDocumentReference] = {}
 
   for document in project.documents:
-    for value in _document_reference_alias_values(document):
-      for key in _document_lookup_keys(value):
+    for value in sorted(_document_reference_alias_values(document)):
+      key = _canonical_document_key(value)
+      if key:
         alias_index.setdefault(key, document)
 
   return alias_index
@@ -333,19 +424,10 @@ def _build_synthetic_project(project: RegistryProject) -> WorkspaceProjectConfig
   report_sources = sorted(project.report_sources, key=lambda item: item.order)
   check_type_domain_map = _build_check_type_domain_map(report_sources)
   documents = _discover_documents(project, report_sources)
-  seen_check_types: set[str] = set()
-  check_types: list[str] = []
-
+  check_types: dict[str, None] = {}
   for source in report_sources:
-    for raw in _load_report_source_items(source.report_json_path):
-      check_type = raw.get("check_type")
-      if not isinstance(check_type, str):
-        continue
-      normalized = check_type.strip()
-      if not normalized or normalized in seen_check_types:
-        continue
-      seen_check_types.add(normalized)
-      check_types.append(normalized)
+    for check_type in _load_report_source_pack(source.report_json_path).profile.check_types:
+      check_types.setdefault(check_type, None)
 
   standards = [
     ProjectStandardDefinition(
@@ -359,7 +441,7 @@ def _build_synthetic_project(project: RegistryProject) -> WorkspaceProjectConfig
     )
     for index, check_type in enumerate(check_types)
   ]
-  default_template_id = project.default_template_id or f"{project.project_id}-all-v1"
+  default_template_id = _resolve_default_template_id(project)
   templates = [
     ProjectTemplate(
       template_id=default_template_id,
@@ -382,68 +464,274 @@ def _build_synthetic_project(project: RegistryProject) -> WorkspaceProjectConfig
   )
 
 
-@lru_cache(maxsize=1)
+@dataclass(slots=True)
+class _ProjectConfigEntry:
+  registry_project: RegistryProject
+  config: WorkspaceProjectConfig
+  documents_by_id: dict[str, ProjectDocumentReference]
+  alias_index: dict[str, ProjectDocumentReference]
+  dependency_paths: tuple[Path, ...]
+  dependency_stamps: tuple[FileStamp | None, ...]
+  catalog_version: int | None
+  checked_at: float
+
+
+_PROJECT_CONFIGS: dict[str, _ProjectConfigEntry] = {}
+_PROJECT_CONFIG_LOCK = threading.Lock()
+_PROJECT_BUILDS: SingleFlight[_ProjectConfigEntry] = SingleFlight("project_config")
+_CONFIG_COUNTERS = {"project_builds": 0, "project_rebuilds": 0, "project_cache_hits": 0}
+_LAST_RELOAD_AT: datetime | None = None
+
+
+def _project_dependency_paths(project: RegistryProject) -> tuple[Path, ...]:
+  paths = [PROJECT_ROOT / source.report_json_path for source in sorted(project.report_sources, key=lambda item: item.order)]
+  if project.template_json_path:
+    paths.insert(0, PROJECT_ROOT / project.template_json_path)
+  return tuple(paths)
+
+
+def _project_catalog_version(project: RegistryProject) -> int | None:
+  if project.template_json_path or not project.document_search_root:
+    return None
+  catalog = _get_project_document_catalog(project.document_search_root)
+  # get_index re-lists changed directories at most once per reload interval, bumping the version.
+  catalog.get_index()
+  return catalog.version
+
+
+def _build_project_entry(project: RegistryProject) -> _ProjectConfigEntry:
+  # Stamps are taken before building so an edit that lands mid-build is caught by the next check.
+  dependency_paths = _project_dependency_paths(project)
+  dependency_stamps = tuple(read_file_stamp(path) for path in dependency_paths)
+  if project.template_json_path:
+    config = _build_template_backed_project(project)
+  else:
+    config = _build_synthetic_project(project)
+
+  return _ProjectConfigEntry(
+    registry_project=project,
+    config=config,
+    documents_by_id=_build_project_document_id_index(config),
+    alias_index=_build_project_document_alias_index(config),
+    dependency_paths=dependency_paths,
+    dependency_stamps=dependency_stamps,
+    catalog_version=_project_catalog_version(project),
+    checked_at=time.monotonic(),
+  )
+
+
+def _get_project_entry(project_id: str) -> _ProjectConfigEntry:
+  """Per-project config that is rebuilt only when its own registry entry or artifacts change."""
+  project = _load_registry().get_project(project_id)
+  if project is None:
+    raise ApiError(
+      status_code=404,
+      code="NOT_FOUND",
+      message=f"Project config not found: {project_id}",
+    )
+
+  now = time.monotonic()
+  with _PROJECT_CONFIG_LOCK:
+    entry = _PROJECT_CONFIGS.get(project_id)
+  if entry is not None and entry.registry_project == project:
+    recently_checked = now - entry.checked_at < get_config_reload_interval()
+    if recently_checked or (
+      not stamps_changed(entry.dependency_stamps, entry.dependency_paths)
+      and entry.catalog_version == _project_catalog_version(project)
+    ):
+      with _PROJECT_CONFIG_LOCK:
+        if not recently_checked:
+          entry.checked_at = now
+        _CONFIG_COUNTERS["project_cache_hits"] += 1
+      return entry
+
+  def rebuild() -> _ProjectConfigEntry:
+    with _PROJECT_CONFIG_LOCK:
+      current = _PROJECT_CONFIGS.get(project_id)
+    # Another leader rebuilt the entry between the check above and this call.
+    if current is not None and current is not entry and current.registry_project == project:
+      return current
+    rebuilt = _build_project_entry(project)
+    with _PROJECT_CONFIG_LOCK:
+      _CONFIG_COUNTERS["project_rebuilds" if project_id in _PROJECT_CONFIGS else "project_builds"] += 1
+      _PROJECT_CONFIGS[project_id] = rebuilt
+    return rebuilt
+
+  return _PROJECT_BUILDS.do(project_id, rebuild)
+
+
+def _expire_project_entry(project_id: str) -> None:
+  with _PROJECT_CONFIG_LOCK:
+    entry = _PROJECT_CONFIGS.get(project_id)
+    if entry is not None:
+      entry.checked_at = float("-inf")
+
+
 def get_workspace_config() -> WorkspaceConfigData:
   registry = _load_registry()
-  projects: list[WorkspaceProjectConfig] = []
-  for project in registry.projects:
-    if project.template_json_path:
-      projects.append(_build_template_backed_project(project))
-    else:
-      projects.append(_build_synthetic_project(project))
+  projects = [_get_project_entry(project.project_id).config for project in registry.projects]
+
+  registered_ids = {project.project_id for project in registry.projects}
+  with _PROJECT_CONFIG_LOCK:
+    for stale_id in set(_PROJECT_CONFIGS) - registered_ids:
+      del _PROJECT_CONFIGS[stale_id]
 
   return WorkspaceConfigData(default_project_id=registry.default_project_id, projects=projects)
 
 
-def get_registry_project(project_id: str) -> RegistryProject:
+def _summary_default_template_id(project: RegistryProject, loaded_template_id: str | None) -> str | None:
+  """Default template id that needs no template read; None for unloaded template-backed projects."""
+  if project.default_template_id:
+    return project.default_template_id
+  if loaded_template_id is not None:
+    return loaded_template_id
+  if project.template_json_path:
+    return None
+  return _resolve_default_template_id(project)
+
+
+def get_workspace_summary() -> WorkspaceSummaryData:
+  """Project listing read from the registry alone; no project config is built for it."""
   registry = _load_registry()
-  for project in registry.projects:
-    if project.project_id == project_id:
-      return project
+  with _PROJECT_CONFIG_LOCK:
+    loaded = {project_id: entry.config.default_template_id for project_id, entry in _PROJECT_CONFIGS.items()}
+
+  return WorkspaceSummaryData(
+    default_project_id=registry.default_project_id,
+    projects=[
+      WorkspaceProjectSummary(
+        project_id=project.project_id,
+        name=project.name,
+        default_template_id=_summary_default_template_id(project, loaded.get(project.project_id)),
+        report_sources=_to_report_source_summaries(project.report_sources),
+        loaded=project.project_id in loaded,
+      )
+      for project in registry.projects
+    ],
+  )
 
-  raise ApiError(
-    status_code=404,
-    code="NOT_FOUND",
-    message=f"Project not found: {project_id}",
+
+def reload_workspace_config() -> WorkspaceConfigReloadData:
+  """Re-check every artifact now and rebuild only the projects whose inputs changed."""
+  global _LAST_RELOAD_AT
+  registry_reloads = _REGISTRY_FILE.reloads
+  for file_cache in (_REGISTRY_FILE, _TEMPLATE_FILES, _REPORT_SOURCE_FILES):
+    file_cache.expire()
+  registry = _load_registry()
+  registered_ids = {project.project_id for project in registry.projects}
+
+  with _PROJECT_CONFIG_LOCK:
+    previous = dict(_PROJECT_CONFIGS)
+    removed_projects = sorted(set(previous) - registered_ids)
+    for project_id in removed_projects:
+      del _PROJECT_CONFIGS[project_id]
+    for entry in _PROJECT_CONFIGS.values():
+      entry.checked_at = float("-inf")
+
+  rebuilt_projects: list[str] = []
+  unchanged_projects: list[str] = []
+  for project_id in sorted(set(previous) & registered_ids):
+    if _get_project_entry(project_id) is previous[project_id]:
+      unchanged_projects.append(project_id)
+    else:
+      rebuilt_projects.append(project_id)
+
+  _LAST_RELOAD_AT = datetime.now(timezone.utc)
+  return WorkspaceConfigReloadData(
+    registry_reloaded=_REGISTRY_FILE.reloads > registry_reloads,
+    rebuilt_projects=rebuilt_projects,
+    unchanged_projects=unchanged_projects,
+    removed_projects=removed_projects,
+    metrics=get_config_cache_metrics(),
   )
 
 
-def get_workspace_project(project_id: str) -> WorkspaceProjectConfig:
-  config = get_workspace_config()
-  for project in config.projects:
-    if project.project_id == project_id:
-      return project
+def get_config_cache_metrics() -> ConfigCacheMetricsData:
+  with _PROJECT_CONFIG_LOCK:
+    counters = dict(_CONFIG_COUNTERS)
+    cached_projects = sorted(_PROJECT_CONFIGS)
+
+  artifact_caches = (_TEMPLATE_FILES, _REPORT_SOURCE_FILES)
+  return ConfigCacheMetricsData(
+    registry_loads=_REGISTRY_FILE.loads + _REGISTRY_FILE.reloads,
+    artifact_loads=sum(cache.loads for cache in artifact_caches),
+    artifact_reloads=sum(cache.reloads for cache in artifact_caches),
+    artifact_cache_hits=sum(cache.hits for cache in artifact_caches),
+    project_builds=counters["project_builds"],
+    project_rebuilds=counters["project_rebuilds"],
+    project_cache_hits=counters["project_cache_hits"],
+    cached_projects=cached_projects,
+    check_interval_seconds=get_config_reload_interval(),
+    last_reload_at=_LAST_RELOAD_AT.isoformat() if _LAST_RELOAD_AT else None,
+  )
+
+
+def get_registry_project(project_id: str) -> RegistryProject:
+  project = _load_registry().get_project(project_id)
+  if project is not None:
+    return project
 
   raise ApiError(
     status_code=404,
     code="NOT_FOUND",
-    message=f"Project config not found: {project_id}",
+    message=f"Project not found: {project_id}",
   )
 
 
+def get_workspace_project(project_id: str) -> WorkspaceProjectConfig:
+  return _get_project_entry(project_id).config
+
+
 def get_project_report_sources(project_id: str) -> list[RegistryReportSource]:
   project = get_registry_project(project_id)
   return sorted(project.report_sources, key=lambda item: item.order)
 
 
+def get_report_source_items(source: RegistryReportSource) -> tuple[dict[str, Any], ...]:
+  """Raw report items of one source pack, reloaded when its file changes."""
+  return _load_report_source_pack(source.report_json_path).items
+
+
 def get_project_document(project_id: str, document_id: str) -> ProjectDocumentReference | None:
-  project = get_workspace_project(project_id)
+  entry = _get_project_entry(project_id)
   normalized_document_id = document_id.strip()
 
-  for document in project.documents:
-    if document.document_id == normalized_document_id:
-      return document
+  document = entry.documents_by_id.get(normalized_document_id)
+  if document is not None:
+    return document
 
-  for key in _document_lookup_keys(normalized_document_id):
-    matched_document = _build_project_document_alias_index(project_id).get(key)
-    if matched_document is not None:
-      return matched_document
+  return entry.alias_index.get(_canonical_document_key(normalized_document_id))
 
-  return None
+
+def refresh_project_documents(project_id: str, *, force: bool = False) -> ProjectDocumentRefreshData:
+  """Pick up added or removed PDFs under a project's search root without restarting."""
+  project = get_registry_project(project_id)
+  if not project.document_search_root:
+    return ProjectDocumentRefreshData(
+      project_id=project_id,
+      scanned_directories=0,
+      unchanged_directories=0,
+      added_files=0,
+      removed_files=0,
+      document_count=len(get_workspace_project(project_id).documents),
+    )
+
+  result = _get_project_document_catalog(project.document_search_root).refresh(force=force)
+  if result.added_files or result.removed_files:
+    _expire_project_entry(project_id)
+
+  return ProjectDocumentRefreshData(
+    project_id=project_id,
+    scanned_directories=result.scanned_directories,
+    unchanged_directories=result.unchanged_directories,
+    added_files=result.added_files,
+    removed_files=result.removed_files,
+    document_count=result.document_count,
+  )
 
 
 def get_default_project_id() -> str:
-  return get_workspace_config().default_project_id
+  return _load_registry().default_project_id
 
 
 def get_default_project_template() -> NecTemplateData:
@@ -19,13 +19,16 @@ from app.schemas.reports import (
   ReportItem,
 )
 from app.services.project_service import (
-  _load_report_source_items,
+  RegistryReportSource,
+  SourcePack,
+  _load_report_source_pack,
   get_default_project_id,
   get_project_report_sources,
   get_workspace_project,
 )
 
 _REPORTS_LOCK = threading.Lock()
+_SEED_ITEMS_LOCK = threading.Lock()
 _MANUAL_VERDICTS = {"accepted", "rejected", "needs_followup"}
 _MANUAL_CATEGORIES = {"evidence_gap", "rule_dispute", "false_positive", "data_issue", "other"}
 _STATUS_NORMALIZATION_MAP = {
@@ -56,8 +59,17 @@ class StoredReport:
   cards: list[ReportItem]
 
 
+@dataclass(frozen=True, slots=True)
+class ReportStoreStats:
+  reports: int
+  cards: int
+  history_entries: int
+  seed_items: int
+
+
 _REPORTS: dict[str, StoredReport] = {}
 _MANUAL_REVIEW_HISTORY: dict[tuple[str, str], list[ManualReviewHistoryEntry]] = {}
+_SEED_ITEMS: dict[tuple[str, str, str], tuple[SourcePack, tuple[ReportItem, ...]]] = {}
 
 
 def _next_report_id() -> str:
@@ -154,20 +166,40 @@ def _normalize_seed_item(raw: dict[str, object], *, source_pack: str, status_pre
   return ReportItem.model_validate(normalized)
 
 
+def _normalized_source_items(source: RegistryReportSource) -> tuple[ReportItem, ...]:
+  """Seed items of one source, normalized once per loaded version of its source pack."""
+  pack = _load_report_source_pack(source.report_json_path)
+  key = (source.report_json_path, source.source_id, source.status_presentation)
+  with _SEED_ITEMS_LOCK:
+    cached = _SEED_ITEMS.get(key)
+  if cached is not None and cached[0] is pack:
+    return cached[1]
+
+  items = tuple(
+    _normalize_seed_item(
+      dict(raw),
+      source_pack=source.source_id,
+      status_presentation=source.status_presentation,
+    )
+    for raw in pack.items
+  )
+  with _SEED_ITEMS_LOCK:
+    _SEED_ITEMS[key] = (pack, items)
+  return items
+
+
 def _read_seed_items(project_id: str) -> list[ReportItem]:
   items: list[ReportItem] = []
   for source in get_project_report_sources(project_id):
-    for raw in _load_report_source_items(source.report_json_path):
-      items.append(
-        _normalize_seed_item(
-          dict(raw),
-          source_pack=source.source_id,
-          status_presentation=source.status_presentation,
-        )
-      )
+    items.extend(_normalized_source_items(source))
   return items
 
 
+def warm_seed_items(project_id: str) -> int:
+  """Normalize a project's seed items ahead of the first ingest; returns the item count."""
+  return len(_read_seed_items(project_id))
+
+
 def _normalize_history_manual_verdict(value: str | None) -> str | None:
   if value in _MANUAL_VERDICTS:
     return value
@@ -550,3 +582,20 @@ def get_manual_review_history(
     total=total,
     entries=history_entries[start:end],
   )
+
+
+def get_manual_review_histories(report_id: str, item_ids: list[str]) -> dict[str, list[ManualReviewHistoryEntry]]:
+  _find_report(report_id)
+
+  with _REPORTS_LOCK:
+    return {item_id: list(_MANUAL_REVIEW_HISTORY.get((report_id, item_id), [])) for item_id in item_ids}
+
+
+def get_report_store_stats() -> ReportStoreStats:
+  with _REPORTS_LOCK:
+    reports = len(_REPORTS)
+    cards = sum(len(report.cards) for report in _REPORTS.values())
+    history_entries = sum(len(entries) for entries in _MANUAL_REVIEW_HISTORY.values())
+  with _SEED_ITEMS_LOCK:
+    seed_items = sum(len(items) for _, items in _SEED_ITEMS.values())
+  return ReportStoreStats(reports=reports, cards=cards, history_entries=history_entries, seed_items=seed_items)
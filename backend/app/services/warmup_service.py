@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+
+from app.core.config import WarmupConfig, get_warmup_config
+from app.schemas.warmup import WarmupStatusData, WarmupTaskData
+from app.services.document_service import resolve_project_document_path
+from app.services.pdf_locator_service import warm_index
+from app.services.project_service import get_registry_project, get_workspace_project, get_workspace_summary
+from app.services.report_service import warm_seed_items
+
+logger = logging.getLogger(__name__)
+
+
+class WarmupState:
+  """Progress of one warmup run, shared between the worker pool and the readiness endpoint."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._tasks: dict[str, WarmupTaskData] = {}
+    self._enabled = False
+    self._started_at: datetime | None = None
+    self._finished_at: datetime | None = None
+
+  def start(self) -> None:
+    with self._lock:
+      self._enabled = True
+      self._tasks.clear()
+      self._started_at = datetime.now(timezone.utc)
+      self._finished_at = None
+
+  def finish(self) -> None:
+    with self._lock:
+      self._finished_at = datetime.now(timezone.utc)
+
+  def add_task(self, name: str) -> None:
+    with self._lock:
+      self._tasks.setdefault(name, WarmupTaskData(name=name))
+
+  def run_task(self, name: str, action: Callable[[], object]) -> bool:
+    self.add_task(name)
+    with self._lock:
+      self._tasks[name] = WarmupTaskData(name=name, status="running")
+    started = time.perf_counter()
+    try:
+      action()
+    except Exception as exc:
+      logger.warning("Warmup task %s failed: %s", name, exc)
+      status, error = "failed", str(exc) or exc.__class__.__name__
+    else:
+      status, error = "done", None
+    with self._lock:
+      self._tasks[name] = WarmupTaskData(
+        name=name,
+        status=status,
+        duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        error=error,
+      )
+    return error is None
+
+  def snapshot(self) -> WarmupStatusData:
+    with self._lock:
+      tasks = [task.model_copy() for task in self._tasks.values()]
+      enabled = self._enabled
+      started_at = self._started_at
+      finished_at = self._finished_at
+
+    completed = sum(1 for task in tasks if task.status in {"done", "failed"})
+    failed = sum(1 for task in tasks if task.status == "failed")
+    if not enabled:
+      status = "disabled"
+    elif finished_at is None:
+      status = "running"
+    else:
+      status = "degraded" if failed else "ready"
+
+    return WarmupStatusData(
+      status=status,
+      ready=status in {"disabled", "ready", "degraded"},
+      total=len(tasks),
+      completed=completed,
+      failed=failed,
+      started_at=started_at.isoformat() if started_at else None,
+      finished_at=finished_at.isoformat() if finished_at else None,
+      tasks=tasks,
+    )
+
+
+_WARMUP_STATE = WarmupState()
+
+
+def _warmup_project_ids(config: WarmupConfig) -> list[str]:
+  summary = get_workspace_summary()
+  if config.all_projects:
+    return [project.project_id for project in summary.projects]
+  if config.projects:
+    return list(config.projects)
+  return [summary.default_project_id]
+
+
+def run_warmup(config: WarmupConfig, state: WarmupState) -> None:
+  """Build registry, project configs, seed items and locator indexes, in that dependency order.
+
+  Work runs on a thread pool so the caches being filled are the ones this process serves from.
+  `state` must already be started.
+  """
+  try:
+    project_ids: list[str] = []
+    state.run_task("registry", lambda: project_ids.extend(_warmup_project_ids(config)))
+
+    with ThreadPoolExecutor(max_workers=config.workers, thread_name_prefix="warmup") as pool:
+      for project_id in project_ids:
+        state.add_task(f"project:{project_id}")
+      project_futures = {
+        project_id: pool.submit(
+          state.run_task,
+          f"project:{project_id}",
+          lambda project_id=project_id: get_workspace_project(project_id),
+        )
+        for project_id in project_ids
+      }
+      wait(project_futures.values())
+
+      futures = []
+      for project_id in project_ids:
+        if not project_futures[project_id].result():
+          continue
+        if get_registry_project(project_id).report_sources:
+          state.add_task(f"seed:{project_id}")
+          futures.append(
+            pool.submit(state.run_task, f"seed:{project_id}", lambda project_id=project_id: warm_seed_items(project_id))
+          )
+        if not config.locator_indexes:
+          continue
+
+        documents = get_workspace_project(project_id).documents
+        if config.max_documents:
+          documents = documents[: config.max_documents]
+        for document in documents:
+          name = f"index:{project_id}/{document.document_id}"
+          state.add_task(name)
+          futures.append(
+            pool.submit(
+              state.run_task,
+              name,
+              lambda project_id=project_id, document_id=document.document_id: warm_index(
+                resolve_project_document_path(project_id, document_id)
+              ),
+            )
+          )
+      wait(futures)
+  except Exception:
+    logger.exception("Warmup aborted")
+  finally:
+    state.finish()
+
+
+def start_warmup(config: WarmupConfig | None = None) -> threading.Thread | None:
+  """Run warmup in a background thread so the server accepts connections while it progresses."""
+  active_config = config or get_warmup_config()
+  if not active_config.enabled:
+    return None
+
+  _WARMUP_STATE.start()
+  thread = threading.Thread(target=run_warmup, args=(active_config, _WARMUP_STATE), name="warmup", daemon=True)
+  thread.start()
+  return thread
+
+
+def get_warmup_status() -> WarmupStatusData:
+  return _WARMUP_STATE.snapshot()
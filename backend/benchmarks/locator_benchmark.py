@@ -0,0 +1,345 @@
+"""Latency benchmark for `locate_evidence` over the golden cases and the project source packs.
+
+Run from `backend/`:
+
+  python -m benchmarks.locator_benchmark --output .cache/benchmarks/locator.json
+  python -m benchmarks.locator_benchmark --baseline .cache/benchmarks/locator.json --threshold 0.2
+
+Each document is measured cold (index built from scratch) and warm (cached index, repeated
+passes). A comparison against a saved report exits non-zero when any tracked metric regresses by
+more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import resource
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from app.core.errors import ApiError
+from app.core.metrics import Counter
+from app.services.document_service import resolve_document_path, resolve_project_document_path
+from app.services.pdf_locator_service import (
+  LOCATOR_STAGE_LINES,
+  LOCATOR_STAGE_RESULTS,
+  clear_index_cache,
+  locate_evidence,
+  warm_index,
+)
+from app.services.project_service import get_project_report_sources, get_report_source_items
+
+GOLDEN_CASES_PATH = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "golden" / "evidence_cases.json"
+DEFAULT_PACK_PROJECT_ID = "hy202214"
+REPORT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkCase:
+  case_id: str
+  suite: str
+  document_id: str
+  pdf_path: Path
+  evidence_text: str
+  clause_keyword: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+  metric: str
+  baseline: float
+  current: float
+
+  @property
+  def ratio(self) -> float:
+    return self.current / self.baseline if self.baseline else float("inf")
+
+
+def load_golden_cases(skipped: list[str]) -> list[BenchmarkCase]:
+  payload = json.loads(GOLDEN_CASES_PATH.read_text(encoding="utf-8"))
+  cases: list[BenchmarkCase] = []
+  for case in payload["positive_cases"]:
+    try:
+      pdf_path = resolve_document_path(case["document_id"])
+    except ApiError as exc:
+      skipped.append(f"golden/{case['case_id']}: {exc.message}")
+      continue
+    cases.append(
+      BenchmarkCase(
+        case_id=case["case_id"],
+        suite="golden",
+        document_id=case["document_id"],
+        pdf_path=pdf_path,
+        evidence_text=case["evidence_text"],
+        clause_keyword=case.get("clause_keyword"),
+      )
+    )
+  return cases
+
+
+def load_source_pack_cases(project_id: str, skipped: list[str], *, limit_per_source: int = 0) -> list[BenchmarkCase]:
+  """One case per source pack item, resolved against its first referenced document."""
+  cases: list[BenchmarkCase] = []
+  for source in get_project_report_sources(project_id):
+    items = get_report_source_items(source)
+    if limit_per_source:
+      items = items[:limit_per_source]
+    for item in items:
+      references = item.get("document_references") or []
+      evidence_text = str(item.get("evidence") or "")
+      if not references or not evidence_text:
+        continue
+      try:
+        pdf_path = resolve_project_document_path(project_id, references[0])
+      except ApiError as exc:
+        skipped.append(f"{source.source_id}/{item.get('item_id')}: {exc.message}")
+        continue
+      cases.append(
+        BenchmarkCase(
+          case_id=str(item.get("item_id")),
+          suite=source.source_id,
+          document_id=references[0],
+          pdf_path=pdf_path,
+          evidence_text=evidence_text,
+        )
+      )
+  return cases
+
+
+def percentile(values: list[float], q: float) -> float:
+  """Linearly interpolated percentile, `q` in [0, 100]."""
+  if not values:
+    return 0.0
+  ordered = sorted(values)
+  position = (len(ordered) - 1) * q / 100.0
+  lower = int(position)
+  upper = min(lower + 1, len(ordered) - 1)
+  return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize_latencies(samples_ms: list[float]) -> dict[str, float]:
+  return {
+    "count": len(samples_ms),
+    "mean_ms": round(sum(samples_ms) / len(samples_ms), 3) if samples_ms else 0.0,
+    "p50_ms": round(percentile(samples_ms, 50), 3),
+    "p95_ms": round(percentile(samples_ms, 95), 3),
+    "p99_ms": round(percentile(samples_ms, 99), 3),
+  }
+
+
+def peak_rss_mb() -> float:
+  """Peak resident set size of the whole process so far, so it is only reported for a full run."""
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  # Linux reports kilobytes, macOS bytes.
+  divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+  return round(peak / divisor, 1)
+
+
+def _time_locate(case: BenchmarkCase) -> float:
+  started = time.perf_counter()
+  locate_evidence(case.pdf_path, case.evidence_text, clause_keyword=case.clause_keyword)
+  return (time.perf_counter() - started) * 1000
+
+
+def _counter_snapshot(metric: Counter) -> dict[str, float]:
+  return {dict(labels)["stage"]: value for labels, value in metric.collect().samples}
+
+
+def _stage_counts(before: dict[str, dict[str, float]]) -> dict[str, dict[str, int]]:
+  """Stage counter increments since `before`, which is the same shape taken earlier."""
+  counts: dict[str, dict[str, int]] = {}
+  for name, metric in (("results", LOCATOR_STAGE_RESULTS), ("lines", LOCATOR_STAGE_LINES)):
+    previous = before.get(name, {})
+    counts[name] = {
+      stage: int(value - previous.get(stage, 0.0)) for stage, value in sorted(_counter_snapshot(metric).items())
+    }
+  return counts
+
+
+def _group_by_document(cases: Iterable[BenchmarkCase]) -> dict[Path, list[BenchmarkCase]]:
+  groups: dict[Path, list[BenchmarkCase]] = {}
+  for case in cases:
+    groups.setdefault(case.pdf_path, []).append(case)
+  return groups
+
+
+def run_benchmark(cases: list[BenchmarkCase], *, suite: str = "all", warm_iterations: int = 3) -> dict[str, Any]:
+  documents: dict[str, Any] = {}
+  cold_samples: list[float] = []
+  warm_samples: list[float] = []
+  warm_seconds = 0.0
+  stage_baseline = {
+    "results": _counter_snapshot(LOCATOR_STAGE_RESULTS),
+    "lines": _counter_snapshot(LOCATOR_STAGE_LINES),
+  }
+
+  for pdf_path, document_cases in _group_by_document(cases).items():
+    clear_index_cache(pdf_path)
+    started = time.perf_counter()
+    line_count = warm_index(pdf_path)
+    index_build_ms = (time.perf_counter() - started) * 1000
+
+    clear_index_cache(pdf_path)
+    cold_ms = _time_locate(document_cases[0])
+    cold_samples.append(cold_ms)
+
+    document_warm: list[float] = []
+    started = time.perf_counter()
+    for _ in range(warm_iterations):
+      document_warm.extend(_time_locate(case) for case in document_cases)
+    elapsed = time.perf_counter() - started
+    warm_seconds += elapsed
+    warm_samples.extend(document_warm)
+
+    documents[pdf_path.name] = {
+      "document_id": document_cases[0].document_id,
+      "cases": len(document_cases),
+      "index_lines": line_count,
+      "index_build_ms": round(index_build_ms, 3),
+      "cold_ms": round(cold_ms, 3),
+      "warm": summarize_latencies(document_warm),
+      "throughput_per_s": round(len(document_warm) / elapsed, 2) if elapsed else 0.0,
+    }
+
+  return {
+    "version": REPORT_VERSION,
+    "generated_at": datetime.now(timezone.utc).isoformat(),
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "suite": suite,
+    "case_count": len(cases),
+    "warm_iterations": warm_iterations,
+    "overall": {
+      "cold": summarize_latencies(cold_samples),
+      "warm": summarize_latencies(warm_samples),
+      "throughput_per_s": round(len(warm_samples) / warm_seconds, 2) if warm_seconds else 0.0,
+      "peak_rss_mb": peak_rss_mb(),
+      "stages": _stage_counts(stage_baseline),
+    },
+    "documents": documents,
+  }
+
+
+def _tracked_metrics(report: dict[str, Any]) -> dict[str, tuple[float, str]]:
+  overall = report["overall"]
+  metrics: dict[str, tuple[float, str]] = {
+    "overall.cold.p50_ms": (overall["cold"]["p50_ms"], "ms"),
+    "overall.cold.p95_ms": (overall["cold"]["p95_ms"], "ms"),
+    "overall.warm.p50_ms": (overall["warm"]["p50_ms"], "ms"),
+    "overall.warm.p95_ms": (overall["warm"]["p95_ms"], "ms"),
+    "overall.warm.p99_ms": (overall["warm"]["p99_ms"], "ms"),
+    "overall.peak_rss_mb": (overall["peak_rss_mb"], "mb"),
+  }
+  for name, document in report["documents"].items():
+    metrics[f"documents.{name}.index_build_ms"] = (document["index_build_ms"], "ms")
+    metrics[f"documents.{name}.warm.p95_ms"] = (document["warm"]["p95_ms"], "ms")
+  return metrics
+
+
+def compare_reports(
+  current: dict[str, Any],
+  baseline: dict[str, Any],
+  *,
+  threshold: float = 0.2,
+  min_delta_ms: float = 2.0,
+  min_delta_mb: float = 16.0,
+) -> list[Regression]:
+  """Metrics that grew by more than `threshold` (relative) and the unit's floor (absolute).
+
+  The absolute floors keep sub-millisecond jitter on tiny documents from failing a run. Metrics
+  present in only one of the reports are ignored, as are the overall ones when the two runs
+  covered different cases.
+  """
+  current_metrics = _tracked_metrics(current)
+  baseline_metrics = _tracked_metrics(baseline)
+  same_cases = (current.get("suite"), current.get("case_count")) == (baseline.get("suite"), baseline.get("case_count"))
+  floors = {"ms": min_delta_ms, "mb": min_delta_mb}
+
+  regressions: list[Regression] = []
+  for metric, (baseline_value, unit) in baseline_metrics.items():
+    if metric not in current_metrics or (metric.startswith("overall.") and not same_cases):
+      continue
+    current_value = current_metrics[metric][0]
+    if current_value > baseline_value * (1 + threshold) and current_value - baseline_value >= floors[unit]:
+      regressions.append(Regression(metric=metric, baseline=baseline_value, current=current_value))
+  return regressions
+
+
+def _print_report(report: dict[str, Any]) -> None:
+  print(f"{'document':<48} {'cases':>5} {'build ms':>9} {'cold ms':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'/s':>8}")
+  for name, document in report["documents"].items():
+    warm = document["warm"]
+    print(
+      f"{name[:48]:<48} {document['cases']:>5} {document['index_build_ms']:>9.1f} {document['cold_ms']:>9.1f} "
+      f"{warm['p50_ms']:>8.2f} {warm['p95_ms']:>8.2f} {warm['p99_ms']:>8.2f} {document['throughput_per_s']:>8.1f}"
+    )
+  overall = report["overall"]
+  print(
+    f"overall: {report['case_count']} cases, warm p50 {overall['warm']['p50_ms']:.2f} ms, "
+    f"p95 {overall['warm']['p95_ms']:.2f} ms, p99 {overall['warm']['p99_ms']:.2f} ms, "
+    f"cold p95 {overall['cold']['p95_ms']:.1f} ms, {overall['throughput_per_s']:.1f}/s, "
+    f"peak RSS {overall['peak_rss_mb']:.1f} MB"
+  )
+  stages = overall["stages"]
+  print(
+    "stages: "
+    + ", ".join(f"{stage} results {count}" for stage, count in stages["results"].items())
+    + "; "
+    + ", ".join(f"{stage} lines {count}" for stage, count in stages["lines"].items())
+  )
+
+
+def main(argv: list[str] | None = None) -> int:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument("--suite", choices=("golden", "packs", "all"), default="all")
+  parser.add_argument("--project", default=DEFAULT_PACK_PROJECT_ID, help="project whose source packs are benchmarked")
+  parser.add_argument("--limit", type=int, default=0, help="max items per source pack (0 = all)")
+  parser.add_argument("--warm-iterations", type=int, default=3)
+  parser.add_argument("--output", type=Path, help="write the report JSON here, e.g. to save a baseline")
+  parser.add_argument("--baseline", type=Path, help="compare against a previously saved report")
+  parser.add_argument("--threshold", type=float, default=0.2, help="allowed relative slowdown (0.2 = 20%%)")
+  parser.add_argument("--min-delta-ms", type=float, default=2.0)
+  args = parser.parse_args(argv)
+
+  skipped: list[str] = []
+  cases: list[BenchmarkCase] = []
+  if args.suite in {"golden", "all"}:
+    cases.extend(load_golden_cases(skipped))
+  if args.suite in {"packs", "all"}:
+    cases.extend(load_source_pack_cases(args.project, skipped, limit_per_source=args.limit))
+  for note in skipped:
+    print(f"skipped {note}", file=sys.stderr)
+  if not cases:
+    print("no benchmark cases could be resolved", file=sys.stderr)
+    return 2
+
+  report = run_benchmark(cases, suite=args.suite, warm_iterations=max(1, args.warm_iterations))
+  _print_report(report)
+
+  if args.output:
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+  if args.baseline:
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare_reports(report, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    for regression in regressions:
+      print(
+        f"REGRESSION {regression.metric}: {regression.baseline:.2f} -> {regression.current:.2f} "
+        f"({regression.ratio:.2f}x)",
+        file=sys.stderr,
+      )
+    if regressions:
+      return 1
+  return 0
+
+
+if __name__ == "__main__":
+  raise SystemExit(main())
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
+import json
+from collections import Counter
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
+from app import main
+from app.api.v1.endpoints import projects
+from app.core.config import SlowRequestConfig
+from app.core.profiling import StackSampler
+from app.services import page_render_service, pdf_locator_service
+from app.services.document_service import resolve_project_document_path
+
 
 def test_ingest_resolve_and_export_end_to_end(client: TestClient) -> None:
   ingest_response = client.post(
@@ -102,6 +115,14 @@ def test_ingest_resolve_and_export_end_to_end(client: TestClient) -> None:
   assert export_pdf.headers["content-type"].startswith("application/pdf")
   assert export_pdf.content.startswith(b"%PDF")
 
+  export_csv = client.post("/api/v1/exports/report", json={**export_payload, "format": "csv"})
+  assert export_csv.status_code == 200
+  assert export_csv.headers["content-type"].startswith("text/csv")
+  csv_lines = export_csv.text.splitlines()
+  assert csv_lines[0].startswith("index,item_id,")
+  assert first_card["item_id"] in csv_lines[1]
+  assert "Need legal team review." in export_csv.text
+
 
 def test_seed_ingest_resets_manual_review_fields(client: TestClient) -> None:
   ingest_response = client.post(
@@ -125,6 +146,63 @@ def test_seed_ingest_resets_manual_review_fields(client: TestClient) -> None:
     assert card["manual_verdict_note"] is None
 
 
+def test_resolve_can_search_all_referenced_documents(client: TestClient) -> None:
+  ingest_response = client.post(
+    "/api/v1/reports/ingest",
+    json={
+      "report_source": "pytest-multi-document",
+      "report_items": [],
+    },
+  )
+  report_id = ingest_response.json()["data"]["report_id"]
+  card = client.get(f"/api/v1/reports/{report_id}/cards").json()["data"]["cards"][0]
+
+  resolve_response = client.post(
+    "/api/v1/evidence/resolve",
+    json={
+      "report_id": report_id,
+      "item_id": card["item_id"],
+      "document_id": card["document_references"][0],
+      "evidence_text": card["evidence"],
+      "search_all_references": True,
+    },
+  )
+  assert resolve_response.status_code == 200
+
+  data = resolve_response.json()["data"]
+  assert set(data["searched_document_ids"]) <= set(card["document_references"])
+  assert [anchor["document_id"] for anchor in data["anchors"]] == data["searched_document_ids"]
+  assert data["document_id"] == data["anchors"][0]["document_id"]
+
+
+def test_resolve_debug_reports_stage_timings(client: TestClient) -> None:
+  ingest_response = client.post(
+    "/api/v1/reports/ingest",
+    json={
+      "report_source": "pytest-stage-timing",
+      "report_items": [],
+    },
+  )
+  report_id = ingest_response.json()["data"]["report_id"]
+  card = client.get(f"/api/v1/reports/{report_id}/cards").json()["data"]["cards"][0]
+  payload = {
+    "report_id": report_id,
+    "item_id": card["item_id"],
+    "document_id": card["document_references"][0],
+    "evidence_text": card["evidence"],
+  }
+
+  plain_response = client.post("/api/v1/evidence/resolve", json=payload)
+  assert plain_response.json()["data"]["debug"] is None
+  assert "total;dur=" in plain_response.headers["server-timing"]
+
+  debug_response = client.post("/api/v1/evidence/resolve", json={**payload, "debug": True})
+  debug = debug_response.json()["data"]["debug"]
+  assert {"index", "query", "exact"} <= set(debug["stages_ms"])
+  assert debug["total_ms"] >= debug["stages_ms"]["exact"]
+  assert "exact;dur=" in debug_response.headers["server-timing"]
+
+
 def test_workspace_config_exposes_projects(client: TestClient) -> None:
   response = client.get("/api/v1/projects/config")
   assert response.status_code == 200
@@ -219,3 +297,246 @@ def test_project_document_route_accepts_hy_document_aliases(client: TestClient)
     response = client.get(f"/api/v1/projects/hy202214/documents/{document_alias}/file")
     assert response.status_code == 200
     assert response.headers["content-type"].startswith("application/pdf")
+
+
+def test_project_document_route_supports_conditional_and_range_requests(client: TestClient) -> None:
+  url = "/api/v1/projects/hy202214/documents/I-HY_2022_14-GCT-00/file"
+  full = client.get(url)
+  assert full.status_code == 200
+  etag = full.headers["etag"]
+  assert etag.startswith('"') and len(etag) == 66
+  assert full.headers["cache-control"]
+  assert full.headers["accept-ranges"] == "bytes"
+
+  not_modified = client.get(url, headers={"If-None-Match": f'W/"stale", {etag}'})
+  assert not_modified.status_code == 304
+  assert not_modified.headers["etag"] == etag
+  assert not_modified.content == b""
+
+  since = client.get(url, headers={"If-Modified-Since": full.headers["last-modified"]})
+  assert since.status_code == 304
+  assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+  single = client.get(url, headers={"Range": "bytes=0-99"})
+  assert single.status_code == 206
+  assert single.content == full.content[:100]
+  assert single.headers["content-range"] == f"bytes 0-99/{len(full.content)}"
+
+  multi = client.get(url, headers={"Range": "bytes=500-599, 0-9, 5-19"})
+  assert multi.status_code == 206
+  content_type = multi.headers["content-type"]
+  assert content_type.startswith("multipart/byteranges; boundary=")
+  assert "content-range" not in multi.headers
+  assert int(multi.headers["content-length"]) == len(multi.content)
+  boundary = content_type.split("boundary=", 1)[1]
+  parts = multi.content.split(f"--{boundary}".encode())
+  assert parts[-1] == b"--\r\n"
+  bodies = [part.split(b"\r\n\r\n", 1) for part in parts[1:-1]]
+  assert [head.split(b"Content-Range: ")[1] for head, _ in bodies] == [
+    f"bytes 0-19/{len(full.content)}".encode(),
+    f"bytes 500-599/{len(full.content)}".encode(),
+  ]
+  assert [body[:-2] for _, body in bodies] == [full.content[:20], full.content[500:600]]
+
+  stale_if_range = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+  assert stale_if_range.status_code == 200
+  assert client.get(url, headers={"Range": "bytes=0-9", "If-Range": etag}).status_code == 206
+
+
+def test_project_document_page_image_and_tile_routes(
+  client: TestClient,
+  tmp_path: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  config = replace(page_render_service.get_page_render_config(), cache_dir=tmp_path)
+  monkeypatch.setattr(page_render_service, "get_page_render_config", lambda: config)
+  base_url = "/api/v1/projects/hy202214/documents/I-HY_2022_14-GCT-00/pages"
+
+  page = client.get(f"{base_url}/1.png", params={"scale": 0.5})
+  assert page.status_code == 200
+  assert page.headers["content-type"] == "image/png"
+  assert page.content.startswith(b"\x89PNG")
+
+  tile = client.get(f"{base_url}/1/tiles/0/0.png")
+  assert tile.status_code == 200
+  assert tile.content.startswith(b"\x89PNG")
+
+  # Revalidation is answered from the ETag alone, without reading or rendering the PNG.
+  with monkeypatch.context() as patch:
+    patch.setattr(projects, "get_page_image", lambda *_args, **_kwargs: pytest.fail("page image loaded"))
+    patch.setattr(projects, "get_page_tile", lambda *_args, **_kwargs: pytest.fail("page tile loaded"))
+    revalidated = client.get(f"{base_url}/1.png", params={"scale": 0.5}, headers={"If-None-Match": page.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert client.get(f"{base_url}/1/tiles/0/0.png", headers={"If-None-Match": tile.headers["etag"]}).status_code == 304
+
+  missing = client.get(f"{base_url}/9999.png")
+  assert missing.status_code == 404
+  assert missing.json()["code"] == "NOT_FOUND"
+
+
+def test_project_document_page_text_route_serves_compressed_index_lines(
+  client: TestClient,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  url = "/api/v1/projects/hy202214/documents/I-HY_2022_14-GCT-00/pages/1/text"
+  response = client.get(url, headers={"Accept-Encoding": "gzip"})
+  assert response.status_code == 200
+  assert response.headers["content-encoding"] == "gzip"
+  assert response.headers["vary"] == "Accept-Encoding"
+  payload = response.json()
+  assert payload["page"] == 1
+  assert payload["fields"] == ["x0", "y0", "x1", "y1", "block", "line", "text"]
+  assert payload["lines"]
+  x0, y0, x1, y1, _block, _line, text = payload["lines"][0]
+  assert 0 <= x0 < x1 <= payload["width"] and 0 <= y0 < y1 <= payload["height"]
+  assert text.strip()
+
+  identity = client.get(url, headers={"Accept-Encoding": "identity"})
+  assert "content-encoding" not in identity.headers
+  assert identity.json() == payload
+  assert identity.headers["etag"] != response.headers["etag"]
+
+  # Revalidation and repeat downloads are answered without loading the page's lines again.
+  monkeypatch.setattr(projects, "get_page_text_layer", lambda *_args: pytest.fail("text layer reloaded"))
+  revalidated = client.get(url, headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+  assert revalidated.status_code == 304
+  assert revalidated.headers["etag"] == response.headers["etag"]
+  assert client.get(url, headers={"If-None-Match": identity.headers["etag"]}).status_code == 304
+  repeated = client.get(url, headers={"Accept-Encoding": "gzip"})
+  assert repeated.content == response.content and repeated.headers["etag"] == response.headers["etag"]
+  monkeypatch.undo()
+  assert client.get("/api/v1/projects/hy202214/documents/I-HY_2022_14-GCT-00/pages/0/text").status_code == 404
+
+
+def test_project_document_refresh_route_reports_catalog_state(client: TestClient) -> None:
+  response = client.post("/api/v1/projects/hy202214/documents/refresh")
+  assert response.status_code == 200
+  payload = response.json()["data"]
+  assert payload["project_id"] == "hy202214"
+  assert payload["document_count"] > 0
+  assert payload["added_files"] == 0 and payload["removed_files"] == 0
+
+  assert client.post("/api/v1/projects/unknown-project/documents/refresh").status_code == 404
+
+
+def test_admin_config_reload_and_metrics(client: TestClient) -> None:
+  client.get("/api/v1/projects/config")
+  response = client.post("/api/v1/admin/config/reload")
+  assert response.status_code == 200
+  payload = response.json()["data"]
+  assert payload["rebuilt_projects"] == []
+  assert "hy202214" in payload["unchanged_projects"]
+
+  metrics = client.get("/api/v1/admin/config/metrics").json()["data"]
+  assert metrics["project_cache_hits"] > 0
+  assert metrics["last_reload_at"] is not None
+
+
+def test_project_summary_and_single_project_config_routes(client: TestClient) -> None:
+  summary = client.get("/api/v1/projects")
+  assert summary.status_code == 200
+  summary_payload = summary.json()["data"]
+  project_ids = [project["project_id"] for project in summary_payload["projects"]]
+  assert summary_payload["default_project_id"] in project_ids
+  assert "hy202214" in project_ids
+
+  full_config = client.get("/api/v1/projects/config").json()["data"]
+  single = client.get("/api/v1/projects/hy202214/config")
+  assert single.status_code == 200
+  assert single.json()["data"] == next(project for project in full_config["projects"] if project["project_id"] == "hy202214")
+  assert client.get("/api/v1/projects/unknown-project/config").status_code == 404
+
+
+def test_ready_route_reports_warmup_state(client: TestClient) -> None:
+  response = client.get("/api/v1/ready")
+  assert response.status_code == 200
+  payload = response.json()["data"]
+  assert payload["status"] == "disabled"
+  assert payload["ready"] is True
+
+
+def test_admin_locator_index_stats_and_invalidation(client: TestClient) -> None:
+  pdf_locator_service.warm_index(resolve_project_document_path("hy202214", "I-HY_2022_14-PS-APP-J1-00"))
+
+  stats = client.get("/api/v1/admin/locator-index").json()["data"]
+  assert stats["documents"] >= 1
+  assert stats["bytes"] > 0 and stats["max_bytes"] > 0
+
+  response = client.post(
+    "/api/v1/admin/locator-index/invalidate",
+    json={"project_id": "hy202214", "document_id": "I-HY_2022_14-PS-APP-J1-00"},
+  )
+  assert response.status_code == 200
+  payload = response.json()["data"]
+  assert payload["invalidated"] == 1
+  assert payload["cache"]["documents"] == stats["documents"] - 1
+
+  assert client.post("/api/v1/admin/locator-index/invalidate", json={}).json()["data"]["cache"]["documents"] == 0
+
+
+def test_metrics_route_exposes_prometheus_text(client: TestClient) -> None:
+  assert client.get("/api/v1/health").status_code == 200
+
+  response = client.get("/metrics")
+  assert response.status_code == 200
+  assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+  body = response.text
+  assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/health",status="200"}' in body
+  assert "# TYPE http_requests_in_flight gauge" in body
+  assert "locator_index_hit_ratio " in body
+  assert "report_store_reports " in body
+  assert "pdf_open_documents " in body
+  assert "request_threadpool_queue_depth " in body
+  assert 'config_cache_loads_total{kind="registry"}' in body
+
+
+def test_slow_requests_are_logged_with_a_profile(
+  client: TestClient,
+  monkeypatch: pytest.MonkeyPatch,
+  tmp_path: Path,
+  caplog: pytest.LogCaptureFixture,
+) -> None:
+  config = SlowRequestConfig(threshold_ms=0.001, profile_rate=1.0, profile_interval_ms=1.0, profile_dir=tmp_path)
+  monkeypatch.setattr(main, "get_slow_request_config", lambda: config)
+
+  class _SampledOnce(StackSampler):
+    # A fast request can finish before the first tick; record one stack so a profile is always due.
+    def stop(self) -> Counter[str]:
+      stacks = super().stop()
+      stacks["MainThread;handler (test_report_endpoints.py:1)"] += 1
+      return stacks
+
+  monkeypatch.setattr(main, "StackSampler", _SampledOnce)
+
+  with caplog.at_level("WARNING", logger="app.slow_requests"):
+    response = client.get("/api/v1/projects/hy202214/config", headers={"X-Request-Id": "slow-1"})
+  assert response.status_code == 200
+
+  (record,) = [json.loads(entry.getMessage()) for entry in caplog.records if entry.name == "app.slow_requests"]
+  assert record["event"] == "slow_request"
+  assert record["request_id"] == "slow-1"
+  assert record["route"] == "/api/v1/projects/{project_id}/config"
+  assert record["response_bytes"] == len(response.content)
+  assert record["duration_ms"] >= record["headers_ms"]
+  assert record["request_bytes"] == 0
+  profile = Path(record["profile"])
+  assert profile.parent == tmp_path
+  assert profile.is_file()
+  assert "MainThread;handler (test_report_endpoints.py:1) " in profile.read_text(encoding="utf-8")
+
+
+def test_slow_request_log_tolerates_a_malformed_content_length(
+  client: TestClient,
+  monkeypatch: pytest.MonkeyPatch,
+  caplog: pytest.LogCaptureFixture,
+) -> None:
+  config = SlowRequestConfig(threshold_ms=0.001, profile_rate=0.0)
+  monkeypatch.setattr(main, "get_slow_request_config", lambda: config)
+
+  with caplog.at_level("WARNING", logger="app.slow_requests"):
+    response = client.get("/api/v1/projects/hy202214/config", headers={"Content-Length": "abc"})
+  assert response.status_code == 200
+
+  (record,) = [json.loads(entry.getMessage()) for entry in caplog.records if entry.name == "app.slow_requests"]
+  assert record["request_bytes"] is None
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from benchmarks.locator_benchmark import compare_reports, percentile, summarize_latencies
+
+
+def _report(*, warm_p95: float, build_ms: float, rss_mb: float = 100.0, case_count: int = 4) -> dict:
+  warm = {"count": case_count, "mean_ms": 10.0, "p50_ms": 10.0, "p95_ms": warm_p95, "p99_ms": warm_p95}
+  return {
+    "suite": "all",
+    "case_count": case_count,
+    "overall": {
+      "cold": {"count": 1, "mean_ms": 500.0, "p50_ms": 500.0, "p95_ms": 500.0, "p99_ms": 500.0},
+      "warm": warm,
+      "throughput_per_s": 50.0,
+      "peak_rss_mb": rss_mb,
+    },
+    "documents": {"a.pdf": {"index_build_ms": build_ms, "warm": warm}},
+  }
+
+
+def test_percentile_interpolates_between_samples() -> None:
+  samples = [4.0, 1.0, 3.0, 2.0]
+
+  assert percentile(samples, 50) == 2.5
+  assert percentile(samples, 100) == 4.0
+  assert percentile([], 95) == 0.0
+  assert summarize_latencies(samples)["p50_ms"] == 2.5
+
+
+def test_compare_reports_flags_only_material_regressions() -> None:
+  baseline = _report(warm_p95=20.0, build_ms=100.0)
+
+  assert compare_reports(_report(warm_p95=23.0, build_ms=110.0), baseline, threshold=0.2) == []
+
+  regressions = compare_reports(_report(warm_p95=30.0, build_ms=100.0, rss_mb=180.0), baseline, threshold=0.2)
+  assert {regression.metric for regression in regressions} == {
+    "overall.warm.p95_ms",
+    "overall.warm.p99_ms",
+    "overall.peak_rss_mb",
+    "documents.a.pdf.warm.p95_ms",
+  }
+  assert regressions[0].ratio == 1.5
+
+
+def test_compare_reports_applies_absolute_floor_and_skips_overall_for_other_cases() -> None:
+  baseline = _report(warm_p95=1.0, build_ms=1.0)
+
+  assert compare_reports(_report(warm_p95=1.8, build_ms=1.5), baseline, threshold=0.2, min_delta_ms=2.0) == []
+
+  regressions = compare_reports(_report(warm_p95=30.0, build_ms=1.0, case_count=9), baseline, threshold=0.2)
+  assert [regression.metric for regression in regressions] == ["documents.a.pdf.warm.p95_ms"]
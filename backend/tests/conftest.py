@@ -7,13 +7,27 @@ from typing import Any
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import get_page_render_config
 from app.main import app
+from app.services import document_catalog_service
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 REFERENCE_REPORT_PATH = PROJECT_ROOT / "backend" / "data" / "reports" / "seed-report-cards.json"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def backend_cache_dirs(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  """Keep page renders and document catalog manifests out of the working tree's `.cache`."""
+  cache_dir = tmp_path_factory.mktemp("backend-cache")
+  with pytest.MonkeyPatch.context() as patch:
+    patch.setenv("PAGE_RENDER_CACHE_DIR", str(cache_dir / "page-images"))
+    patch.setattr(document_catalog_service, "DOCUMENT_CATALOG_DIR", cache_dir / "document-catalog")
+    get_page_render_config.cache_clear()
+    yield cache_dir
+  get_page_render_config.cache_clear()
+
+
 @pytest.fixture(scope="session")
 def client() -> TestClient:
   with TestClient(app) as test_client:
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.metrics import counter, gauge, register_executor, render_prometheus, unregister_executor
+
+
+def test_render_prometheus_escapes_labels_and_reports_executors() -> None:
+  lookups = counter("pytest_lookups_total", "Lookups in tests.", label_names=("key",))
+  lookups.inc(key='a"b')
+  lookups.inc(2, key='a"b')
+
+  with ThreadPoolExecutor(max_workers=2) as pool:
+    register_executor("pytest-pool", pool)
+    try:
+      pool.submit(lambda: None).result()
+      body = render_prometheus()
+    finally:
+      unregister_executor("pytest-pool")
+
+  assert "# TYPE pytest_lookups_total counter" in body
+  assert 'pytest_lookups_total{key="a\\"b"} 3' in body
+  assert 'executor_max_workers{pool="pytest-pool"} 2' in body
+  assert 'executor_queue_depth{pool="pytest-pool"} 0' in body
+  assert 'pool="pytest-pool"' not in render_prometheus()
+
+
+def test_registering_a_name_as_another_kind_fails() -> None:
+  registered = counter("pytest_kind_total", "Kind checks in tests.")
+  assert counter("pytest_kind_total", "Kind checks in tests.") is registered
+  with pytest.raises(ValueError, match="already registered as a counter"):
+    gauge("pytest_kind_total", "Kind checks in tests.")
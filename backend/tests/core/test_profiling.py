@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+from app.core.profiling import StackSampler, write_folded_profile
+
+
+def _busy(seconds: float) -> None:
+  deadline = time.perf_counter() + seconds
+  while time.perf_counter() < deadline:
+    pass
+
+
+def test_sampler_folds_busy_thread_stacks() -> None:
+  sampler = StackSampler(interval_seconds=0.001).start()
+  _busy(0.05)
+  stacks = sampler.stop()
+
+  assert sampler.samples > 0
+  assert any("_busy (test_profiling.py" in stack for stack in stacks)
+
+
+def test_write_folded_profile_keeps_newest_files(tmp_path: Path) -> None:
+  for index in range(4):
+    path = write_folded_profile(tmp_path, f"request-{index}", Counter({"main;work": index + 1}), max_files=2)
+    os.utime(path, ns=(index * 1_000_000_000, index * 1_000_000_000))
+
+  write_folded_profile(tmp_path, "request-4", Counter({"main;work": 5}), max_files=2)
+
+  assert sorted(path.name for path in tmp_path.iterdir()) == ["request-3.folded", "request-4.folded"]
+  assert (tmp_path / "request-4.folded").read_text(encoding="utf-8") == "main;work 5\n"
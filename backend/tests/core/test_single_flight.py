@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.single_flight import SINGLE_FLIGHT_CALLS, SingleFlight
+
+
+def _wait_for_followers(name: str, expected: float, before: float) -> None:
+  deadline = time.monotonic() + 5
+  while SINGLE_FLIGHT_CALLS.value(flight=name, role="follower") - before < expected:
+    assert time.monotonic() < deadline, "followers never joined the flight"
+    time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_call() -> None:
+  flight: SingleFlight[int] = SingleFlight("test_share")
+  release = threading.Event()
+  calls = []
+
+  def build() -> int:
+    calls.append(threading.get_ident())
+    release.wait(5)
+    return 42
+
+  followers_before = SINGLE_FLIGHT_CALLS.value(flight="test_share", role="follower")
+  with ThreadPoolExecutor(max_workers=4) as pool:
+    futures = [pool.submit(flight.do, "doc", build)]
+    while not calls:
+      time.sleep(0.001)
+    futures += [pool.submit(flight.do, "doc", build) for _ in range(3)]
+    _wait_for_followers("test_share", 3, followers_before)
+    release.set()
+    results = [future.result(timeout=5) for future in futures]
+
+  assert results == [42, 42, 42, 42]
+  assert len(calls) == 1
+  assert flight.in_flight() == 0
+  assert flight.do("doc", lambda: 7) == 7
+
+
+def test_followers_receive_the_leader_exception() -> None:
+  flight: SingleFlight[int] = SingleFlight("test_error")
+  started = threading.Event()
+  release = threading.Event()
+
+  def fail() -> int:
+    started.set()
+    release.wait(5)
+    raise ValueError("broken pdf")
+
+  followers_before = SINGLE_FLIGHT_CALLS.value(flight="test_error", role="follower")
+  with ThreadPoolExecutor(max_workers=2) as pool:
+    leader = pool.submit(flight.do, "doc", fail)
+    started.wait(5)
+    follower = pool.submit(flight.do, "doc", fail)
+    _wait_for_followers("test_error", 1, followers_before)
+    release.set()
+    for future in (leader, follower):
+      with pytest.raises(ValueError, match="broken pdf"):
+        future.result(timeout=5)
+
+  assert flight.in_flight() == 0
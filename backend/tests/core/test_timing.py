@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from app.core.metrics import Histogram
+from app.core.timing import STAGE_DURATION_SECONDS, collect_stage_timings, stage
+
+
+def test_stages_accumulate_only_while_collecting() -> None:
+  with stage("ignored"):
+    pass
+
+  with collect_stage_timings("pytest-operation") as timings:
+    with stage("scan"):
+      pass
+    with stage("scan"):
+      pass
+    with stage("score"):
+      pass
+
+  assert timings is not None
+  assert list(timings.stages) == ["scan", "score"]
+  assert timings.server_timing().endswith(f"total;dur={timings.total_ms:.2f}")
+
+  recorded = {
+    dict(series.labels)["stage"]: series.count
+    for series in STAGE_DURATION_SECONDS.collect()
+    if dict(series.labels)["operation"] == "pytest-operation"
+  }
+  assert recorded == {"scan": 1, "score": 1, "total": 1}
+
+  with collect_stage_timings("pytest-operation", enabled=False) as disabled:
+    with stage("scan"):
+      pass
+  assert disabled is None
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+  latency = Histogram("pytest_latency_seconds", "test", label_names=("route",), buckets=(0.1, 1.0))
+  latency.observe(0.05, route="/a")
+  latency.observe(0.5, route="/a")
+  latency.observe(5.0, route="/a")
+
+  (series,) = latency.collect()
+  assert series.labels == (("route", "/a"),)
+  assert series.bucket_counts == (1, 2)
+  assert series.count == 3
+  assert series.total == 5.55
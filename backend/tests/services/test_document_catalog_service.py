@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from app.services.document_catalog_service import DocumentCatalog
+
+
+def _lookup_keys(value: str) -> set[str]:
+  return {value, value.lower()}
+
+
+def test_catalog_rescans_only_changed_directories_and_persists(tmp_path: Path) -> None:
+  root = tmp_path / "tender"
+  (root / "vol1").mkdir(parents=True)
+  (root / "vol2").mkdir()
+  (root / "vol1" / "GCT.pdf").write_bytes(b"%PDF-1.4")
+  (root / "vol2" / "SCT.pdf").write_bytes(b"%PDF-1.4")
+  (root / "vol2" / "~$lock.pdf").write_bytes(b"")
+  (root / "vol2" / "notes.txt").write_text("ignored")
+  manifest_path = tmp_path / "catalog.json"
+
+  catalog = DocumentCatalog(root, manifest_path=manifest_path, lookup_keys=_lookup_keys)
+  first = catalog.refresh()
+  assert first.scanned_directories == 3
+  assert first.document_count == 2
+  assert catalog.get_index()["GCT"] == root / "vol1" / "GCT.pdf"
+
+  unchanged = catalog.refresh()
+  assert unchanged.scanned_directories == 0
+  assert unchanged.unchanged_directories == 3
+
+  (root / "vol2" / "new").mkdir()
+  (root / "vol2" / "new" / "APP-A.pdf").write_bytes(b"%PDF-1.4")
+  (root / "vol1" / "GCT.pdf").unlink()
+  changed = catalog.refresh()
+  assert changed.scanned_directories == 3
+  assert (changed.added_files, changed.removed_files, changed.document_count) == (1, 1, 2)
+  assert "GCT" not in catalog.get_index()
+  assert catalog.get_index()["app-a.pdf"] == root / "vol2" / "new" / "APP-A.pdf"
+
+  restarted = DocumentCatalog(root, manifest_path=manifest_path, lookup_keys=_lookup_keys)
+  reloaded = restarted.refresh()
+  assert reloaded.scanned_directories == 0
+  assert reloaded.document_count == 2
+  assert restarted.get_index() == catalog.get_index()
+
+
+def test_get_index_picks_up_new_files_once_the_check_interval_passes(tmp_path: Path) -> None:
+  root = tmp_path / "tender"
+  root.mkdir()
+  (root / "GCT.pdf").write_bytes(b"%PDF-1.4")
+  interval = [3600.0]
+  catalog = DocumentCatalog(
+    root,
+    manifest_path=tmp_path / "catalog.json",
+    lookup_keys=_lookup_keys,
+    check_interval=lambda: interval[0],
+  )
+  assert set(catalog.get_index()) == {"GCT", "gct", "GCT.pdf", "gct.pdf"}
+
+  version = catalog.version
+  (root / "SCT.pdf").write_bytes(b"%PDF-1.4")
+  assert "SCT" not in catalog.get_index()
+
+  interval[0] = 0.0
+  assert catalog.get_index()["SCT"] == root / "SCT.pdf"
+  assert catalog.version == version + 1
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+
+from app.core.config import DocumentDeliveryConfig
+from app.services.document_derivative_service import get_optimized_document_path, schedule_document_derivative
+
+
+def _write_uncompressed_pdf(path: Path, pages: int) -> None:
+  document = fitz.open()
+  for index in range(pages):
+    page = document.new_page()
+    for line in range(40):
+      page.insert_text((72, 72 + line * 14), f"Clause {index}.{line} the Contractor shall provide the Works.")
+  document.save(path, deflate=False, garbage=0)
+  document.close()
+
+
+def test_derivative_is_built_in_background_and_served_once_ready(tmp_path: Path) -> None:
+  source_path = tmp_path / "volume.pdf"
+  _write_uncompressed_pdf(source_path, pages=6)
+  config = replace(
+    DocumentDeliveryConfig(),
+    derivatives_enabled=True,
+    derivative_dir=tmp_path / "derivatives",
+    derivative_min_bytes=0,
+  )
+
+  assert get_optimized_document_path(source_path, config=replace(config, derivatives_enabled=False)) is None
+
+  future = schedule_document_derivative(source_path, config=config)
+  assert future is not None
+  derivative_path = future.result(timeout=30)
+  assert derivative_path is not None
+  assert derivative_path.stat().st_size < source_path.stat().st_size
+
+  assert get_optimized_document_path(source_path, config=config) == derivative_path
+  assert schedule_document_derivative(source_path, config=config) is None
+  with fitz.open(derivative_path) as optimized, fitz.open(source_path) as original:
+    assert optimized.page_count == original.page_count
+    assert optimized[3].get_text() == original[3].get_text()
+
+
+def test_derivative_is_skipped_when_rewrite_does_not_shrink(tmp_path: Path) -> None:
+  source_path = tmp_path / "compact.pdf"
+  _write_uncompressed_pdf(source_path, pages=1)
+  with fitz.open(source_path) as document:
+    document.save(tmp_path / "already-compact.pdf", garbage=4, deflate=True, use_objstms=1)
+  compact_path = tmp_path / "already-compact.pdf"
+  config = replace(
+    DocumentDeliveryConfig(),
+    derivatives_enabled=True,
+    derivative_dir=tmp_path / "derivatives",
+    derivative_min_bytes=0,
+  )
+
+  future = schedule_document_derivative(compact_path, config=config)
+  assert future is not None
+  assert future.result(timeout=30) is None
+  assert get_optimized_document_path(compact_path, config=config) is None
+  assert schedule_document_derivative(compact_path, config=config) is None
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import csv
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from io import BytesIO
+from io import BytesIO, StringIO
 
 import fitz
+import pytest
 from docx import Document
+from openpyxl import load_workbook
 
+from app.core.config import ExportConfig
+from app.schemas.evidence import BBox, EvidenceAnchor
 from app.schemas.exports import ExportRequest, SelectedStandard
 from app.schemas.reports import ManualReviewHistoryEntry, ReportItem
-from app.services.export_service import build_export_file
+from app.services import export_service
+from app.services.document_service import resolve_project_document_path
+from app.services.evidence_snippet_service import PagePixmapCache
+from app.services.export_service import build_export_file, stream_export_file
 
 
 def _sample_card() -> ReportItem:
@@ -203,3 +216,198 @@ def test_build_export_file_pdf_with_empty_card_ids_exports_no_cards() -> None:
 
   assert "No cards selected for export." in extracted_text
   assert "EMP finalisation timeline" not in extracted_text
+
+
+def test_build_export_file_pdf_chunked_render_matches_card_order_and_toc() -> None:
+  cards = [
+    _sample_card().model_copy(update={"item_id": f"item-{index:03d}", "description": f"Chunked card {index:03d}."})
+    for index in range(1, 8)
+  ]
+  request = _sample_request("pdf")
+  request.card_ids = [card.item_id for card in cards]
+  request.include_toc = True
+  chunked_config = ExportConfig(pdf_parallel_min_cards=2, pdf_chunk_size=3, pdf_workers=2)
+
+  _, _, content = build_export_file(request, cards, export_config=chunked_config)
+  with fitz.open(stream=content, filetype="pdf") as document:
+    page_total = document.page_count
+    extracted_text = "\n".join(page.get_text("text") for page in document)
+    toc = document.get_toc()
+
+  assert extracted_text.count("EPD Tender Analysis Report") == 1
+  positions = [extracted_text.index(f"Chunked card {index:03d}.") for index in range(1, 8)]
+  assert positions == sorted(positions)
+  assert f"Page {page_total} of {page_total}" in extracted_text
+  assert [entry[1] for entry in toc] == [f"{index}. Consistency Review" for index in range(1, 8)]
+  assert all(1 <= entry[2] <= page_total for entry in toc)
+
+
+def test_build_export_file_pdf_recovers_from_a_broken_render_pool(monkeypatch) -> None:
+  broken_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+  with pytest.raises(BrokenProcessPool):
+    broken_pool.submit(os._exit, 1).result(timeout=60)
+  monkeypatch.setattr(export_service, "_PDF_RENDER_POOL", broken_pool)
+  monkeypatch.setattr(export_service, "_PDF_RENDER_POOL_WORKERS", 2)
+
+  cards = [
+    _sample_card().model_copy(update={"item_id": f"item-{index:03d}", "description": f"Fallback card {index:03d}."})
+    for index in range(1, 5)
+  ]
+  request = _sample_request("pdf")
+  request.card_ids = [card.item_id for card in cards]
+  chunked_config = ExportConfig(pdf_parallel_min_cards=2, pdf_chunk_size=2, pdf_workers=2)
+
+  _, _, content = build_export_file(request, cards, export_config=chunked_config)
+  with fitz.open(stream=content, filetype="pdf") as document:
+    extracted_text = "\n".join(page.get_text("text") for page in document)
+
+  assert all(f"Fallback card {index:03d}." in extracted_text for index in range(1, 5))
+  assert export_service._PDF_RENDER_POOL is None
+
+
+def test_template_docx_writer_matches_python_docx_structure() -> None:
+  request = _sample_request("docx")
+  card = _sample_card().model_copy(update={"description": "Line one\nLine two & <three>"})
+  manual_history = _sample_manual_history()
+
+  def _structure(content: bytes) -> tuple[str | None, list[tuple[str, str]], list[list[str]]]:
+    document = Document(BytesIO(content))
+    paragraphs = [
+      (paragraph.style.name, paragraph.text)
+      for paragraph in document.paragraphs
+      if not paragraph.text.startswith("Generated At (HKT):")
+    ]
+    tables = [[cell.text for row in table.rows for cell in row.cells] for table in document.tables]
+    return document.core_properties.title, paragraphs, tables
+
+  _, _, template_content = build_export_file(
+    request,
+    [card],
+    manual_history,
+    export_config=ExportConfig(docx_writer="template"),
+  )
+  _, _, python_docx_content = build_export_file(
+    request,
+    [card],
+    manual_history,
+    export_config=ExportConfig(docx_writer="python-docx"),
+  )
+
+  assert _structure(template_content) == _structure(python_docx_content)
+  assert Document(BytesIO(template_content)).tables[0].style.name == "Light Grid Accent 1"
+
+
+def test_build_export_file_tabular_formats_emit_one_row_per_card() -> None:
+  card = _sample_card().model_copy(
+    update={
+      "anchors": [
+        EvidenceAnchor(
+          anchor_id="anc-1",
+          document_id="main_coc",
+          page=49,
+          quote="18.3",
+          match_method="exact",
+          match_score=0.95,
+          status="resolved_exact",
+        )
+      ]
+    }
+  )
+  manual_history = _sample_manual_history()
+
+  csv_name, csv_media_type, csv_content = build_export_file(_sample_request("csv"), [card], manual_history)
+  assert csv_name.endswith(".csv")
+  assert csv_media_type.startswith("text/csv")
+  csv_rows = list(csv.DictReader(StringIO(csv_content.decode("utf-8"))))
+  assert len(csv_rows) == 1
+  assert csv_rows[0]["item_id"] == "item-001"
+  assert csv_rows[0]["status"] == "Consistent"
+  assert csv_rows[0]["anchor_pages"] == "49"
+  assert csv_rows[0]["manual_review_history_count"] == "2"
+  assert "Note: Initial review accepted this item." in csv_rows[0]["manual_review_history"]
+
+  _, ndjson_media_type, ndjson_content = build_export_file(_sample_request("ndjson"), [card], manual_history)
+  assert ndjson_media_type == "application/x-ndjson"
+  ndjson_rows = [json.loads(line) for line in ndjson_content.decode("utf-8").splitlines()]
+  assert len(ndjson_rows) == 1
+  assert ndjson_rows[0]["description"] == "(PART 1) EMP finalisation timeline must be satisfied."
+  assert ndjson_rows[0]["manual_review_history"].startswith("1. Edited At (HKT):")
+
+  _, xlsx_media_type, xlsx_content = build_export_file(_sample_request("xlsx"), [card], manual_history)
+  assert xlsx_media_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+  worksheet = load_workbook(BytesIO(xlsx_content), read_only=True)["Cards"]
+  xlsx_rows = list(worksheet.iter_rows(values_only=True))
+  assert len(xlsx_rows) == 2
+  assert dict(zip(xlsx_rows[0], xlsx_rows[1]))["item_id"] == "item-001"
+
+
+def test_stream_export_file_yields_incremental_chunks() -> None:
+  cards = [_sample_card().model_copy(update={"item_id": f"item-{index:04d}"}) for index in range(1, 1201)]
+  request = _sample_request("ndjson")
+  request.card_ids = [card.item_id for card in cards]
+
+  _, _, chunks = stream_export_file(request, cards)
+  chunk_list = list(chunks)
+
+  assert len(chunk_list) > 1
+  lines = b"".join(chunk_list).decode("utf-8").splitlines()
+  assert len(lines) == 1200
+  assert json.loads(lines[-1])["item_id"] == "item-1200"
+
+
+def _anchored_card(item_id: str, bbox: tuple[float, float, float, float]) -> ReportItem:
+  x0, y0, x1, y1 = bbox
+  return _sample_card().model_copy(
+    update={
+      "item_id": item_id,
+      "anchors": [
+        EvidenceAnchor(
+          anchor_id=f"anc-{item_id}",
+          document_id="main_coc",
+          page=49,
+          quote="18.3",
+          bbox=BBox(x0=x0, y0=y0, x1=x1, y1=y1),
+          match_method="exact",
+          match_score=0.95,
+          status="resolved_exact",
+        )
+      ],
+    }
+  )
+
+
+def test_build_export_file_pdf_embeds_evidence_snippets() -> None:
+  cards = [
+    _anchored_card("item-001", (70.0, 500.0, 520.0, 560.0)),
+    _anchored_card("item-002", (70.0, 440.0, 520.0, 470.0)),
+  ]
+  request = _sample_request("pdf")
+  request.card_ids = ["item-001", "item-002"]
+  request.include_evidence_snippets = True
+
+  _, _, content = build_export_file(request, cards, project_id="tender-analysis")
+  with fitz.open(stream=content, filetype="pdf") as document:
+    extracted_text = "\n".join(page.get_text("text") for page in document)
+    image_count = sum(len(page.get_images()) for page in document)
+
+  assert extracted_text.count("Source Snippet: main_coc, page 49") == 2
+  assert image_count == 2
+
+  _, _, plain_content = build_export_file(_sample_request("pdf"), cards[:1], project_id="tender-analysis")
+  with fitz.open(stream=plain_content, filetype="pdf") as document:
+    assert sum(len(page.get_images()) for page in document) == 0
+
+
+def test_page_pixmap_cache_reuses_pages_and_respects_budget() -> None:
+  pdf_path = resolve_project_document_path("tender-analysis", "main_coc")
+
+  with PagePixmapCache(dpi=72, max_bytes=1) as cache:
+    first = cache.render_clip(pdf_path, 49, (70.0, 500.0, 520.0, 560.0))
+    second = cache.render_clip(pdf_path, 49, (70.0, 440.0, 520.0, 470.0))
+    assert first is not None and second is not None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.render_clip(pdf_path, 50, (70.0, 100.0, 520.0, 160.0))
+    cache.render_clip(pdf_path, 49, (70.0, 100.0, 520.0, 160.0))
+    assert cache.misses == 3
+    assert cache.render_clip(pdf_path, 9999, (0.0, 0.0, 10.0, 10.0)) is None
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+import fitz
+import pytest
+
+from app.core.config import PageRenderConfig
+from app.core.errors import ApiError
+from app.services.page_render_service import (
+  PageImageDiskCache,
+  get_page_image,
+  get_page_image_cache,
+  get_page_tile,
+  schedule_page_prewarm,
+)
+
+
+def _write_pdf(path: Path, pages: int) -> None:
+  document = fitz.open()
+  for index in range(pages):
+    document.new_page(width=595, height=842).insert_text((72, 72), f"Page {index + 1}")
+  document.save(path)
+  document.close()
+
+
+def test_disk_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+  cache = PageImageDiskCache(tmp_path, max_bytes=25)
+  cache.put("a", b"x" * 10)
+  cache.put("b", b"y" * 10)
+  assert cache.get("a") == b"x" * 10
+  cache.put("c", b"z" * 10)
+
+  assert cache.get("b") is None
+  assert cache.get("a") == b"x" * 10
+  assert not (tmp_path / "b.png").exists()
+  assert cache.cached_bytes == 20
+
+  reloaded = PageImageDiskCache(tmp_path, max_bytes=25)
+  assert "a" in reloaded and "c" in reloaded
+  assert reloaded.cached_bytes == 20
+
+
+def test_page_images_and_tiles_are_rendered_once_per_scale(tmp_path: Path) -> None:
+  pdf_path = tmp_path / "volume.pdf"
+  _write_pdf(pdf_path, pages=5)
+  config = replace(PageRenderConfig(), cache_dir=tmp_path / "pages", tile_size=256)
+  cache = get_page_image_cache(config)
+
+  first = get_page_image(pdf_path, 2, scale=0.5, config=config)
+  again = get_page_image(pdf_path, 2, scale=0.5, config=config)
+  assert again == first
+  assert cache.hits == 1 and cache.misses == 1
+  assert fitz.Pixmap(first.png).width == round(595 * 0.5)
+
+  tile = get_page_tile(pdf_path, 2, 2, 0, scale=1.0, config=config)
+  assert fitz.Pixmap(tile.png).width == 595 - 512
+  with pytest.raises(ApiError):
+    get_page_tile(pdf_path, 2, 3, 0, scale=1.0, config=config)
+  with pytest.raises(ApiError):
+    get_page_image(pdf_path, 6, config=config)
+
+
+def test_prewarm_renders_neighbouring_pages(tmp_path: Path) -> None:
+  pdf_path = tmp_path / "volume.pdf"
+  _write_pdf(pdf_path, pages=3)
+  config = replace(PageRenderConfig(), cache_dir=tmp_path / "pages", prewarm_radius=1, prewarm_workers=1)
+
+  future = schedule_page_prewarm(pdf_path, 3, config=config)
+  assert future is not None
+  future.result(timeout=30)
+
+  cache = get_page_image_cache(config)
+  cached_bytes = cache.cached_bytes
+  assert cached_bytes > 0
+  schedule_page_prewarm(pdf_path, 3, config=config).result(timeout=30)
+  assert cache.cached_bytes == cached_bytes
+  get_page_image(pdf_path, 2, config=config)
+  assert cache.hits == 1
+
+
+def test_prewarm_failures_stay_off_the_calling_thread(tmp_path: Path) -> None:
+  config = replace(PageRenderConfig(), cache_dir=tmp_path / "pages", prewarm_workers=1)
+
+  future = schedule_page_prewarm(tmp_path / "missing.pdf", 1, config=config)
+  assert future is not None
+  assert future.result(timeout=30) is None
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from app.core.config import EvidenceResolveConfig
+import fitz
+import pytest
+
+from app.core.config import EvidenceResolveConfig, LocatorIndexBuildConfig
 from app.services import pdf_locator_service
 
 
@@ -20,7 +25,7 @@ def test_thresholds_are_configurable(monkeypatch) -> None:
   relaxed = EvidenceResolveConfig(exact_threshold=20.0, approximate_threshold=10.0)
   strict = EvidenceResolveConfig(exact_threshold=95.0, approximate_threshold=90.0)
 
-  evidence_text = "The contractor submits final EMP after acceptance within forty five days."
+  evidence_text = "Contractor to finalise the EMP within 45 days of the Letter of Acceptance."
   dummy_pdf = Path("dummy.pdf")
 
   relaxed_result = pdf_locator_service.locate_evidence(dummy_pdf, evidence_text, resolve_config=relaxed)
@@ -83,3 +88,302 @@ def test_unified_scoring_enforces_content_gate(monkeypatch) -> None:
   assert weak_result.status == "unresolved"
   assert rich_result.status in {"resolved_exact", "resolved_approximate"}
   assert rich_result.page == 102
+
+
+def test_page_lines_follow_the_current_index(monkeypatch) -> None:
+  def make_entry(page: int, text: str) -> pdf_locator_service.IndexedLine:
+    return pdf_locator_service.IndexedLine(page=page, text=text, normalized=text.lower(), bbox=(0.0, 0.0, 1.0, 1.0))
+
+  index = [make_entry(1, "Alpha"), make_entry(2, "Beta"), make_entry(2, "Gamma")]
+  monkeypatch.setattr(pdf_locator_service, "_get_index", lambda _path: index)
+  dummy_pdf = Path("dummy.pdf")
+
+  assert [line.text for line in pdf_locator_service.get_page_lines(dummy_pdf, 2)] == ["Beta", "Gamma"]
+  assert pdf_locator_service.get_page_lines(dummy_pdf, 3) == []
+
+  rebuilt = [make_entry(2, "Delta")]
+  monkeypatch.setattr(pdf_locator_service, "_get_index", lambda _path: rebuilt)
+  assert [line.text for line in pdf_locator_service.get_page_lines(dummy_pdf, 2)] == ["Delta"]
+
+
+def test_locate_across_documents_ranks_and_stops_on_exact(monkeypatch) -> None:
+  line_text = "The Contractor shall finalise the EMP within 45 days of the date of the Letter of Acceptance."
+  matching = pdf_locator_service.IndexedLine(
+    page=7,
+    text=line_text,
+    normalized="the contractor shall finalise the emp within 45 days of the date of the letter of acceptance",
+    bbox=(72.0, 120.0, 320.0, 138.0),
+  )
+  unrelated = pdf_locator_service.IndexedLine(
+    page=3,
+    text="Payment shall be certified monthly.",
+    normalized="payment shall be certified monthly.",
+    bbox=(72.0, 80.0, 300.0, 96.0),
+  )
+  indexes = {"a.pdf": [unrelated], "b.pdf": [matching], "c.pdf": [matching]}
+  searched: list[str] = []
+
+  def fake_index(path: Path) -> list[pdf_locator_service.IndexedLine]:
+    searched.append(path.name)
+    return indexes[path.name]
+
+  monkeypatch.setattr(pdf_locator_service, "_get_index", fake_index)
+
+  documents = [("A", Path("a.pdf")), ("B", Path("b.pdf")), ("C", Path("c.pdf"))]
+  ranked = pdf_locator_service.locate_evidence_across_documents(documents, line_text)
+
+  assert [document_id for document_id, _ in ranked] == ["B", "A"]
+  assert ranked[0][1].status == "resolved_exact"
+  assert ranked[0][1].page == 7
+  assert searched == ["a.pdf", "b.pdf"]
+
+  searched.clear()
+  exhaustive = pdf_locator_service.locate_evidence_across_documents(documents, line_text, stop_on_exact=False)
+  assert [document_id for document_id, _ in exhaustive] == ["B", "C", "A"]
+  assert searched == ["a.pdf", "b.pdf", "c.pdf"]
+
+
+def _synthetic_index() -> list[pdf_locator_service.IndexedLine]:
+  filler = [
+    "Payment shall be certified monthly by the Supervising Officer.",
+    "The Employer may deduct liquidated damages for each day of delay.",
+    "Drawings are listed in the schedule attached to the tender.",
+    "Site access is restricted to authorised personnel only.",
+  ]
+  lines = [
+    pdf_locator_service.IndexedLine(
+      page=1 + position // 40,
+      text=f"{filler[position % len(filler)]} Item {position}.",
+      normalized=pdf_locator_service._normalize_text(f"{filler[position % len(filler)]} Item {position}."),
+      bbox=(72.0, 100.0 + (position % 40) * 14, 500.0, 112.0 + (position % 40) * 14),
+      block_index=position % 40,
+    )
+    for position in range(400)
+  ]
+  target = "The Contractor shall finalise the EMP within 45 days of the date of the Letter of Acceptance."
+  lines[250] = pdf_locator_service.IndexedLine(
+    page=7,
+    text=target,
+    normalized=pdf_locator_service._normalize_text(target),
+    bbox=(72.0, 120.0, 320.0, 138.0),
+    block_index=99,
+  )
+  return lines
+
+
+def test_fuzzy_stage_pruning_matches_scoring_every_line() -> None:
+  config = EvidenceResolveConfig(candidate_limit=20)
+  index = pdf_locator_service.DocumentIndex(_synthetic_index())
+  evidence_text = "Contractor to finalise the EMP within 45 days of the Letter of Acceptance."
+  query_bundle = pdf_locator_service._build_query_bundle(evidence_text, None, resolve_config=config)
+  queries = pdf_locator_service._prepare_queries(query_bundle.content_queries)
+
+  pruned_before = pdf_locator_service.LOCATOR_STAGE_LINES.value(stage="overlap_pruned")
+  staged, _ = pdf_locator_service._fuzzy_stage(index, queries, query_bundle, resolve_config=config)
+
+  everything = []
+  for entry in index:
+    score, query = pdf_locator_service._max_query_score(query_bundle.content_queries, entry.normalized, resolve_config=config)
+    everything.append(pdf_locator_service.PreScoredCandidate(entry=entry, content_score=score, content_query=query))
+  reference = pdf_locator_service._rerank_candidates(index, everything, query_bundle, resolve_config=config)
+
+  assert staged == reference
+  assert staged.entry.page == 7
+  assert pdf_locator_service.LOCATOR_STAGE_LINES.value(stage="overlap_pruned") > pruned_before
+
+
+def test_exact_stage_returns_early_for_verbatim_evidence(monkeypatch) -> None:
+  lines = _synthetic_index()
+  monkeypatch.setattr(pdf_locator_service, "_get_index", lambda _path: lines)
+  evidence_text = "The Contractor shall finalise the EMP within 45 days of the date of the Letter of Acceptance."
+
+  exact_before = pdf_locator_service.LOCATOR_STAGE_RESULTS.value(stage="exact")
+  staged = pdf_locator_service.locate_evidence(Path("dummy.pdf"), evidence_text)
+  assert pdf_locator_service.LOCATOR_STAGE_RESULTS.value(stage="exact") == exact_before + 1
+
+  full = pdf_locator_service.locate_evidence(
+    Path("dummy.pdf"),
+    evidence_text,
+    resolve_config=EvidenceResolveConfig(staged_early_exit=False),
+  )
+  assert staged.status == full.status == "resolved_exact"
+  assert (staged.page, staged.bbox) == (full.page, full.bbox) == (7, (72.0, 120.0, 320.0, 138.0))
+
+
+def test_document_index_text_buffer_finds_matches_across_lines() -> None:
+  lines = [
+    pdf_locator_service.IndexedLine(page=2, text=text, normalized=pdf_locator_service._normalize_text(text), bbox=bbox)
+    for text, bbox in [
+      ("9.4 Method Statements", (72.0, 90.0, 200.0, 102.0)),
+      ("The Contractor shall submit the method", (72.0, 110.0, 400.0, 122.0)),
+      ("statement 14 days before the works start.", (72.0, 124.0, 380.0, 136.0)),
+    ]
+  ]
+  index = pdf_locator_service.DocumentIndex(lines)
+
+  assert index.text == " ".join(line.normalized for line in lines)
+  assert list(index.line_starts) == [0, 22, 61]
+  assert index.line_at(21) == 0 and index.line_at(22) == 1
+
+  assert index.find_line_matches("submit the method statement") == []
+  spans = index.find_spans("submit the method statement")
+  assert [(span.first_line, span.last_line) for span in spans] == [(1, 2)]
+  assert index.span_lines(spans[0]) == lines[1:]
+  assert [(span.first_line, span.last_line) for span in index.search(r"\d+ days")] == [(2, 2)]
+
+  bboxes = pdf_locator_service._span_highlight_bboxes(
+    index,
+    ["Contractor shall submit the method statement 14 days"],
+    lines[2],
+    min_length=18,
+  )
+  assert bboxes == [lines[1].bbox, lines[2].bbox]
+
+
+def test_document_index_columns_round_trip_lines() -> None:
+  def make_entry(page: int, block_index: int, line_index: int, text: str) -> pdf_locator_service.IndexedLine:
+    return pdf_locator_service.IndexedLine(
+      page=page,
+      text=text,
+      normalized=pdf_locator_service._normalize_text(text),
+      bbox=(10.5, 20.25 + line_index, 300.125, 32.0 + line_index),
+      block_index=block_index,
+      line_index=line_index,
+    )
+
+  ordered = [
+    make_entry(1, 0, 0, "Contract “Conditions”"),
+    make_entry(1, 2, 0, "Clause 9  Submissions"),
+    make_entry(1, 2, 1, "m² of floor area"),
+    make_entry(3, 1, 0, "Schedule"),
+  ]
+  index = pdf_locator_service.DocumentIndex(ordered)
+
+  assert list(index) == ordered
+  assert index[-1] == ordered[-1] and index[1:3] == ordered[1:3]
+  assert index.normalized_at(1) == "clause 9 submissions"
+  assert index.block_lines(1, 2) == ordered[1:3]
+  assert index.page_lines(1) == ordered[:3]
+  assert index.page_lines(2) == []
+
+  shuffled = pdf_locator_service.DocumentIndex([ordered[3], ordered[2], ordered[0], ordered[1]])
+  assert shuffled.block_lines(1, 2) == ordered[1:3]
+  assert shuffled.page_lines(1) == [ordered[2], ordered[0], ordered[1]]
+
+
+def test_index_cache_evicts_by_size_and_spills_to_disk(tmp_path) -> None:
+  def make_index(label: str) -> pdf_locator_service.DocumentIndex:
+    return pdf_locator_service.DocumentIndex(
+      pdf_locator_service.IndexedLine(page=1, text=f"{label} line {n}", normalized=f"{label} line {n}", bbox=(0.0, 0.0, 1.0, 1.0))
+      for n in range(50)
+    )
+
+  first, second = make_index("first"), make_index("second")
+  cache = pdf_locator_service.IndexCache(max_bytes=first.estimated_bytes + 1, spill_dir=tmp_path)
+  cache.put("a.pdf", 1, first)
+  cache.put("b.pdf", 1, second)
+
+  stats = cache.stats()
+  assert (stats.documents, stats.evictions, stats.spills) == (1, 1, 1)
+  assert stats.bytes == second.estimated_bytes
+  assert len(list(tmp_path.glob("*.idx"))) == 1
+
+  restored = cache.get("a.pdf", 1)
+  assert restored is not None and list(restored) == list(first)
+  assert restored.find_line_matches("first line 7") == [7]
+  assert cache.stats().disk_hits == 1
+
+  # Reloading "a" evicted and spilled "b"; a changed file drops the stale entry and its spill.
+  assert cache.get("a.pdf", 2) is None
+  stats = cache.stats()
+  assert (stats.documents, stats.misses, stats.spills) == (0, 1, 2)
+  assert len(list(tmp_path.glob("*.idx"))) == 1
+  assert cache.get("b.pdf", 1) is not None
+  assert cache.invalidate() == 1
+  assert cache.stats().documents == 0 and not list(tmp_path.glob("*.idx"))
+
+
+def test_index_cache_prunes_the_spill_directory_to_its_budget(tmp_path) -> None:
+  def make_index(label: str) -> pdf_locator_service.DocumentIndex:
+    return pdf_locator_service.DocumentIndex(
+      pdf_locator_service.IndexedLine(page=1, text=f"{label} {n}", normalized=f"{label} {n}", bbox=(0.0, 0.0, 1.0, 1.0))
+      for n in range(50)
+    )
+
+  spill_size = len(make_index("a").to_bytes()) + 64
+  cache = pdf_locator_service.IndexCache(max_bytes=1, spill_dir=tmp_path, spill_max_bytes=spill_size * 3 // 2)
+  for label in ("a", "b", "c"):
+    cache.put(f"{label}.pdf", 1, make_index(label))
+
+  # "a" and "b" were evicted and spilled; spilling "b" pushed the directory over budget and pruned "a".
+  spilled = list(tmp_path.glob("*.idx"))
+  stats = cache.stats()
+  assert (stats.spills, len(spilled)) == (2, 1)
+  assert stats.spill_bytes == spilled[0].stat().st_size
+  assert stats.spill_max_bytes == spill_size * 3 // 2
+  assert cache.get("a.pdf", 1) is None
+  assert pdf_locator_service.IndexCache(max_bytes=1, spill_dir=tmp_path).stats().spill_bytes == stats.spill_bytes
+
+
+def test_concurrent_index_misses_build_once(monkeypatch, tmp_path) -> None:
+  pdf_path = tmp_path / "shared.pdf"
+  pdf_path.write_bytes(b"%PDF-1.4")
+  monkeypatch.setattr(pdf_locator_service, "_INDEX_CACHE", pdf_locator_service.IndexCache(max_bytes=1 << 20))
+  builds = []
+
+  def slow_build(path):
+    builds.append(path)
+    time.sleep(0.05)
+    return pdf_locator_service.DocumentIndex(
+      [pdf_locator_service.IndexedLine(page=1, text="Shared", normalized="shared", bbox=(0.0, 0.0, 1.0, 1.0))]
+    )
+
+  monkeypatch.setattr(pdf_locator_service, "_build_index", slow_build)
+  with ThreadPoolExecutor(max_workers=6) as pool:
+    indexes = list(pool.map(lambda _: pdf_locator_service._get_index(pdf_path), range(6)))
+
+  assert len(builds) == 1
+  assert all(index is indexes[0] for index in indexes)
+
+
+def test_index_leader_reuses_a_build_that_finished_after_its_miss(monkeypatch, tmp_path) -> None:
+  pdf_path = tmp_path / "shared.pdf"
+  pdf_path.write_bytes(b"%PDF-1.4")
+  cache = pdf_locator_service.IndexCache(max_bytes=1 << 20)
+  built = pdf_locator_service.DocumentIndex(
+    [pdf_locator_service.IndexedLine(page=1, text="Shared", normalized="shared", bbox=(0.0, 0.0, 1.0, 1.0))]
+  )
+  cache.put(str(pdf_path.resolve()), pdf_path.stat().st_mtime_ns, built)
+  lookup = cache.get
+
+  def stale_first_lookup(key, mtime_ns, *, record=True):
+    # The caller's own lookup ran just before another leader stored its index.
+    return lookup(key, mtime_ns, record=record) if not record else None
+
+  monkeypatch.setattr(cache, "get", stale_first_lookup)
+  monkeypatch.setattr(pdf_locator_service, "_INDEX_CACHE", cache)
+  monkeypatch.setattr(pdf_locator_service, "_build_index", lambda _path: pytest.fail("index rebuilt"))
+
+  assert pdf_locator_service._get_index(pdf_path) is built
+  assert (cache.stats().hits, cache.stats().misses) == (0, 0)
+
+
+def test_parallel_index_build_matches_serial_extraction(tmp_path) -> None:
+  pdf_path = tmp_path / "contract.pdf"
+  with fitz.open() as document:
+    for page_number in range(1, 8):
+      page = document.new_page()
+      page.insert_text((72, 72), f"Clause {page_number}.1 The Contractor shall comply.")
+      page.insert_text((72, 100), f"Page {page_number} second line")
+    document.save(pdf_path)
+
+  serial = pdf_locator_service._build_index(pdf_path, build_config=LocatorIndexBuildConfig(workers=0))
+  parallel = pdf_locator_service._build_index(
+    pdf_path,
+    build_config=LocatorIndexBuildConfig(workers=2, parallel_min_pages=2),
+  )
+
+  assert len(serial) == 14
+  assert list(parallel) == list(serial)
+  assert [line.page for line in parallel] == sorted(line.page for line in serial)
+  assert pdf_locator_service._page_ranges(7, 4) == [(0, 2), (2, 4), (4, 6), (6, 7)]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.config import get_config_reload_interval
+from app.services import project_service
+
+
+def _write_json(path: Path, payload: object) -> None:
+  path.parent.mkdir(parents=True, exist_ok=True)
+  previous_mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+  path.write_text(json.dumps(payload), encoding="utf-8")
+  stat_result = path.stat()
+  # Coarse filesystem timestamps could hide a rewrite within the same tick.
+  if stat_result.st_mtime_ns <= previous_mtime_ns:
+    os.utime(path, ns=(stat_result.st_atime_ns, previous_mtime_ns + 1_000_000))
+
+
+def _source_items(check_type: str) -> list[dict[str, object]]:
+  return [{"item_id": f"{check_type}-1", "check_type": check_type, "consistency_status": "consistent"}]
+
+
+@pytest.fixture
+def temp_registry(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+  _write_json(tmp_path / "sources" / "alpha.json", _source_items("alpha_check"))
+  _write_json(tmp_path / "sources" / "beta.json", _source_items("beta_check"))
+  registry_path = tmp_path / "registry.json"
+  _write_json(
+    registry_path,
+    {
+      "default_project_id": "alpha",
+      "projects": [
+        {
+          "project_id": project_id,
+          "name": project_id.title(),
+          "report_sources": [
+            {"source_id": "main", "label": "Main", "report_json_path": f"sources/{project_id}.json", "order": 1}
+          ],
+        }
+        for project_id in ("alpha", "beta")
+      ],
+    },
+  )
+  monkeypatch.setattr(project_service, "PROJECT_ROOT", tmp_path)
+  monkeypatch.setattr(project_service, "PROJECT_REGISTRY_PATH", registry_path)
+  monkeypatch.setattr(project_service, "_PROJECT_CONFIGS", {})
+  return tmp_path
+
+
+def test_reload_rebuilds_only_projects_whose_sources_changed(temp_registry: Path) -> None:
+  config = project_service.get_workspace_config()
+  assert [project.project_id for project in config.projects] == ["alpha", "beta"]
+  beta_before = project_service.get_workspace_project("beta")
+
+  _write_json(temp_registry / "sources" / "alpha.json", _source_items("alpha_check") + _source_items("gamma_check"))
+  result = project_service.reload_workspace_config()
+
+  assert result.rebuilt_projects == ["alpha"]
+  assert result.unchanged_projects == ["beta"]
+  assert not result.registry_reloaded
+  assert project_service.get_workspace_project("beta") is beta_before
+  alpha_standards = [standard.standard_id for standard in project_service.get_workspace_project("alpha").standards_catalog]
+  assert alpha_standards == ["alpha_check", "gamma_check"]
+
+
+def test_reload_drops_projects_removed_from_registry(temp_registry: Path) -> None:
+  project_service.get_workspace_config()
+  registry = json.loads((temp_registry / "registry.json").read_text(encoding="utf-8"))
+  registry["projects"] = registry["projects"][:1]
+  _write_json(temp_registry / "registry.json", registry)
+
+  result = project_service.reload_workspace_config()
+
+  assert result.registry_reloaded
+  assert result.removed_projects == ["beta"]
+  assert result.metrics.cached_projects == ["alpha"]
+  with pytest.raises(project_service.ApiError):
+    project_service.get_workspace_project("beta")
+
+
+def test_canonical_document_key_matches_lookup_key_variants() -> None:
+  for value in ("ECC HK_NTTB2_20231115.pdf", "ECC HK_NTTB2_20231115", "I-HY_2022_14-GCT-00.PDF", "Scope (PS).docx"):
+    canonical = project_service._canonical_document_key(value)
+    assert canonical in project_service._document_lookup_keys(value)
+    assert project_service._canonical_document_key(value.upper().replace("_", " ")) == canonical
+
+
+def test_project_document_lookup_uses_id_and_alias_maps() -> None:
+  by_id = project_service.get_project_document("hy202214", "I-HY_2022_14-GCT-00")
+  assert by_id is not None
+
+  for alias in (by_id.file_name, by_id.file_name.lower(), by_id.display_name.replace("_", " "), f" {by_id.display_name} "):
+    assert project_service.get_project_document("hy202214", alias) == by_id
+  assert project_service.get_project_document("hy202214", "missing-document") is None
+
+
+def test_projects_are_built_lazily_on_first_access(temp_registry: Path) -> None:
+  summary = project_service.get_workspace_summary()
+  assert [project.project_id for project in summary.projects] == ["alpha", "beta"]
+  assert summary.projects[1].default_template_id == "beta-all-v1"
+  assert project_service.get_default_project_id() == "alpha"
+  assert project_service.get_config_cache_metrics().cached_projects == []
+
+  project_service.get_workspace_project("beta")
+  assert project_service.get_config_cache_metrics().cached_projects == ["beta"]
+  assert [project.loaded for project in project_service.get_workspace_summary().projects] == [False, True]
+
+
+def test_summary_does_not_read_project_templates(temp_registry: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+  registry = json.loads((temp_registry / "registry.json").read_text(encoding="utf-8"))
+  registry["projects"][0]["template_json_path"] = "templates/alpha.json"
+  registry["projects"].append({**registry["projects"][0], "project_id": "gamma", "default_template_id": "gamma-v2"})
+  _write_json(temp_registry / "registry.json", registry)
+  monkeypatch.setattr(project_service, "_load_template_payload", lambda _path: pytest.fail("template loaded"))
+
+  summary = project_service.get_workspace_summary()
+  assert [project.default_template_id for project in summary.projects] == [None, "beta-all-v1", "gamma-v2"]
+
+
+def test_source_pack_profile_is_computed_once_per_file_version(temp_registry: Path) -> None:
+  source_path = temp_registry / "sources" / "alpha.json"
+  _write_json(
+    source_path,
+    [
+      {"item_id": "a-1", "check_type": " alpha_check ", "document_references": ["DOC-1", "DOC-2"]},
+      {"item_id": "a-2", "check_type": "alpha_check", "compliance_status": "compliant", "document_references": ["DOC-1"]},
+      {"item_id": "a-3", "check_type": "beta_check", "document_references": "not-a-list"},
+      "not-an-item",
+    ],
+  )
+
+  pack = project_service._load_report_source_pack("sources/alpha.json")
+  profile = pack.profile
+  assert profile.item_count == 3
+  assert profile.check_types == ("alpha_check", "beta_check")
+  assert profile.check_type_counts == {"alpha_check": 2, "beta_check": 1}
+  assert profile.check_type_domains["alpha_check"] == frozenset({"consistency", "compliance"})
+  assert profile.document_references == ("DOC-1", "DOC-2")
+  assert project_service._load_report_source_pack("sources/alpha.json") is pack
+
+  alpha = project_service.get_workspace_project("alpha")
+  assert alpha.standards_catalog[0].check_type_domains == {"alpha_check": ["compliance", "consistency"]}
+
+
+def test_synthetic_project_picks_up_new_pdfs_after_the_reload_interval(
+  temp_registry: Path,
+  monkeypatch: pytest.MonkeyPatch,
+) -> None:
+  monkeypatch.setenv("CONFIG_RELOAD_INTERVAL_SECONDS", "0")
+  get_config_reload_interval.cache_clear()
+  items = [{"item_id": "doc-1", "check_type": "doc_check", "document_references": ["A", "B"]}]
+  _write_json(temp_registry / "sources" / "alpha.json", items)
+  registry = json.loads((temp_registry / "registry.json").read_text(encoding="utf-8"))
+  registry["projects"][0]["document_search_root"] = "docs"
+  _write_json(temp_registry / "registry.json", registry)
+  (temp_registry / "docs").mkdir()
+  (temp_registry / "docs" / "A.pdf").write_bytes(b"%PDF-1.4")
+
+  try:
+    assert project_service.get_project_document("alpha", "A") is not None
+    assert project_service.get_project_document("alpha", "B") is None
+
+    (temp_registry / "docs" / "B.pdf").write_bytes(b"%PDF-1.4")
+    document = project_service.get_project_document("alpha", "B")
+    assert document is not None and document.file_name == "B.pdf"
+    assert [item.document_id for item in project_service.get_workspace_project("alpha").documents] == ["A", "B"]
+  finally:
+    monkeypatch.delenv("CONFIG_RELOAD_INTERVAL_SECONDS")
+    get_config_reload_interval.cache_clear()
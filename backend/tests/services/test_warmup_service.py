@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+from app.core.config import WarmupConfig
+from app.services import warmup_service
+
+
+def test_warmup_builds_project_seed_items_and_indexes(monkeypatch) -> None:
+  warmed_paths: list[str] = []
+  monkeypatch.setattr(warmup_service, "warm_index", lambda pdf_path: warmed_paths.append(pdf_path.name) or 0)
+  config = replace(WarmupConfig(), enabled=True, workers=2, projects=("hy202214",), max_documents=3)
+  state = warmup_service.WarmupState()
+
+  state.start()
+  assert state.snapshot().status == "running"
+  warmup_service.run_warmup(config, state)
+  status = state.snapshot()
+
+  assert status.status == "ready" and status.ready
+  names = [task.name for task in status.tasks]
+  assert names[:2] == ["registry", "project:hy202214"]
+  assert "seed:hy202214" in names
+  assert sum(name.startswith("index:hy202214/") for name in names) == 3
+  assert len(warmed_paths) == 3
+  assert status.completed == status.total and status.failed == 0
+
+
+def test_warmup_reports_failed_tasks_as_degraded() -> None:
+  config = replace(WarmupConfig(), enabled=True, projects=("missing-project",), locator_indexes=False)
+  state = warmup_service.WarmupState()
+
+  state.start()
+  warmup_service.run_warmup(config, state)
+  status = state.snapshot()
+
+  assert status.status == "degraded" and status.ready
+  assert [(task.name, task.status) for task in status.tasks if task.status == "failed"] == [
+    ("project:missing-project", "failed")
+  ]
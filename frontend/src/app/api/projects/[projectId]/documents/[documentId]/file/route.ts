@@ -1,6 +1,7 @@
 import { NextResponse } from "next/server";
 
 const FALLBACK_API_BASE = "http://localhost:8000";
+const FORWARDED_REQUEST_HEADERS = ["range", "if-range", "if-none-match", "if-modified-since"];
 
 function getBackendApiBaseUrl(): string {
   const configured = process.env.NEXT_PUBLIC_API_BASE_URL;
@@ -16,14 +17,21 @@ export async function GET(
 ) {
   const { projectId, documentId } = await context.params;
   const backendUrl = `${getBackendApiBaseUrl()}/api/v1/projects/${encodeURIComponent(projectId)}/documents/${encodeURIComponent(documentId)}/file`;
-  const range = request.headers.get("range");
+  const upstreamHeaders = new Headers();
+  FORWARDED_REQUEST_HEADERS.forEach((name) => {
+    const value = request.headers.get(name);
+    if (value) {
+      upstreamHeaders.set(name, value);
+    }
+  });
 
+  // The browser cache owns revalidation through the forwarded validators; the proxy stays uncached.
   const upstreamResponse = await fetch(backendUrl, {
     cache: "no-store",
-    headers: range ? { Range: range } : undefined,
+    headers: upstreamHeaders,
   });
 
-  if (!upstreamResponse.ok && upstreamResponse.status !== 206) {
+  if (!upstreamResponse.ok && upstreamResponse.status !== 304) {
     const errorPayload = await upstreamResponse.arrayBuffer();
     return new Response(errorPayload, {
       status: upstreamResponse.status,
@@ -53,6 +61,10 @@ export async function GET(
   });
   responseHeaders.set("x-document-proxy", "nextjs");
 
+  if (upstreamResponse.status === 304) {
+    return new Response(null, { status: 304, headers: responseHeaders });
+  }
+
   return new Response(upstreamResponse.body, {
     status: upstreamResponse.status,
     headers: responseHeaders,